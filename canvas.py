@@ -1128,22 +1128,26 @@ class CanvasPreview(QWidget):
         if not self.selected_indices:
             return None
 
-        min_x = float('inf')
-        min_y = float('inf')
-        max_x = float('-inf')
-        max_y = float('-inf')
-
-        for idx in self.selected_indices:
-            if 0 <= idx < len(self.elements):
-                bounds = self.get_element_bounds(self.elements[idx])
-                min_x = min(min_x, bounds.left())
-                min_y = min(min_y, bounds.top())
-                max_x = max(max_x, bounds.right())
-                max_y = max(max_y, bounds.bottom())
-
-        if min_x == float('inf'):
+        elements = self.elements
+        count = len(elements)
+        rects = [self.get_element_bounds(elements[idx])
+                 for idx in self.selected_indices if 0 <= idx < count]
+        if not rects:
             return None
 
+        # Seed from the first rect rather than +/-inf sentinels
+        first = rects[0]
+        min_x = first.left()
+        min_y = first.top()
+        max_x = first.right()
+        max_y = first.bottom()
+
+        for bounds in rects[1:]:
+            min_x = min(min_x, bounds.left())
+            min_y = min(min_y, bounds.top())
+            max_x = max(max_x, bounds.right())
+            max_y = max(max_y, bounds.bottom())
+
         return QRectF(min_x, min_y, max_x - min_x, max_y - min_y)
 
     def draw_multi_selection_box(self, painter):
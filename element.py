@@ -36,6 +36,9 @@ class ThemeElement:
         self.image_path = kwargs.get("image_path", "")
         self.scale_proportionally = kwargs.get("scale_proportionally", True)
         self.aspect_ratio = kwargs.get("aspect_ratio", 1.0)
+        # Pixel size of the file at image_path (0 = not read yet)
+        self.image_native_width = kwargs.get("image_native_width", 0)
+        self.image_native_height = kwargs.get("image_native_height", 0)
         self.name = kwargs.get("name", f"{element_type}_{id(self)}")
 
         # Line chart options
@@ -132,6 +135,8 @@ class ThemeElement:
             "image_path": self.image_path,
             "scale_proportionally": self.scale_proportionally,
             "aspect_ratio": self.aspect_ratio,
+            "image_native_width": self.image_native_width,
+            "image_native_height": self.image_native_height,
             "show_background": self.show_background,
             "show_label": self.show_label,
             "show_gradient": self.show_gradient,
@@ -5,6 +5,12 @@ A smooth line chart that shows current value on the right
 and history of values scrolling left.
 """
 
+import os
+import sys
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+
 from PySide6.QtCore import Qt, QPointF
 from PySide6.QtGui import QColor, QPen, QBrush, QPainterPath, QLinearGradient
 
@@ -64,7 +70,8 @@ def get_history(element):
     """Get or create history for this element."""
     key = getattr(element, 'name', id(element))
     if key not in _value_history:
-        _value_history[key] = []
+        # Bounded: appending to a full deque drops the oldest value
+        _value_history[key] = deque(maxlen=MAX_HISTORY)
     return _value_history[key]
 
 
@@ -79,8 +86,6 @@ def add_value(element, value):
     if current_time - last_time >= UPDATE_INTERVAL:
         history = get_history(element)
         history.append(float(value))
-        if len(history) > MAX_HISTORY:
-            history.pop(0)
         _last_update_time[key] = current_time
         return True
     return False
@@ -192,7 +197,7 @@ def draw_preview(painter, element, x, y, scale):
         return
 
     points = []
-    history_slice = history[-num_points:]
+    history_slice = islice(history, len(history) - num_points, None)
 
     for i, value in enumerate(history_slice):
         px = x + (i / (num_points - 1)) * width
@@ -288,6 +293,44 @@ def hex_to_rgba(hex_color, opacity=100):
     return (r, g, b, a)
 
 
+# Platform-specific fonts to try for the PIL label, in order
+if sys.platform == "win32":
+    _font_dir = os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts')
+    _LABEL_FONT_PATHS = (
+        os.path.join(_font_dir, 'arial.ttf'),
+        os.path.join(_font_dir, 'segoeui.ttf'),
+        os.path.join(_font_dir, 'tahoma.ttf'),
+    )
+elif sys.platform == "darwin":
+    _LABEL_FONT_PATHS = (
+        '/System/Library/Fonts/Helvetica.ttc',
+        '/System/Library/Fonts/SFNSText.ttf',
+        '/Library/Fonts/Arial.ttf',
+    )
+else:  # Linux
+    _LABEL_FONT_PATHS = (
+        '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+        '/usr/share/fonts/TTF/DejaVuSans.ttf',
+        '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',
+    )
+
+
+@lru_cache(maxsize=16)
+def _load_label_font(font_size):
+    """Load the first available label font at the given size (cached per size)."""
+    try:
+        from PIL import ImageFont
+    except ImportError:
+        return None
+    for font_path in _LABEL_FONT_PATHS:
+        if os.path.exists(font_path):
+            try:
+                return ImageFont.truetype(font_path, font_size)
+            except Exception:
+                continue
+    return None
+
+
 def render_image(draw, img, element):
     """Render the chart using PIL for the actual display."""
     from PIL import Image as PILImage, ImageDraw
@@ -337,7 +380,7 @@ def render_image(draw, img, element):
     if num_points < 2:
         return
 
-    history_slice = history[-num_points:]
+    history_slice = islice(history, len(history) - num_points, None)
     points = []
 
     for i, value in enumerate(history_slice):
@@ -415,41 +458,7 @@ def render_image(draw, img, element):
 
     # Draw label
     if show_label:
-        try:
-            from PIL import ImageFont
-            import os
-            import sys
-            font = None
-            # Try platform-specific font paths
-            font_paths = []
-            if sys.platform == "win32":
-                font_dir = os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts')
-                font_paths = [
-                    os.path.join(font_dir, 'arial.ttf'),
-                    os.path.join(font_dir, 'segoeui.ttf'),
-                    os.path.join(font_dir, 'tahoma.ttf'),
-                ]
-            elif sys.platform == "darwin":
-                font_paths = [
-                    '/System/Library/Fonts/Helvetica.ttc',
-                    '/System/Library/Fonts/SFNSText.ttf',
-                    '/Library/Fonts/Arial.ttf',
-                ]
-            else:  # Linux
-                font_paths = [
-                    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
-                    '/usr/share/fonts/TTF/DejaVuSans.ttf',
-                    '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',
-                ]
-            for font_path in font_paths:
-                if os.path.exists(font_path):
-                    try:
-                        font = ImageFont.truetype(font_path, element.font_size)
-                        break
-                    except:
-                        continue
-        except:
-            font = None
+        font = _load_label_font(element.font_size)
 
         label_text = f"{element.text}: {get_value_with_unit(element.value, element.source, getattr(element, 'temp_hide_unit', False))}"
 
@@ -8,6 +8,8 @@ Reference: https://www.hwinfo.com/forum/threads/shared-memory-layout.5149/
 """
 
 import ctypes
+import threading
+from functools import lru_cache
 from ctypes import Structure, c_uint, c_double, c_char, c_uint32, c_uint64, wintypes
 
 # Windows API for shared memory access
@@ -91,6 +93,85 @@ SENSOR_TYPE_USAGE = 7
 SENSOR_TYPE_OTHER = 8
 
 
+# Search patterns (in priority order) and sensor type for each metric
+# reported to ThermalEngine, keyed as in sensors.py
+THERMAL_METRICS = {
+    'cpu_temp': ([
+        'CPU Package',
+        'CPU (Tctl/Tdie)',
+        'CPU Tctl/Tdie',
+        'Tctl/Tdie',
+        'CPU Die',
+        'CPU',
+        'Core 0',
+    ], SENSOR_TYPE_TEMP),
+    'cpu_clock': ([
+        'Core 0 Clock',
+        'CPU Core 0',
+        'Core Clock',
+        'CPU Clock',
+    ], SENSOR_TYPE_CLOCK),
+    'cpu_power': ([
+        'CPU Package Power',
+        'CPU Power',
+        'Package Power',
+        'CPU PPT',
+    ], SENSOR_TYPE_POWER),
+    'gpu_temp': ([
+        'GPU Temperature',
+        'GPU Hot Spot',
+        'GPU Core',
+    ], SENSOR_TYPE_TEMP),
+    'gpu_percent': ([
+        'GPU Core Load',
+        'GPU Usage',
+        'GPU Load',
+        'GPU Utilization',
+    ], SENSOR_TYPE_USAGE),
+    'gpu_clock': ([
+        'GPU Clock',
+        'GPU Core Clock',
+    ], SENSOR_TYPE_CLOCK),
+    'gpu_memory_clock': ([
+        'GPU Memory Clock',
+        'Memory Clock',
+    ], SENSOR_TYPE_CLOCK),
+    'gpu_memory_percent': ([
+        'GPU Memory Usage',
+        'GPU Memory Load',
+        'GPU Memory Allocated',
+    ], SENSOR_TYPE_USAGE),
+    'gpu_power': ([
+        'GPU Power',
+        'GPU Total Power',
+        'GPU Board Power',
+        'GPU Chip Power',
+    ], SENSOR_TYPE_POWER),
+}
+
+# Metrics reported as whole numbers
+_INTEGER_METRICS = ('cpu_clock', 'gpu_clock', 'gpu_memory_clock')
+
+
+@lru_cache(maxsize=1024)
+def _decode(raw):
+    """Decode a fixed-size HWiNFO string field.
+
+    Sensor names, labels and units are the same bytes on every poll, so the
+    decoded strings are memoized instead of rebuilt each time.
+    """
+    return raw.decode('utf-8', errors='ignore').strip()
+
+
+@lru_cache(maxsize=1024)
+def _match_key(sensor, label):
+    """Lowercased sensor name and label for pattern matching.
+
+    The two are joined with a NUL so a pattern can only match within one of them.
+    """
+    return f"{sensor}\0{label}".lower()
+
+
 class HWiNFOReader:
     """Reads sensor data from HWiNFO shared memory."""
 
@@ -99,11 +180,23 @@ class HWiNFOReader:
         self.view = None
         self.connected = False
         self.last_error = None
-        self._sensor_cache = {}  # Cache sensor name -> index mapping
-        self._view_size = 0
+        self._metric_refs = None  # Metric key -> (reading index, sensor index, reading ID)
+        self._metric_layout = None  # Reading section layout the refs were resolved against
+        self._last_poll_time = None  # Header pollTime of the last thermal read
+        self._last_values = None  # Values returned by that read
+        # Serializes connect(); is_available() only checks `connected` and never takes it
+        self._connect_lock = threading.Lock()
 
     def connect(self):
         """Connect to HWiNFO shared memory."""
+        with self._connect_lock:
+            # Another thread may have connected while we waited
+            if self.connected:
+                return True
+            return self._connect()
+
+    def _connect(self):
+        """Open and map the shared memory. Caller holds _connect_lock."""
         try:
             # Open the existing shared memory mapping
             self.handle = kernel32.OpenFileMappingW(FILE_MAP_READ, False, HWINFO_SHARED_MEM_NAME)
@@ -123,7 +216,6 @@ class HWiNFOReader:
 
             self.connected = True
             self.last_error = None
-            self._build_sensor_cache()
             return True
         except Exception as e:
             self.last_error = str(e)
@@ -145,7 +237,8 @@ class HWiNFOReader:
                 pass
             self.handle = None
         self.connected = False
-        self._sensor_cache = {}
+        self._metric_refs = None
+        self._last_values = None
 
     def is_available(self):
         """Check if HWiNFO shared memory is available."""
@@ -165,61 +258,31 @@ class HWiNFOReader:
         header_data = self._read_from_view(0, header_size)
         return HWiNFO_SENSORS_SHARED_MEM_HEADER.from_buffer_copy(header_data)
 
+    def _read_elements(self, struct_type, offset, element_size, count):
+        """Read `count` consecutive elements with one copy out of the view.
+
+        HWiNFO may use elements larger than our structure (newer versions
+        append fields), so each element is parsed at its own stride.
+        """
+        if count == 0 or element_size < ctypes.sizeof(struct_type):
+            return []
+        data = self._read_from_view(offset, element_size * count)
+        from_buffer_copy = struct_type.from_buffer_copy
+        return [from_buffer_copy(data, pos) for pos in range(0, len(data), element_size)]
+
     def _read_sensors(self, header):
         """Read all sensor elements."""
-        sensors = []
-        offset = header.dwOffsetOfSensorSection
-        for i in range(header.dwNumSensorElements):
-            data = self._read_from_view(offset, header.dwSizeOfSensorElement)
-            if len(data) >= ctypes.sizeof(HWiNFO_SENSORS_SENSOR_ELEMENT):
-                sensor = HWiNFO_SENSORS_SENSOR_ELEMENT.from_buffer_copy(data)
-                sensors.append(sensor)
-            offset += header.dwSizeOfSensorElement
-        return sensors
+        return self._read_elements(
+            HWiNFO_SENSORS_SENSOR_ELEMENT, header.dwOffsetOfSensorSection,
+            header.dwSizeOfSensorElement, header.dwNumSensorElements,
+        )
 
     def _read_readings(self, header):
         """Read all sensor readings."""
-        readings = []
-        offset = header.dwOffsetOfReadingSection
-        for i in range(header.dwNumReadingElements):
-            data = self._read_from_view(offset, header.dwSizeOfReadingElement)
-            if len(data) >= ctypes.sizeof(HWiNFO_SENSORS_READING_ELEMENT):
-                reading = HWiNFO_SENSORS_READING_ELEMENT.from_buffer_copy(data)
-                readings.append(reading)
-            offset += header.dwSizeOfReadingElement
-        return readings
-
-    def _build_sensor_cache(self):
-        """Build a cache of sensor names to reading indices for fast lookup."""
-        self._sensor_cache = {}
-        try:
-            header = self._read_header()
-            if not header:
-                return
-
-            sensors = self._read_sensors(header)
-            readings = self._read_readings(header)
-
-            for i, reading in enumerate(readings):
-                sensor_idx = reading.dwSensorIndex
-                if sensor_idx < len(sensors):
-                    sensor_name = sensors[sensor_idx].szSensorNameOrig.decode('utf-8', errors='ignore').strip()
-                else:
-                    sensor_name = "Unknown"
-
-                label = reading.szLabelUser.decode('utf-8', errors='ignore').strip()
-                if not label:
-                    label = reading.szLabelOrig.decode('utf-8', errors='ignore').strip()
-
-                # Create lookup key: "SensorName/ReadingLabel"
-                key = f"{sensor_name}/{label}"
-                self._sensor_cache[key] = i
-
-                # Also store by just the label for common lookups
-                self._sensor_cache[label] = i
-
-        except Exception as e:
-            self.last_error = str(e)
+        return self._read_elements(
+            HWiNFO_SENSORS_READING_ELEMENT, header.dwOffsetOfReadingSection,
+            header.dwSizeOfReadingElement, header.dwNumReadingElements,
+        )
 
     def get_all_readings(self):
         """Get all sensor readings as a list of dicts."""
@@ -234,19 +297,17 @@ class HWiNFOReader:
             sensors = self._read_sensors(header)
             readings = self._read_readings(header)
 
+            # Decode each sensor's name once, not once per reading
+            sensor_names = [_decode(sensor.szSensorNameOrig) for sensor in sensors]
+            num_sensors = len(sensor_names)
+
             results = []
-            for reading in readings:
+            for i, reading in enumerate(readings):
                 sensor_idx = reading.dwSensorIndex
-                if sensor_idx < len(sensors):
-                    sensor_name = sensors[sensor_idx].szSensorNameOrig.decode('utf-8', errors='ignore').strip()
-                else:
-                    sensor_name = "Unknown"
-
-                label = reading.szLabelUser.decode('utf-8', errors='ignore').strip()
-                if not label:
-                    label = reading.szLabelOrig.decode('utf-8', errors='ignore').strip()
+                sensor_name = sensor_names[sensor_idx] if sensor_idx < num_sensors else "Unknown"
 
-                unit = reading.szUnit.decode('utf-8', errors='ignore').strip()
+                label = _decode(reading.szLabelUser) or _decode(reading.szLabelOrig)
+                unit = _decode(reading.szUnit)
 
                 results.append({
                     'sensor': sensor_name,
@@ -257,6 +318,9 @@ class HWiNFOReader:
                     'max': reading.ValueMax,
                     'avg': reading.ValueAvg,
                     'type': reading.tReading,
+                    'index': i,
+                    'sensor_index': sensor_idx,
+                    'reading_id': reading.dwReadingID,
                 })
 
             return results
@@ -264,160 +328,196 @@ class HWiNFOReader:
             self.last_error = str(e)
             return []
 
-    def find_reading(self, patterns, sensor_type=None):
+    def find_reading(self, patterns, sensor_type=None, readings=None):
         """
         Find a reading matching any of the given patterns.
 
         Args:
             patterns: List of strings to search for in sensor/label names
             sensor_type: Optional sensor type filter (SENSOR_TYPE_*)
+            readings: Optional list from get_all_readings() to search instead
+                of reading shared memory again
 
         Returns:
             Reading dict or None
         """
-        readings = self.get_all_readings()
+        if readings is None:
+            readings = self.get_all_readings()
+
+        # Filter by type and build each reading's search key once, not once per pattern
+        candidates = [
+            (_match_key(reading['sensor'], reading['label']), reading)
+            for reading in readings
+            if sensor_type is None or reading['type'] == sensor_type
+        ]
 
         for pattern in patterns:
             pattern_lower = pattern.lower()
-            for reading in readings:
-                if sensor_type is not None and reading['type'] != sensor_type:
-                    continue
-
-                # Check if pattern matches sensor name or label
-                sensor_lower = reading['sensor'].lower()
-                label_lower = reading['label'].lower()
-
-                if pattern_lower in sensor_lower or pattern_lower in label_lower:
+            for names_lower, reading in candidates:
+                if pattern_lower in names_lower:
                     return reading
 
         return None
 
-    def get_cpu_temp(self):
+    def get_cpu_temp(self, readings=None):
         """Get CPU temperature."""
-        # Try common CPU temperature labels
-        patterns = [
-            'CPU Package',
-            'CPU (Tctl/Tdie)',
-            'CPU Tctl/Tdie',
-            'Tctl/Tdie',
-            'CPU Die',
-            'CPU',
-            'Core 0',
-        ]
-        reading = self.find_reading(patterns, SENSOR_TYPE_TEMP)
+        reading = self.find_reading(*THERMAL_METRICS['cpu_temp'], readings)
         return reading['value'] if reading else 0.0
 
-    def get_cpu_clock(self):
+    def get_cpu_clock(self, readings=None):
         """Get CPU clock speed."""
-        patterns = [
-            'Core 0 Clock',
-            'CPU Core 0',
-            'Core Clock',
-            'CPU Clock',
-        ]
-        reading = self.find_reading(patterns, SENSOR_TYPE_CLOCK)
+        reading = self.find_reading(*THERMAL_METRICS['cpu_clock'], readings)
         return reading['value'] if reading else 0
 
-    def get_cpu_power(self):
+    def get_cpu_power(self, readings=None):
         """Get CPU power consumption."""
-        patterns = [
-            'CPU Package Power',
-            'CPU Power',
-            'Package Power',
-            'CPU PPT',
-        ]
-        reading = self.find_reading(patterns, SENSOR_TYPE_POWER)
+        reading = self.find_reading(*THERMAL_METRICS['cpu_power'], readings)
         return reading['value'] if reading else 0.0
 
-    def get_gpu_temp(self):
+    def get_gpu_temp(self, readings=None):
         """Get GPU temperature."""
-        patterns = [
-            'GPU Temperature',
-            'GPU Hot Spot',
-            'GPU Core',
-        ]
-        reading = self.find_reading(patterns, SENSOR_TYPE_TEMP)
+        reading = self.find_reading(*THERMAL_METRICS['gpu_temp'], readings)
         return reading['value'] if reading else 0.0
 
-    def get_gpu_clock(self):
+    def get_gpu_clock(self, readings=None):
         """Get GPU core clock."""
-        patterns = [
-            'GPU Clock',
-            'GPU Core Clock',
-        ]
-        reading = self.find_reading(patterns, SENSOR_TYPE_CLOCK)
+        reading = self.find_reading(*THERMAL_METRICS['gpu_clock'], readings)
         return reading['value'] if reading else 0
 
-    def get_gpu_memory_clock(self):
+    def get_gpu_memory_clock(self, readings=None):
         """Get GPU memory clock."""
-        patterns = [
-            'GPU Memory Clock',
-            'Memory Clock',
-        ]
-        reading = self.find_reading(patterns, SENSOR_TYPE_CLOCK)
+        reading = self.find_reading(*THERMAL_METRICS['gpu_memory_clock'], readings)
         return reading['value'] if reading else 0
 
-    def get_gpu_usage(self):
+    def get_gpu_usage(self, readings=None):
         """Get GPU usage percentage."""
-        patterns = [
-            'GPU Core Load',
-            'GPU Usage',
-            'GPU Load',
-            'GPU Utilization',
-        ]
-        reading = self.find_reading(patterns, SENSOR_TYPE_USAGE)
+        reading = self.find_reading(*THERMAL_METRICS['gpu_percent'], readings)
         return reading['value'] if reading else 0.0
 
-    def get_gpu_memory_usage(self):
+    def get_gpu_memory_usage(self, readings=None):
         """Get GPU memory usage percentage."""
-        patterns = [
-            'GPU Memory Usage',
-            'GPU Memory Load',
-            'GPU Memory Allocated',
-        ]
-        reading = self.find_reading(patterns, SENSOR_TYPE_USAGE)
+        reading = self.find_reading(*THERMAL_METRICS['gpu_memory_percent'], readings)
         return reading['value'] if reading else 0.0
 
-    def get_gpu_power(self):
+    def get_gpu_power(self, readings=None):
         """Get GPU power consumption."""
-        patterns = [
-            'GPU Power',
-            'GPU Total Power',
-            'GPU Board Power',
-            'GPU Chip Power',
-        ]
-        reading = self.find_reading(patterns, SENSOR_TYPE_POWER)
+        reading = self.find_reading(*THERMAL_METRICS['gpu_power'], readings)
         return reading['value'] if reading else 0.0
 
+    def _resolve_metrics(self, header):
+        """
+        Match every metric against a full read of the readings and remember
+        which reading each one resolved to.
+
+        Returns:
+            dict of metric key -> current value, or None if nothing could be read
+        """
+        readings = self.get_all_readings()
+        if not readings:
+            return None
+
+        refs = {}
+        values = {}
+        for key, (patterns, sensor_type) in THERMAL_METRICS.items():
+            reading = self.find_reading(patterns, sensor_type, readings)
+            if reading:
+                refs[key] = (reading['index'], reading['sensor_index'], reading['reading_id'])
+                values[key] = reading['value']
+            else:
+                refs[key] = None
+                values[key] = 0.0
+
+        self._metric_refs = refs
+        self._metric_layout = (
+            header.dwOffsetOfReadingSection,
+            header.dwSizeOfReadingElement,
+            header.dwNumReadingElements,
+        )
+        return values
+
+    def _read_metric_values(self, header):
+        """
+        Read each metric's Value straight from its cached reading slot.
+
+        Returns:
+            dict of metric key -> current value, or None if the reading
+            layout changed and the metrics must be resolved again
+        """
+        layout = (
+            header.dwOffsetOfReadingSection,
+            header.dwSizeOfReadingElement,
+            header.dwNumReadingElements,
+        )
+        if self._metric_refs is None or layout != self._metric_layout:
+            return None
+
+        base = self.view + header.dwOffsetOfReadingSection
+        stride = header.dwSizeOfReadingElement
+        from_address = HWiNFO_SENSORS_READING_ELEMENT.from_address
+
+        values = {}
+        for key, ref in self._metric_refs.items():
+            if ref is None:
+                values[key] = 0.0
+                continue
+            index, sensor_index, reading_id = ref
+            reading = from_address(base + index * stride)
+            # HWiNFO can reorder readings without changing the count
+            if reading.dwSensorIndex != sensor_index or reading.dwReadingID != reading_id:
+                return None
+            values[key] = reading.Value
+        return values
+
     def get_thermal_sensors(self):
         """
         Get all thermal-related sensors in the format expected by ThermalEngine.
 
+        The pattern search runs only when the reading layout changes; every
+        other poll reads the resolved readings' values directly, and a poll
+        that lands before HWiNFO's next update reuses the previous values.
+
         Returns:
             dict with keys matching sensors.py format
         """
-        return {
-            'cpu_temp': self.get_cpu_temp(),
-            'cpu_clock': int(self.get_cpu_clock()),
-            'cpu_power': self.get_cpu_power(),
-            'gpu_temp': self.get_gpu_temp(),
-            'gpu_percent': self.get_gpu_usage(),
-            'gpu_clock': int(self.get_gpu_clock()),
-            'gpu_memory_clock': int(self.get_gpu_memory_clock()),
-            'gpu_memory_percent': self.get_gpu_memory_usage(),
-            'gpu_power': self.get_gpu_power(),
-        }
+        if self.is_available():
+            try:
+                header = self._read_header()
+                if header.pollTime == self._last_poll_time and self._last_values is not None:
+                    # HWiNFO hasn't polled since our last read, so nothing changed
+                    return self._last_values.copy()
+
+                values = self._read_metric_values(header)
+                if values is None:
+                    values = self._resolve_metrics(header)
+                if values is not None:
+                    for key in _INTEGER_METRICS:
+                        values[key] = int(values[key])
+                    self._last_poll_time = header.pollTime
+                    self._last_values = values.copy()
+                    return values
+            except Exception as e:
+                self.last_error = str(e)
+                self._metric_refs = None
+
+        self._last_values = None
+        values = dict.fromkeys(THERMAL_METRICS, 0.0)
+        for key in _INTEGER_METRICS:
+            values[key] = 0
+        return values
 
 
 # Global instance for easy access
 _reader = None
+_reader_lock = threading.Lock()
 
 
 def get_hwinfo_reader():
     """Get the global HWiNFO reader instance."""
     global _reader
     if _reader is None:
-        _reader = HWiNFOReader()
+        with _reader_lock:
+            if _reader is None:
+                _reader = HWiNFOReader()
     return _reader
 
 
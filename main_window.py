@@ -8,6 +8,7 @@ import json
 import time
 import io
 import threading
+from collections import deque
 import psutil
 
 # Windows-specific imports for power event handling
@@ -134,8 +135,10 @@ _psutil_data = {
 }
 _psutil_data_lock = threading.Lock()
 _psutil_thread = None
-_psutil_thread_running = False
-_cpu_percent_history = []
+# Set while the polling thread should not run; also wakes it from its inter-poll wait
+_psutil_stop = threading.Event()
+_psutil_stop.set()
+_cpu_percent_history = deque(maxlen=5)
 _last_net_io = None
 _last_net_time = 0
 _psutil_last_success = 0
@@ -144,7 +147,7 @@ _psutil_consecutive_errors = 0
 
 def _psutil_polling_thread():
     """Background thread that continuously polls psutil data."""
-    global _psutil_data, _psutil_thread_running, _cpu_percent_history
+    global _psutil_data, _cpu_percent_history
     global _last_net_io, _last_net_time, _psutil_last_success, _psutil_consecutive_errors
 
     # Initialize CPU percent
@@ -153,13 +156,11 @@ def _psutil_polling_thread():
     except:
         pass
 
-    while _psutil_thread_running:
+    while not _psutil_stop.is_set():
         try:
             # CPU (smoothed)
             raw_cpu = psutil.cpu_percent(interval=None)
             _cpu_percent_history.append(raw_cpu)
-            if len(_cpu_percent_history) > 5:
-                _cpu_percent_history.pop(0)
             smoothed_cpu = sum(_cpu_percent_history) / len(_cpu_percent_history)
 
             # RAM
@@ -209,14 +210,14 @@ def _psutil_polling_thread():
                     pass
 
         # Poll every 500ms - balances responsiveness with CPU usage
-        time.sleep(0.5)
+        _psutil_stop.wait(0.5)
 
 
 def start_psutil_thread():
     """Start the background psutil polling thread."""
-    global _psutil_thread, _psutil_thread_running
+    global _psutil_thread
     if _psutil_thread is None or not _psutil_thread.is_alive():
-        _psutil_thread_running = True
+        _psutil_stop.clear()
         _psutil_thread = threading.Thread(target=_psutil_polling_thread, daemon=True)
         _psutil_thread.start()
         print("[Psutil] Background polling thread started")
@@ -224,8 +225,8 @@ def start_psutil_thread():
 
 def stop_psutil_thread():
     """Stop the background psutil polling thread."""
-    global _psutil_thread_running, _psutil_thread
-    _psutil_thread_running = False
+    global _psutil_thread
+    _psutil_stop.set()
     if _psutil_thread and _psutil_thread.is_alive():
         _psutil_thread.join(timeout=1.0)
     _psutil_thread = None
@@ -235,7 +236,7 @@ def get_psutil_data():
     """Get psutil data from background thread cache (non-blocking)."""
     # Check if thread is alive, restart if needed
     global _psutil_thread
-    if _psutil_thread_running and (_psutil_thread is None or not _psutil_thread.is_alive()):
+    if not _psutil_stop.is_set() and (_psutil_thread is None or not _psutil_thread.is_alive()):
         print("[Psutil] Thread died, restarting...")
         _psutil_thread = threading.Thread(target=_psutil_polling_thread, daemon=True)
         _psutil_thread.start()
@@ -309,10 +310,11 @@ class ThemeEditorWindow(QMainWindow):
         self.target_fps = settings.get_setting("target_fps", 30)
 
         # Performance monitoring
-        self.frame_times = []
+        self.frame_times = deque(maxlen=60)  # Larger sample for stability
         self.last_frame_time = 0
         self.perf_update_timer = None
         self.process = psutil.Process()
+        self._hwinfo_snapshot = {}  # Reused per frame by get_sensor_data
 
         # Undo/Redo stacks
         self.undo_stack = []
@@ -330,7 +332,7 @@ class ThemeEditorWindow(QMainWindow):
         self._frame_buffer = None  # Pre-rendered frame buffer
         self._frame_buffer_lock = threading.Lock()
         self._render_thread = None
-        self._render_thread_running = False
+        self._render_stop = threading.Event()  # Also wakes the render thread from its pacing wait
 
         # Sleep/wake handling - auto-reconnect
         self._reconnect_timer = None
@@ -393,8 +395,8 @@ class ThemeEditorWindow(QMainWindow):
         print("[Power] System waking up")
         self._last_wake_time = time.time()
 
-        # Reset video background timing to prevent frame jumps
-        video_background.reset_timing()
+        # Video playback needs no reset: its frame timer simply paused during
+        # sleep and continues from the same frame
 
         # Reset GIF playback timing
         try:
@@ -404,7 +406,7 @@ class ThemeEditorWindow(QMainWindow):
             pass
 
         # Reset frame timing for FPS calculation
-        self.frame_times = []
+        self.frame_times.clear()
         self.last_frame_time = 0
 
         # If we were connected before sleep, try to reconnect
@@ -542,6 +544,18 @@ class ThemeEditorWindow(QMainWindow):
         self.video_fit_combo.setEnabled(False)
         name_layout.addWidget(self.video_fit_combo)
 
+        self.video_storage_combo = QComboBox()
+        self.video_storage_combo.addItem("Compressed", "jpeg")
+        self.video_storage_combo.addItem("Raw", "rgb")
+        self.video_storage_combo.setFixedWidth(100)
+        self.video_storage_combo.setToolTip(
+            "Compressed frames use about a tenth of the memory; "
+            "raw frames skip decoding during playback"
+        )
+        self.video_storage_combo.currentIndexChanged.connect(self.on_video_storage_changed)
+        self.video_storage_combo.setEnabled(False)
+        name_layout.addWidget(self.video_storage_combo)
+
         self.clear_video_btn = QPushButton("Clear")
         self.clear_video_btn.setFixedWidth(50)
         self.clear_video_btn.clicked.connect(self.clear_video_background)
@@ -729,10 +743,18 @@ class ThemeEditorWindow(QMainWindow):
         self.canvas.drag_started.connect(self.save_undo_state)
 
         self.properties_panel.property_will_change.connect(self.save_undo_state)
-        self.properties_panel.property_changed.connect(self.refresh_canvas)
-        self.properties_panel.property_changed.connect(self.update_element_list_name)
+        # Coalesces element list rebuilds to one per event-loop turn
+        self._list_refresh_timer = QTimer(self)
+        self._list_refresh_timer.setSingleShot(True)
+        self._list_refresh_timer.setInterval(0)
+        self._list_refresh_timer.timeout.connect(self.element_list.refresh_list)
+        # Queued so a burst of property edits is delivered after the panel's
+        # own slot returns; the receivers coalesce on their timers
+        queued = Qt.ConnectionType.QueuedConnection
+        self.properties_panel.property_changed.connect(self.refresh_canvas, queued)
+        self.properties_panel.property_changed.connect(self.update_element_list_name, queued)
         self.properties_panel.alignment_will_change.connect(self.save_undo_state)
-        self.properties_panel.alignment_changed.connect(self.refresh_canvas)
+        self.properties_panel.alignment_changed.connect(self.refresh_canvas, queued)
 
         self.presets_panel.preset_selected.connect(self.load_preset)
         self.presets_panel.preset_saved.connect(self.on_preset_saved)
@@ -809,8 +831,6 @@ class ThemeEditorWindow(QMainWindow):
             # Only record reasonable frame times (filter out outliers from pauses)
             if frame_time < 1.0:  # Ignore gaps > 1 second
                 self.frame_times.append(frame_time)
-                if len(self.frame_times) > 60:  # Larger sample for stability
-                    self.frame_times.pop(0)
         self.last_frame_time = current_time
 
     def add_default_elements(self):
@@ -1031,7 +1051,8 @@ class ThemeEditorWindow(QMainWindow):
         self.status_bar.showMessage(f"Saved: {self.theme_name}")
 
     def update_element_list_name(self):
-        self.element_list.refresh_list()
+        """Refresh the element list - coalesced to one rebuild per event-loop turn."""
+        self._list_refresh_timer.start()
 
     def on_theme_name_changed(self, name):
         self.theme_name = name
@@ -1065,6 +1086,7 @@ class ThemeEditorWindow(QMainWindow):
             self.video_btn.setText(filename)
             self.video_btn.setToolTip(path)
             self.video_fit_combo.setEnabled(True)
+            self.video_storage_combo.setEnabled(True)
             self.clear_video_btn.setEnabled(True)
 
             # Start loading with progress callback
@@ -1119,6 +1141,19 @@ class ThemeEditorWindow(QMainWindow):
             video_background.set_fit_mode(fit_mode)
         self.canvas.update()
 
+    def on_video_storage_changed(self, index):
+        """Handle video frame storage mode change."""
+        storage_mode = self.video_storage_combo.currentData()
+        if storage_mode and storage_mode != video_background.storage_mode:
+            self.status_bar.showMessage("Reloading video with new storage mode...")
+            # Start timer to show loading progress
+            if not hasattr(self, '_video_load_timer'):
+                self._video_load_timer = QTimer(self)
+                self._video_load_timer.timeout.connect(self._on_video_load_tick)
+            self._video_load_timer.start(100)
+            video_background.set_storage_mode(storage_mode)
+        self.canvas.update()
+
     def clear_video_background(self):
         """Clear the video background."""
         # Stop load timer if running
@@ -1128,6 +1163,7 @@ class ThemeEditorWindow(QMainWindow):
         self.video_btn.setText("None")
         self.video_btn.setToolTip("")
         self.video_fit_combo.setEnabled(False)
+        self.video_storage_combo.setEnabled(False)
         self.clear_video_btn.setEnabled(False)
         self.canvas.update()
         self.status_bar.showMessage("Video background cleared")
@@ -1141,15 +1177,20 @@ class ThemeEditorWindow(QMainWindow):
             self.video_btn.setText(filename)
             self.video_btn.setToolTip(video_background.video_path)
             self.video_fit_combo.setEnabled(True)
+            self.video_storage_combo.setEnabled(True)
             self.clear_video_btn.setEnabled(True)
             # Set fit mode in combo
             idx = self.video_fit_combo.findData(video_background.fit_mode)
             if idx >= 0:
                 self.video_fit_combo.setCurrentIndex(idx)
+            idx = self.video_storage_combo.findData(video_background.storage_mode)
+            if idx >= 0:
+                self.video_storage_combo.setCurrentIndex(idx)
         else:
             self.video_btn.setText("None")
             self.video_btn.setToolTip("")
             self.video_fit_combo.setEnabled(False)
+            self.video_storage_combo.setEnabled(False)
             self.clear_video_btn.setEnabled(False)
 
     def new_theme(self):
@@ -1290,7 +1331,7 @@ class ThemeEditorWindow(QMainWindow):
         # Get HWiNFO sensor data from background thread (non-blocking)
         if sensors.HAS_HWINFO:
             try:
-                hwinfo_data = get_cached_sensors()
+                hwinfo_data = get_cached_sensors(self._hwinfo_snapshot)
                 if hwinfo_data:
                     # CPU sensors
                     if hwinfo_data.get('cpu_temp', 0) > 0:
@@ -1400,7 +1441,7 @@ class ThemeEditorWindow(QMainWindow):
 
             psutil.cpu_percent(interval=None)
 
-            self.frame_times = []
+            self.frame_times.clear()
             self.last_frame_time = 0
 
             self.start_continuous_send()
@@ -1431,7 +1472,7 @@ class ThemeEditorWindow(QMainWindow):
             finally:
                 self.device = None
 
-        self.frame_times = []
+        self.frame_times.clear()
         self.last_frame_time = 0
 
         # Update button text to "Connect"
@@ -1527,20 +1568,22 @@ class ThemeEditorWindow(QMainWindow):
         if self._render_thread and self._render_thread.is_alive():
             return
 
-        self._render_thread_running = True
+        self._render_stop.clear()
         self._render_thread = threading.Thread(target=self._render_thread_loop, daemon=True)
         self._render_thread.start()
 
     def _stop_render_thread(self):
         """Stop background render thread."""
-        self._render_thread_running = False
+        self._render_stop.set()
         if self._render_thread:
-            self._render_thread.join(timeout=1.0)
+            # Only block if it is still running; the stop event cuts its wait short
+            if self._render_thread.is_alive():
+                self._render_thread.join(timeout=1.0)
             self._render_thread = None
 
     def _render_thread_loop(self):
         """Background thread that pre-renders frames."""
-        while self._render_thread_running:
+        while not self._render_stop.is_set():
             try:
                 if self.device and self._overdrive_mode:
                     # Update sensor values
@@ -1558,10 +1601,10 @@ class ThemeEditorWindow(QMainWindow):
                         self._frame_buffer = jpeg_data
 
                 # Sleep to match roughly 2x target FPS for buffer freshness
-                time.sleep(1.0 / (self.target_fps * 2))
+                self._render_stop.wait(1.0 / (self.target_fps * 2))
             except Exception as e:
                 print(f"[Render Thread] Error: {e}")
-                time.sleep(0.1)
+                self._render_stop.wait(0.1)
 
     def start_continuous_send(self):
         interval = 1000 // self.target_fps
@@ -3317,12 +3360,16 @@ class ThemeEditorWindow(QMainWindow):
 
         if dialog.exec() == QDialog.DialogCode.Accepted:
             # Save settings
-            settings.set_setting("launch_at_login", self.launch_at_login_cb.isChecked())
-            settings.set_setting("launch_minimized", self.launch_minimized_cb.isChecked())
-            settings.set_setting("minimize_to_tray", self.minimize_to_tray_cb.isChecked())
-            settings.set_setting("close_to_tray", self.close_to_tray_cb.isChecked())
-
-            # Apply autostart setting
+            settings.set_settings({
+                "launch_at_login": self.launch_at_login_cb.isChecked(),
+                "launch_minimized": self.launch_minimized_cb.isChecked(),
+                "minimize_to_tray": self.minimize_to_tray_cb.isChecked(),
+                "close_to_tray": self.close_to_tray_cb.isChecked(),
+            })
+
+            # Apply autostart setting, re-reading the registry in case the
+            # Run entry was changed outside the app since startup
+            settings.invalidate_autostart_cache()
             settings.apply_autostart_setting()
 
             self.status_bar.showMessage("Settings saved", 2000)
@@ -2,6 +2,15 @@
 PropertiesPanel - Element property editing widget.
 """
 
+import os
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import accumulate
+from operator import add, attrgetter
+from types import SimpleNamespace
+
+from PIL import Image
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QSpinBox, QDoubleSpinBox, QColorDialog, QFileDialog, QComboBox,
@@ -9,10 +18,190 @@ from PySide6.QtWidgets import (
     QStyledItemDelegate, QStyle, QSlider, QDialog, QDialogButtonBox,
     QSizePolicy, QGroupBox
 )
-from PySide6.QtCore import Qt, Signal, QSize, QRect, QPoint
+from PySide6.QtCore import Qt, Signal, QSize, QRect, QPoint, QTimer
 from PySide6.QtGui import QColor, QFont, QPixmap, QFontDatabase, QPainter, QLinearGradient, QPen, QBrush, QIcon
 
 
+@contextmanager
+def _blocked(*widgets):
+    """Block signals on the given widgets for the duration of the block."""
+    previous = [w.blockSignals(True) for w in widgets]
+    try:
+        yield
+    finally:
+        for w, was_blocked in zip(widgets, previous):
+            w.blockSignals(was_blocked)
+
+
+def _set_spin(widget, value):
+    """Set a spin box value only if it differs from the current one."""
+    if widget.value() != value:
+        widget.setValue(value)
+
+
+def _set_spins(*pairs):
+    """Apply (spin box, value) pairs with all of their signals blocked at once."""
+    with _blocked(*(widget for widget, _ in pairs)):
+        for widget, value in pairs:
+            _set_spin(widget, value)
+
+
+def _set_check(widget, checked):
+    """Set a checkable widget's state only if it differs from the current one."""
+    checked = bool(checked)
+    if widget.isChecked() != checked:
+        widget.setChecked(checked)
+
+
+def _set_text(widget, text):
+    """Set a line edit's text only if it differs from the current one."""
+    if widget.text() != text:
+        widget.setText(text)
+
+
+def _set_combo_index(widget, index):
+    """Set a combo box index only if it differs from the current one."""
+    if widget.currentIndex() != index:
+        widget.setCurrentIndex(index)
+
+
+_QSS_CACHE = {}
+
+
+def _set_button_color(button, color):
+    """Show `color` as a button's background, skipping the QSS re-parse if unchanged."""
+    qss = _QSS_CACHE.get(color)
+    if qss is None:
+        qss = _QSS_CACHE[color] = f"background-color: {color};"
+    if button.styleSheet() != qss:
+        # Keep the repaint local to this button while its style is re-polished
+        button.setUpdatesEnabled(False)
+        button.setStyleSheet(qss)
+        button.setUpdatesEnabled(True)
+
+
+def _index_combo_data(widget):
+    """Cache a {item data: index} map on a populated combo box."""
+    widget._data_to_index = {widget.itemData(i): i for i in range(widget.count())}
+
+
+def _set_combo_data(widget, data):
+    """Select the combo box item holding `data`, if present and not already selected."""
+    data_to_index = getattr(widget, '_data_to_index', None)
+    index = data_to_index.get(data, -1) if data_to_index is not None else widget.findData(data)
+    if index >= 0:
+        _set_combo_index(widget, index)
+
+
+def _set_combo_text(widget, text):
+    """Set a combo box's current text only if it differs from the current one."""
+    if widget.currentText() == text:
+        return
+    text_to_index = getattr(widget, '_text_to_index', None)
+    if text_to_index is None:
+        widget.setCurrentText(text)
+    elif text in text_to_index:
+        widget.setCurrentIndex(text_to_index[text])
+
+
+@lru_cache(maxsize=64)
+def _read_image_size_cached(path, mtime):
+    # Only the header is parsed; pixel data is never decoded for .size
+    with Image.open(path) as img:
+        return img.size
+
+
+def _read_image_size(path):
+    """Return an image file's (width, height), memoized per path and mtime.
+
+    Raises OSError (including PIL's UnidentifiedImageError) if unreadable.
+    """
+    return _read_image_size_cached(path, os.path.getmtime(path))
+
+
+def _union_bounds(rects):
+    """Return the (x, y, w, h) box enclosing an iterable of (x, y, w, h) rects.
+
+    The rects are transposed once so each edge is a single min()/max() pass.
+    """
+    xs, ys, ws, hs = zip(*rects)
+    min_x = min(xs)
+    min_y = min(ys)
+    return (min_x, min_y, max(map(add, xs, ws)) - min_x, max(map(add, ys, hs)) - min_y)
+
+
+class _Unit:
+    """An alignment unit: one ungrouped element or a whole group, with its bounds."""
+    __slots__ = ('elements', 'x', 'y', 'w', 'h', 'el_bounds')
+
+    def __init__(self, elements, x, y, w, h, el_bounds):
+        self.elements = elements
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.el_bounds = el_bounds  # (x, y, w, h) per element, in the same order
+
+
+# Default gauge gradient (green to red), shared rather than rebuilt per lookup
+_DEFAULT_GRADIENT = ((0.0, "#00ff96"), (1.0, "#ff4444"))
+
+# Gauge types that edit their text through label_text_edit
+_LABEL_TEXT_TYPES = frozenset(("circle_gauge", "bar_gauge"))
+
+# Types positioned by their center and sized by radius rather than width/height
+_RADIAL_TYPES = frozenset(("circle_gauge", "analog_clock"))
+
+# Sources that offer the "hide unit" option
+_TEMP_SOURCES = frozenset(("cpu_temp", "gpu_temp"))
+
+# Section stylesheets shared by every create_section() frame
+_SECTION_FRAME_STYLE = """
+    QFrame#sectionFrame {
+        background-color: #2a2a2a;
+        border: 1px solid #3a3a3a;
+        border-radius: 6px;
+    }
+    QFrame#sectionFrame QLabel {
+        background: transparent;
+        border: none;
+        min-height: 22px;
+        qproperty-alignment: AlignVCenter;
+    }
+    QFrame#sectionFrame QCheckBox {
+        background: transparent;
+        border: none;
+        color: #ccc;
+    }
+    QFrame#sectionFrame QCheckBox::indicator {
+        width: 14px;
+        height: 14px;
+        border: 1px solid #666;
+        border-radius: 3px;
+        background-color: #1a1a1a;
+    }
+    QFrame#sectionFrame QCheckBox::indicator:checked {
+        background-color: #0078d4;
+        border-color: #0078d4;
+    }
+    QFrame#sectionFrame QCheckBox::indicator:hover {
+        border-color: #888;
+    }
+"""
+
+_SECTION_TITLE_STYLE = """
+    QLabel {
+        font-weight: bold;
+        color: #aaa;
+        font-size: 11px;
+        background: transparent;
+        border: none;
+        padding: 0;
+        margin-bottom: 4px;
+    }
+"""
+
+
 class NoScrollComboBox(QComboBox):
     """ComboBox that ignores wheel events to allow parent scrolling."""
     def wheelEvent(self, event):
@@ -31,9 +220,12 @@ class NoScrollDoubleSpinBox(QDoubleSpinBox):
         event.ignore()
 
 
+@lru_cache(maxsize=None)
 def create_alignment_icon(align_type, size=20):
     """Create alignment icons programmatically using QPainter.
 
+    Icons are cached per (align_type, size) since they never change.
+
     align_type options:
     - 'text_left', 'text_center', 'text_right' (text alignment - horizontal lines)
     - 'h_left', 'h_center', 'h_right' (object horizontal alignment)
@@ -245,7 +437,7 @@ class GradientEditorDialog(QDialog):
         self.setMinimumWidth(400)
 
         # Default gradient: green to red (good to bad for gauges)
-        self.stops = list(initial_stops) if initial_stops else [(0.0, "#00ff96"), (1.0, "#ff4444")]
+        self.stops = list(initial_stops or _DEFAULT_GRADIENT)
 
         layout = QVBoxLayout(self)
 
@@ -273,7 +465,7 @@ class GradientEditorDialog(QDialog):
         presets_layout = QHBoxLayout()
 
         preset_good_bad = QPushButton("Good → Bad")
-        preset_good_bad.clicked.connect(lambda: self._apply_preset([(0.0, "#00ff96"), (1.0, "#ff4444")]))
+        preset_good_bad.clicked.connect(lambda: self._apply_preset(list(_DEFAULT_GRADIENT)))
         presets_layout.addWidget(preset_good_bad)
 
         preset_cool_hot = QPushButton("Cool → Hot")
@@ -368,7 +560,7 @@ class GradientBarEditor(QWidget):
 
     def __init__(self, stops=None, parent=None):
         super().__init__(parent)
-        self.stops = list(stops) if stops else [(0.0, "#00ff96"), (1.0, "#ff4444")]
+        self.stops = list(stops or _DEFAULT_GRADIENT)
         self.setFixedHeight(50)
         self.setMinimumWidth(300)
         self.setMouseTracking(True)
@@ -550,6 +742,282 @@ class GradientBarEditor(QWidget):
 from constants import DISPLAY_WIDTH, DISPLAY_HEIGHT, DATA_SOURCES, DATA_SOURCES_CATEGORIZED
 
 
+@lru_cache(maxsize=64)
+def _fit_within(width, height, max_width=DISPLAY_WIDTH, max_height=DISPLAY_HEIGHT):
+    """Scale (width, height) down to fit the given box, keeping its proportions.
+
+    Returns (width, height, aspect_ratio), the aspect ratio being that of the
+    unscaled size (1.0 if height is 0).
+    """
+    aspect_ratio = width / height if height > 0 else 1.0
+    if width > max_width or height > max_height:
+        scale = min(min(width, max_width) / width, min(height, max_height) / height)
+        width = int(width * scale)
+        height = int(height * scale)
+    return width, height, aspect_ratio
+
+
+def _build_source_combo_rows():
+    """Build (display_text, source_id) rows for the source combo box.
+
+    Category headers carry a source_id of None.
+    """
+    rows = []
+    for category, sources in DATA_SOURCES_CATEGORIZED.items():
+        rows.append((f"── {category} ──", None))
+        for source_id, source_name, unit_type, unit_symbol in sources:
+            # Don't show unit symbol for static value
+            if source_id == "static":
+                rows.append((f"    {source_name}", source_id))
+            else:
+                rows.append((f"    {source_name} ({unit_symbol})", source_id))
+    return rows
+
+
+# Source combo rows are static, so format the display strings once at import
+_SOURCE_COMBO_ROWS = _build_source_combo_rows()
+
+# Which property fields each element type shows; keys missing from a type
+# fall back to _VIS_DEFAULTS
+_FIELD_VISIBILITY = {
+    "circle_gauge": {
+        "width": False, "height": False, "radius": True,
+        "color": True, "bg_color": True, "text": False,
+        "font": False, "font_size": False, "font_style": False,
+        "value_text_group": True, "label_text_group": True,
+        "align": False, "clip": False, "source": True, "value": True, "image": False,
+        "auto_color_change": True, "animate_gauge": True, "gauge_rounded_ends": True
+    },
+    "text": {
+        "width": True, "height": True, "radius": False,
+        "color": True, "bg_color": False, "text": True,
+        "font": False, "font_size": False, "font_style": False,
+        "value_text_group": True, "label_text_group": False,
+        "align": True, "clip": True, "source": True, "value": True, "image": False
+    },
+    "clock": {
+        "width": True, "height": True, "radius": False,
+        "color": True, "bg_color": False, "text": False,
+        "font": False, "font_size": False, "font_style": False,
+        "value_text_group": True, "label_text_group": False,
+        "align": True, "clip": True, "source": False, "value": False, "image": False,
+        "time_format": True, "show_am_pm": True, "show_seconds": True, "show_leading_zero": True
+    },
+    "rectangle": {
+        "width": True, "height": True, "radius": False,
+        "color": True, "bg_color": False, "text": False,
+        "font": False, "font_size": False, "font_style": False,
+        "align": False, "clip": False, "source": False, "value": False, "image": False,
+        "border_radius": True, "glass_effect": True
+    },
+    "image": {
+        "width": True, "height": True, "radius": False,
+        "color": False, "bg_color": False, "text": False,
+        "font": False, "font_size": False, "font_style": False,
+        "align": False, "clip": False, "source": False, "value": False, "image": True
+    },
+    "gif": {
+        "width": True, "height": True, "radius": False,
+        "color": True, "bg_color": False, "text": False,
+        "font": False, "font_size": False, "font_style": False,
+        "align": False, "clip": False, "source": False, "value": False, "image": False,
+        "gif": True, "scale_mode": True
+    },
+    "line_chart": {
+        "width": True, "height": True, "radius": False,
+        "color": True, "bg_color": True, "text": True,
+        "font": False, "font_size": False, "font_style": False,
+        "value_text_group": True, "label_text_group": False,
+        "align": False, "clip": False, "source": True, "value": True, "image": False,
+        "show_background": True, "show_label": True, "show_gradient": True,
+        "rounded_corners": False, "gradient_fill": False,
+        "line_thickness": True, "smooth": True
+    },
+    "bar_gauge": {
+        "width": True, "height": True, "radius": False,
+        "color": True, "bg_color": True, "text": False,
+        "font": False, "font_size": False, "font_style": False,
+        "value_text_group": True, "label_text_group": True,
+        "align": False, "clip": False, "source": True, "value": True, "image": False,
+        "show_background": False, "show_label": False, "show_gradient": False,
+        "rounded_corners": True, "gradient_fill": True,
+        "auto_color_change": True, "animate_gauge": True,
+        "bar_text_mode": True, "bar_text_position": True,
+        "bar_border": True
+    },
+    "analog_clock": {
+        "width": False, "height": False, "radius": True,
+        "color": True, "bg_color": True, "text": False,
+        "font": False, "font_size": False, "font_style": False,
+        "value_text_group": True, "label_text_group": False,
+        "align": False, "clip": False, "source": False, "value": False, "image": False,
+        "show_seconds_hand": True, "show_clock_border": True,
+        "clock_face_style": True, "smooth_animation": True
+    }
+}
+
+# Field visibility keys read by update_visible_fields, with their fallback
+# when an element type doesn't mention them. Anything not listed here as
+# True defaults to hidden.
+_VIS_KEYS = (
+    'width', 'height', 'radius', 'color', 'bg_color', 'text', 'font',
+    'font_size', 'font_style', 'value_text_group', 'label_text_group',
+    'align', 'clip', 'source', 'value', 'image', 'border_radius',
+    'glass_effect', 'show_background', 'show_label', 'show_gradient',
+    'line_thickness', 'smooth', 'rounded_corners', 'auto_color_change',
+    'animate_gauge', 'gauge_rounded_ends', 'time_format', 'show_am_pm',
+    'show_seconds', 'show_leading_zero', 'show_seconds_hand',
+    'show_clock_border', 'clock_face_style', 'smooth_animation',
+    'bar_text_mode', 'bar_text_position', 'bar_border', 'gif', 'scale_mode',
+)
+_VIS_DEFAULTS = {
+    'width': True, 'height': True, 'color': True, 'text': True,
+    'font': True, 'font_size': True, 'font_style': True,
+}
+
+
+# One bit per visibility flag. gradient_fill, temp_hide_unit and
+# preview_value depend on element state rather than type alone.
+_VIS_BITS = {
+    key: 1 << i
+    for i, key in enumerate(_VIS_KEYS + ('gradient_fill', 'temp_hide_unit', 'preview_value'))
+}
+
+
+def _vis_mask(*keys):
+    mask = 0
+    for key in keys:
+        mask |= _VIS_BITS[key]
+    return mask
+
+
+# A section header is shown when any of its fields' bits are set
+_SECTION_MASKS = {
+    'colors': _vis_mask('color', 'bg_color', 'gradient_fill'),
+    'appearance': _vis_mask('border_radius', 'glass_effect'),
+    'text': _vis_mask('text', 'font', 'font_size', 'font_style', 'value_text_group',
+                      'label_text_group', 'align', 'clip', 'bar_text_mode', 'bar_text_position'),
+    'data': _vis_mask('source', 'preview_value'),
+    'media': _vis_mask('image', 'gif', 'scale_mode'),
+    'options': _vis_mask('show_background', 'show_label', 'show_gradient', 'line_thickness',
+                         'smooth', 'rounded_corners', 'temp_hide_unit', 'auto_color_change',
+                         'animate_gauge', 'gauge_rounded_ends', 'time_format', 'show_am_pm',
+                         'show_seconds', 'show_leading_zero', 'show_seconds_hand',
+                         'show_clock_border', 'clock_face_style', 'smooth_animation'),
+}
+
+# Sections shown regardless of element type (name and position always apply)
+_ALWAYS_VISIBLE_SECTIONS = frozenset(('general', 'transform'))
+
+
+def _unpack_visibility(visibility):
+    """Resolve a field visibility dict into a namespace with every key set."""
+    return SimpleNamespace(**{
+        key: visibility.get(key, _VIS_DEFAULTS.get(key, False)) for key in _VIS_KEYS
+    })
+
+
+def _visibility_bits(v, element_type=None):
+    """Pack a resolved visibility namespace into a _VIS_BITS bitmask."""
+    bits = 0
+    for key in _VIS_KEYS:
+        if getattr(v, key):
+            bits |= _VIS_BITS[key]
+    # Gradient fill option is only for bar_gauge and circle_gauge
+    if element_type in ("bar_gauge", "circle_gauge"):
+        bits |= _VIS_BITS['gradient_fill']
+    return bits
+
+
+# Per-type visibility is static, so resolve it once at import
+_TYPE_VISIBILITY = {t: _unpack_visibility(vis) for t, vis in _FIELD_VISIBILITY.items()}
+_TYPE_VIS_BITS = {t: _visibility_bits(v, t) for t, v in _TYPE_VISIBILITY.items()}
+_DEFAULT_VISIBILITY = _unpack_visibility({})
+_DEFAULT_VIS_BITS = _visibility_bits(_DEFAULT_VISIBILITY)
+
+
+# Element attribute <-> widget bindings: (attribute, widget attribute, kind, default).
+# set_element, on_property_changed and set_controls_enabled are all driven from
+# this table; fields with special handling (text, font family, alignment,
+# source, colors) are dealt with separately.
+_FIELDS = (
+    ('name', 'name_edit', 'text', ''),
+    ('x', 'x_spin', 'spin', 100),
+    ('y', 'y_spin', 'spin', 100),
+    ('width', 'width_spin', 'spin', 200),
+    ('height', 'height_spin', 'spin', 50),
+    ('border_radius', 'border_radius_spin', 'spin', 0),
+    ('glass_effect', 'glass_effect_check', 'check', False),
+    ('glass_blur', 'glass_blur_spin', 'spin', 10),
+    ('glass_opacity', 'glass_opacity_spin', 'spin', 50),
+    ('radius', 'radius_spin', 'spin', 100),
+    ('font_size', 'font_size_spin', 'spin', 32),
+    ('font_bold', 'bold_checkbox', 'check', False),
+    ('font_italic', 'italic_checkbox', 'check', False),
+    ('clip', 'clip_checkbox', 'check', False),
+    ('value', 'value_spin', 'spin', 50),
+    ('image_path', 'image_path_edit', 'text', ''),
+    ('scale_proportionally', 'scale_proportionally_check', 'check', True),
+    # Line chart options
+    ('show_background', 'show_background_check', 'check', True),
+    ('show_label', 'show_label_check', 'check', True),
+    ('show_gradient', 'show_gradient_check', 'check', True),
+    ('line_thickness', 'line_thickness_spin', 'spin', 2),
+    ('smooth', 'smooth_check', 'check', False),
+    # Bar gauge options
+    ('rounded_corners', 'rounded_corners_check', 'check', False),
+    ('bar_border', 'bar_border_check', 'check', False),
+    ('bar_border_width', 'bar_border_width_spin', 'spin', 2),
+    ('bar_border_position', 'bar_border_position_combo', 'combo_data', 'center'),
+    ('gradient_fill', 'gradient_fill_check', 'check', False),
+    ('bar_text_mode', 'bar_text_mode_combo', 'combo_data', 'full'),
+    ('bar_text_position', 'bar_text_position_combo', 'combo_data', 'inside'),
+    # Gauge options
+    ('auto_color_change', 'auto_color_change_check', 'check', True),
+    ('animate_gauge', 'animate_gauge_check', 'check', False),
+    ('gauge_rounded_ends', 'gauge_rounded_ends_check', 'check', False),
+    # Gauge label font options
+    ('label_font_size', 'label_font_size_spin', 'spin', 16),
+    ('label_font_family', 'label_font_family_combo', 'combo_text', 'Arial'),
+    ('label_font_bold', 'label_bold_checkbox', 'check', False),
+    ('label_font_italic', 'label_italic_checkbox', 'check', False),
+    # Temperature display options
+    ('temp_hide_unit', 'temp_hide_unit_check', 'check', False),
+    # GIF options
+    ('gif_path', 'gif_path_edit', 'text', ''),
+    ('scale_mode', 'scale_mode_combo', 'combo_data', 'fit'),
+    # Digital clock time format options
+    ('time_format', 'time_format_combo', 'combo_data', '24h'),
+    ('show_am_pm', 'show_am_pm_check', 'check', True),
+    ('show_seconds', 'show_seconds_check', 'check', True),
+    ('show_leading_zero', 'show_leading_zero_check', 'check', True),
+    # Analog clock options
+    ('show_seconds_hand', 'show_seconds_hand_check', 'check', True),
+    ('show_clock_border', 'show_clock_border_check', 'check', True),
+    ('clock_face_style', 'clock_face_style_combo', 'combo_data', 'numbers'),
+    ('smooth_animation', 'smooth_animation_check', 'check', True),
+)
+
+# Sentinel for attributes an element doesn't have yet
+_MISSING = object()
+
+_FIELD_SETTERS = {
+    'text': _set_text,
+    'spin': _set_spin,
+    'check': _set_check,
+    'combo_data': _set_combo_data,
+    'combo_text': _set_combo_text,
+}
+
+_FIELD_GETTERS = {
+    'text': lambda w: w.text(),
+    'spin': lambda w: w.value(),
+    'check': lambda w: w.isChecked(),
+    'combo_data': lambda w: w.currentData(),
+    'combo_text': lambda w: w.currentText(),
+}
+
+
 class FontPreviewDelegate(QStyledItemDelegate):
     """Custom delegate to render font names in their own typeface."""
 
@@ -595,6 +1063,22 @@ class PropertiesPanel(QWidget):
         self.multi_selection_elements = []
         self.multi_selection_indices = []
         self._undo_state_saved = False  # Track if undo state was saved for current edit session
+        self._alignment_units_cache = None  # (group/lock signature, unit element lists)
+        self._multi_selection_key = None  # Identity of the selection the multi panel shows
+
+        # Coalesce bursts of widget edits (e.g. spinbox key-repeat) into one
+        # write-back and one property_changed per event-loop turn
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush_properties)
+
+        # Throttle multi-selection move/resize to one pass per frame while
+        # the user scrubs the transform spin boxes
+        self._multi_timer = QTimer(self)
+        self._multi_timer.setSingleShot(True)
+        self._multi_timer.setInterval(16)
+        self._multi_timer.timeout.connect(self._apply_multi_changes)
 
         # Section headers for visibility control
         self.section_headers = {}
@@ -602,43 +1086,82 @@ class PropertiesPanel(QWidget):
 
         self.setup_ui()
 
+        # Widgets whose visibility follows a single per-type flag
+        self._bit_to_widgets = tuple(
+            (_VIS_BITS[key], widgets) for key, widgets in (
+                ('radius', (self.radius_label, self.radius_spin)),
+                ('bg_color', (self.bg_color_label, self.bg_color_btn)),
+                ('gradient_fill', (self.gradient_fill_label, self.gradient_fill_check)),
+                ('border_radius', (self.border_radius_label, self.border_radius_spin)),
+                ('glass_effect', (self.glass_effect_label, self.glass_effect_check,
+                                  self.glass_blur_label, self.glass_blur_spin,
+                                  self.glass_opacity_label, self.glass_opacity_spin)),
+                ('bar_text_mode', (self.bar_text_mode_label, self.bar_text_mode_combo)),
+                ('bar_text_position', (self.bar_text_position_label, self.bar_text_position_combo)),
+                ('text', (self.text_label, self.text_edit)),
+                ('value_text_group', (self.value_text_group,)),
+                ('label_text_group', (self.label_text_group,
+                                      self.label_text_input_label, self.label_text_edit,
+                                      self.label_font_family_label, self.label_font_family_combo)),
+                ('align', (self.align_label, self.align_widget)),
+                ('clip', (self.clip_label, self.clip_checkbox)),
+                ('source', (self.source_label, self.source_combo)),
+                ('image', (self.image_label, self.image_widget,
+                           self.scale_proportionally_label, self.scale_proportionally_check)),
+                ('gif', (self.gif_label, self.gif_widget)),
+                ('scale_mode', (self.scale_mode_label, self.scale_mode_combo)),
+                ('show_background', (self.show_background_label, self.show_background_check)),
+                ('show_label', (self.show_label_label, self.show_label_check)),
+                ('show_gradient', (self.show_gradient_label, self.show_gradient_check)),
+                ('line_thickness', (self.line_thickness_label, self.line_thickness_spin)),
+                ('smooth', (self.smooth_label, self.smooth_check)),
+                ('rounded_corners', (self.rounded_corners_label, self.rounded_corners_check)),
+                ('bar_border', (self.bar_border_label, self.bar_border_check)),
+                ('auto_color_change', (self.auto_color_change_label, self.auto_color_change_check)),
+                ('animate_gauge', (self.animate_gauge_label, self.animate_gauge_check)),
+                ('gauge_rounded_ends', (self.gauge_rounded_ends_label, self.gauge_rounded_ends_check)),
+                ('time_format', (self.time_format_label, self.time_format_combo)),
+                ('show_am_pm', (self.show_am_pm_label, self.show_am_pm_check)),
+                ('show_seconds', (self.show_seconds_label, self.show_seconds_check)),
+                ('show_leading_zero', (self.show_leading_zero_label, self.show_leading_zero_check)),
+                ('show_seconds_hand', (self.show_seconds_hand_label, self.show_seconds_hand_check)),
+                ('show_clock_border', (self.show_clock_border_label, self.show_clock_border_check)),
+                ('clock_face_style', (self.clock_face_style_label, self.clock_face_style_combo)),
+                ('smooth_animation', (self.smooth_animation_label, self.smooth_animation_check)),
+            )
+        )
+
+        # Resolve the _FIELDS table against this panel's widgets once
+        self._field_bindings = tuple(
+            (attr, getattr(self, widget_name), kind, default)
+            for attr, widget_name, kind, default in _FIELDS
+        )
+        field_widgets = tuple(widget for _, widget, _, _ in self._field_bindings)
+
+        # Widgets whose signals are blocked while loading an element
+        self._managed_widgets = field_widgets + (
+            self.text_edit, self.label_text_edit, self.font_family_combo,
+            self.align_left_btn, self.align_center_btn, self.align_right_btn,
+            self.source_combo,
+        )
+
+        # Buttons that only need enabling/disabling, never signal blocking
+        self._enable_extra = (
+            self.image_browse_btn, self.gif_browse_btn, self.color_btn, self.bg_color_btn,
+            self.value_text_color_btn, self.label_text_color_btn, self.bar_border_color_btn,
+        )
+
+        # Widgets disabled for locked elements (name stays editable for renaming)
+        self._lockable_widgets = tuple(
+            w for w in self._managed_widgets if w is not self.name_edit
+        ) + self._enable_extra
+
     def create_section(self, title):
         """Create a styled section container with title."""
         # Container frame
         frame = QFrame()
         frame.setObjectName("sectionFrame")
-        frame.setStyleSheet("""
-            QFrame#sectionFrame {
-                background-color: #2a2a2a;
-                border: 1px solid #3a3a3a;
-                border-radius: 6px;
-            }
-            QFrame#sectionFrame QLabel {
-                background: transparent;
-                border: none;
-                min-height: 22px;
-                qproperty-alignment: AlignVCenter;
-            }
-            QFrame#sectionFrame QCheckBox {
-                background: transparent;
-                border: none;
-                color: #ccc;
-            }
-            QFrame#sectionFrame QCheckBox::indicator {
-                width: 14px;
-                height: 14px;
-                border: 1px solid #666;
-                border-radius: 3px;
-                background-color: #1a1a1a;
-            }
-            QFrame#sectionFrame QCheckBox::indicator:checked {
-                background-color: #0078d4;
-                border-color: #0078d4;
-            }
-            QFrame#sectionFrame QCheckBox::indicator:hover {
-                border-color: #888;
-            }
-        """)
+        frame.setStyleSheet(_SECTION_FRAME_STYLE)
 
         # Layout for the section
         section_layout = QVBoxLayout(frame)
@@ -647,17 +1170,7 @@ class PropertiesPanel(QWidget):
 
         # Title label
         title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            QLabel {
-                font-weight: bold;
-                color: #aaa;
-                font-size: 11px;
-                background: transparent;
-                border: none;
-                padding: 0;
-                margin-bottom: 4px;
-            }
-        """)
+        title_label.setStyleSheet(_SECTION_TITLE_STYLE)
         section_layout.addWidget(title_label)
 
         # Form layout for fields
@@ -871,6 +1384,7 @@ class PropertiesPanel(QWidget):
         self.bar_border_position_combo.addItem("Inside", "inside")
         self.bar_border_position_combo.addItem("Center", "center")
         self.bar_border_position_combo.addItem("Outside", "outside")
+        _index_combo_data(self.bar_border_position_combo)
         self.bar_border_position_combo.currentIndexChanged.connect(self.on_property_changed)
         border_group_layout.addRow(self.create_label("Position:"), self.bar_border_position_combo)
 
@@ -951,6 +1465,7 @@ class PropertiesPanel(QWidget):
         self.bar_text_mode_combo.addItem("Value Only", "value_only")
         self.bar_text_mode_combo.addItem("Label Only", "label_only")
         self.bar_text_mode_combo.addItem("Hidden", "none")
+        _index_combo_data(self.bar_text_mode_combo)
         self.bar_text_mode_combo.currentIndexChanged.connect(self.on_property_changed)
         self.bar_text_mode_label = self.create_label("Display:")
         text_layout.addRow(self.bar_text_mode_label, self.bar_text_mode_combo)
@@ -961,6 +1476,7 @@ class PropertiesPanel(QWidget):
         self.bar_text_position_combo.addItem("Right of Bar", "right")
         self.bar_text_position_combo.addItem("Top of Bar", "top")
         self.bar_text_position_combo.addItem("Bottom of Bar", "bottom")
+        _index_combo_data(self.bar_text_position_combo)
         self.bar_text_position_combo.currentIndexChanged.connect(self.on_property_changed)
         self.bar_text_position_label = self.create_label("Position:")
         text_layout.addRow(self.bar_text_position_label, self.bar_text_position_combo)
@@ -1207,6 +1723,7 @@ class PropertiesPanel(QWidget):
         self.scale_mode_combo.addItem("Fit (maintain ratio)", "fit")
         self.scale_mode_combo.addItem("Fill (crop excess)", "fill")
         self.scale_mode_combo.addItem("Stretch", "stretch")
+        _index_combo_data(self.scale_mode_combo)
         self.scale_mode_combo.currentIndexChanged.connect(self.on_property_changed)
         self.scale_mode_label = self.create_label("Scale:")
         media_layout.addRow(self.scale_mode_label, self.scale_mode_combo)
@@ -1290,6 +1807,7 @@ class PropertiesPanel(QWidget):
         self.time_format_combo = NoScrollComboBox()
         self.time_format_combo.addItem("24-Hour (Military)", "24h")
         self.time_format_combo.addItem("12-Hour (Standard)", "12h")
+        _index_combo_data(self.time_format_combo)
         self.time_format_combo.currentIndexChanged.connect(self.on_property_changed)
         self.time_format_label = self.create_label("Time Format:")
         options_layout.addRow(self.time_format_label, self.time_format_combo)
@@ -1324,6 +1842,7 @@ class PropertiesPanel(QWidget):
         self.clock_face_style_combo.addItem("Numbers (1-12)", "numbers")
         self.clock_face_style_combo.addItem("Tick Marks", "ticks")
         self.clock_face_style_combo.addItem("None", "none")
+        _index_combo_data(self.clock_face_style_combo)
         self.clock_face_style_combo.currentIndexChanged.connect(self.on_property_changed)
         self.clock_face_style_label = self.create_label("Face Style:")
         options_layout.addRow(self.clock_face_style_label, self.clock_face_style_combo)
@@ -1405,6 +1924,7 @@ class PropertiesPanel(QWidget):
         self.multi_x_spin = NoScrollSpinBox()
         self.multi_x_spin.setRange(-1000, DISPLAY_WIDTH + 1000)
         self.multi_x_spin.valueChanged.connect(self.on_multi_transform_changed)
+        self.multi_x_spin.editingFinished.connect(self._end_multi_edit)
         multi_x_container = QHBoxLayout()
         multi_x_container.setSpacing(4)
         multi_x_label = QLabel("X:")
@@ -1415,6 +1935,7 @@ class PropertiesPanel(QWidget):
         self.multi_y_spin = NoScrollSpinBox()
         self.multi_y_spin.setRange(-1000, DISPLAY_HEIGHT + 1000)
         self.multi_y_spin.valueChanged.connect(self.on_multi_transform_changed)
+        self.multi_y_spin.editingFinished.connect(self._end_multi_edit)
         multi_y_container = QHBoxLayout()
         multi_y_container.setSpacing(4)
         multi_y_label = QLabel("Y:")
@@ -1433,6 +1954,7 @@ class PropertiesPanel(QWidget):
         self.multi_w_spin = NoScrollSpinBox()
         self.multi_w_spin.setRange(1, DISPLAY_WIDTH * 2)
         self.multi_w_spin.valueChanged.connect(self.on_multi_size_changed)
+        self.multi_w_spin.editingFinished.connect(self._end_multi_edit)
         multi_w_container = QHBoxLayout()
         multi_w_container.setSpacing(4)
         multi_w_label = QLabel("W:")
@@ -1443,6 +1965,7 @@ class PropertiesPanel(QWidget):
         self.multi_h_spin = NoScrollSpinBox()
         self.multi_h_spin.setRange(1, DISPLAY_HEIGHT * 2)
         self.multi_h_spin.valueChanged.connect(self.on_multi_size_changed)
+        self.multi_h_spin.editingFinished.connect(self._end_multi_edit)
         multi_h_container = QHBoxLayout()
         multi_h_container.setSpacing(4)
         multi_h_label = QLabel("H:")
@@ -1459,81 +1982,51 @@ class PropertiesPanel(QWidget):
         self.alignment_frame, alignment_layout = self.create_section("Alignment")
         self.multi_layout.addWidget(self.alignment_frame)
 
-        # Horizontal alignment
-        h_align_layout = QHBoxLayout()
-        self.align_h_left_btn = QPushButton()
-        self.align_h_left_btn.setIcon(create_alignment_icon('h_left'))
-        self.align_h_left_btn.setFixedSize(32, 26)
-        self.align_h_left_btn.setToolTip("Align Left Edges")
-        self.align_h_left_btn.clicked.connect(self.align_left)
-        h_align_layout.addWidget(self.align_h_left_btn)
-
-        self.align_h_center_btn = QPushButton()
-        self.align_h_center_btn.setIcon(create_alignment_icon('h_center'))
-        self.align_h_center_btn.setFixedSize(32, 26)
-        self.align_h_center_btn.setToolTip("Align Horizontal Centers")
-        self.align_h_center_btn.clicked.connect(self.align_h_center)
-        h_align_layout.addWidget(self.align_h_center_btn)
-
-        self.align_h_right_btn = QPushButton()
-        self.align_h_right_btn.setIcon(create_alignment_icon('h_right'))
-        self.align_h_right_btn.setFixedSize(32, 26)
-        self.align_h_right_btn.setToolTip("Align Right Edges")
-        self.align_h_right_btn.clicked.connect(self.align_right)
-        h_align_layout.addWidget(self.align_h_right_btn)
-        h_align_layout.addStretch()
-
-        h_align_widget = QWidget()
-        h_align_widget.setLayout(h_align_layout)
-        alignment_layout.addRow(QLabel("Horizontal:"), h_align_widget)
-
-        # Vertical alignment
-        v_align_layout = QHBoxLayout()
-        self.align_v_top_btn = QPushButton()
-        self.align_v_top_btn.setIcon(create_alignment_icon('v_top'))
-        self.align_v_top_btn.setFixedSize(32, 26)
-        self.align_v_top_btn.setToolTip("Align Top Edges")
-        self.align_v_top_btn.clicked.connect(self.align_top)
-        v_align_layout.addWidget(self.align_v_top_btn)
-
-        self.align_v_middle_btn = QPushButton()
-        self.align_v_middle_btn.setIcon(create_alignment_icon('v_middle'))
-        self.align_v_middle_btn.setFixedSize(32, 26)
-        self.align_v_middle_btn.setToolTip("Align Vertical Centers")
-        self.align_v_middle_btn.clicked.connect(self.align_v_middle)
-        v_align_layout.addWidget(self.align_v_middle_btn)
-
-        self.align_v_bottom_btn = QPushButton()
-        self.align_v_bottom_btn.setIcon(create_alignment_icon('v_bottom'))
-        self.align_v_bottom_btn.setFixedSize(32, 26)
-        self.align_v_bottom_btn.setToolTip("Align Bottom Edges")
-        self.align_v_bottom_btn.clicked.connect(self.align_bottom)
-        v_align_layout.addWidget(self.align_v_bottom_btn)
-        v_align_layout.addStretch()
-
-        v_align_widget = QWidget()
-        v_align_widget.setLayout(v_align_layout)
-        alignment_layout.addRow(QLabel("Vertical:"), v_align_widget)
-
-        # Distribution
-        dist_layout = QHBoxLayout()
-        self.dist_h_btn = QPushButton()
-        self.dist_h_btn.setIcon(create_alignment_icon('dist_h'))
-        self.dist_h_btn.setFixedSize(32, 26)
-        self.dist_h_btn.setToolTip("Distribute Horizontally")
-        self.dist_h_btn.clicked.connect(self.distribute_horizontal)
-        dist_layout.addWidget(self.dist_h_btn)
-
-        self.dist_v_btn = QPushButton()
-        self.dist_v_btn.setIcon(create_alignment_icon('dist_v'))
-        self.dist_v_btn.setFixedSize(32, 26)
-        self.dist_v_btn.setToolTip("Distribute Vertically")
-        self.dist_v_btn.clicked.connect(self.distribute_vertical)
-        dist_layout.addWidget(self.dist_v_btn)
-
-        dist_widget = QWidget()
-        dist_widget.setLayout(dist_layout)
-        alignment_layout.addRow(QLabel("Distribute:"), dist_widget)
+        # Alignment actions keyed by icon type; every button dispatches through
+        # _on_align_button so there is a single slot for the whole section.
+        self._align_actions = {
+            'h_left': self.align_left,
+            'h_center': self.align_h_center,
+            'h_right': self.align_right,
+            'v_top': self.align_top,
+            'v_middle': self.align_v_middle,
+            'v_bottom': self.align_bottom,
+            'dist_h': self.distribute_horizontal,
+            'dist_v': self.distribute_vertical,
+        }
+        alignment_rows = [
+            ("Horizontal:", True, [
+                ('h_left', 'align_h_left_btn', "Align Left Edges"),
+                ('h_center', 'align_h_center_btn', "Align Horizontal Centers"),
+                ('h_right', 'align_h_right_btn', "Align Right Edges"),
+            ]),
+            ("Vertical:", True, [
+                ('v_top', 'align_v_top_btn', "Align Top Edges"),
+                ('v_middle', 'align_v_middle_btn', "Align Vertical Centers"),
+                ('v_bottom', 'align_v_bottom_btn', "Align Bottom Edges"),
+            ]),
+            ("Distribute:", False, [
+                ('dist_h', 'dist_h_btn', "Distribute Horizontally"),
+                ('dist_v', 'dist_v_btn', "Distribute Vertically"),
+            ]),
+        ]
+
+        for row_label, stretch, buttons in alignment_rows:
+            row_layout = QHBoxLayout()
+            for key, attr, tooltip in buttons:
+                btn = QPushButton()
+                btn.setIcon(create_alignment_icon(key))
+                btn.setFixedSize(32, 26)
+                btn.setToolTip(tooltip)
+                btn.clicked.connect(lambda checked=False, k=key: self._on_align_button(k))
+                row_layout.addWidget(btn)
+                setattr(self, attr, btn)
+            if stretch:
+                row_layout.addStretch()
+
+            row_widget = QWidget()
+            row_widget.setLayout(row_layout)
+            alignment_layout.addRow(QLabel(row_label), row_widget)
 
         self.multi_layout.addStretch()
         self.multi_scroll.setWidget(self.multi_widget)
@@ -1569,28 +2062,29 @@ class PropertiesPanel(QWidget):
                 self.font_family_combo.addItem(family)
                 self.label_font_family_combo.addItem(family)
 
+        # Both combos hold the same items, so one name -> index map serves both
+        self._font_index = {
+            self.font_family_combo.itemText(i): i for i in range(self.font_family_combo.count())
+        }
+        self._font_index.pop("", None)  # separator
+        self.font_family_combo._text_to_index = self._font_index
+        self.label_font_family_combo._text_to_index = self._font_index
+
     def setup_source_combo(self):
         """Setup the source combo box with categorized items."""
         self.source_combo.clear()
+        model = self.source_combo.model()
 
-        for category, sources in DATA_SOURCES_CATEGORIZED.items():
-            # Add category header (disabled, styled differently)
-            self.source_combo.addItem(f"── {category} ──")
-            idx = self.source_combo.count() - 1
-            # Make header item non-selectable
-            self.source_combo.model().item(idx).setEnabled(False)
-
-            # Add sources in this category
-            for source_info in sources:
-                source_id, source_name, unit_type, unit_symbol = source_info
-                # Don't show unit symbol for static value
-                if source_id == "static":
-                    self.source_combo.addItem(f"    {source_name}")
-                else:
-                    self.source_combo.addItem(f"    {source_name} ({unit_symbol})")
-                idx = self.source_combo.count() - 1
+        for text, source_id in _SOURCE_COMBO_ROWS:
+            if source_id is None:
+                # Category header (disabled, non-selectable)
+                self.source_combo.addItem(text)
+                model.item(self.source_combo.count() - 1).setEnabled(False)
+            else:
                 # Store the actual source ID in item data
-                self.source_combo.setItemData(idx, source_id, Qt.ItemDataRole.UserRole)
+                self.source_combo.addItem(text, source_id)
+
+        _index_combo_data(self.source_combo)
 
     def get_selected_source(self):
         """Get the currently selected source ID."""
@@ -1600,222 +2094,79 @@ class PropertiesPanel(QWidget):
 
     def set_source_by_id(self, source_id):
         """Set the combo box selection by source ID."""
-        for i in range(self.source_combo.count()):
-            if self.source_combo.itemData(i, Qt.ItemDataRole.UserRole) == source_id:
-                self.source_combo.setCurrentIndex(i)
-                return
-        # Fallback to static if not found
-        self.set_source_by_id("static")
+        index = self.source_combo._data_to_index.get(source_id)
+        if index is None:
+            # Fallback to static if not found
+            index = self.source_combo._data_to_index["static"]
+        self.source_combo.setCurrentIndex(index)
 
     def on_source_changed(self, index):
         """Handle source combo box selection change."""
+        combo = self.source_combo
+        user_role = Qt.ItemDataRole.UserRole
+
         # Skip if header item selected (find next valid item)
-        source_id = self.source_combo.itemData(index, Qt.ItemDataRole.UserRole)
+        source_id = combo.itemData(index, user_role)
         if source_id is None:
             # Find next valid item
-            for i in range(index + 1, self.source_combo.count()):
-                if self.source_combo.itemData(i, Qt.ItemDataRole.UserRole):
-                    self.source_combo.setCurrentIndex(i)
+            for i in range(index + 1, combo.count()):
+                if combo.itemData(i, user_role):
+                    combo.setCurrentIndex(i)
                     return
             return
 
         # Update preview value visibility based on whether source is static
         is_static = source_id == "static"
-        self.value_label.setVisible(is_static and self.value_label.parent().isVisible())
-        self.value_spin.setVisible(is_static and self.value_spin.parent().isVisible())
+        value_label = self.value_label
+        value_spin = self.value_spin
+        value_label.setVisible(is_static and value_label.parent().isVisible())
+        value_spin.setVisible(is_static and value_spin.parent().isVisible())
 
-        if self.current_element:
-            if self.current_element.locked:
+        el = self.current_element
+        if el:
+            if el.locked:
                 return
-            if not self._undo_state_saved:
-                self.property_will_change.emit()
-                self._undo_state_saved = True
-            self.current_element.source = source_id
+            self._maybe_snapshot()
+            el.source = source_id
             self.property_changed.emit()
 
     def set_alignment(self, align):
-        self.align_left_btn.blockSignals(True)
-        self.align_center_btn.blockSignals(True)
-        self.align_right_btn.blockSignals(True)
-
-        self.align_left_btn.setChecked(align == "left")
-        self.align_center_btn.setChecked(align == "center")
-        self.align_right_btn.setChecked(align == "right")
-
-        self.align_left_btn.blockSignals(False)
-        self.align_center_btn.blockSignals(False)
-        self.align_right_btn.blockSignals(False)
+        with _blocked(self.align_left_btn, self.align_center_btn, self.align_right_btn):
+            self.align_left_btn.setChecked(align == "left")
+            self.align_center_btn.setChecked(align == "center")
+            self.align_right_btn.setChecked(align == "right")
 
         self.on_property_changed()
 
     def update_visible_fields(self, element_type):
-        field_visibility = {
-            "circle_gauge": {
-                "width": False, "height": False, "radius": True,
-                "color": True, "bg_color": True, "text": False,
-                "font": False, "font_size": False, "font_style": False,
-                "value_text_group": True, "label_text_group": True,
-                "align": False, "clip": False, "source": True, "value": True, "image": False,
-                "auto_color_change": True, "animate_gauge": True, "gauge_rounded_ends": True
-            },
-            "text": {
-                "width": True, "height": True, "radius": False,
-                "color": True, "bg_color": False, "text": True,
-                "font": False, "font_size": False, "font_style": False,
-                "value_text_group": True, "label_text_group": False,
-                "align": True, "clip": True, "source": True, "value": True, "image": False
-            },
-            "clock": {
-                "width": True, "height": True, "radius": False,
-                "color": True, "bg_color": False, "text": False,
-                "font": False, "font_size": False, "font_style": False,
-                "value_text_group": True, "label_text_group": False,
-                "align": True, "clip": True, "source": False, "value": False, "image": False,
-                "time_format": True, "show_am_pm": True, "show_seconds": True, "show_leading_zero": True
-            },
-            "rectangle": {
-                "width": True, "height": True, "radius": False,
-                "color": True, "bg_color": False, "text": False,
-                "font": False, "font_size": False, "font_style": False,
-                "align": False, "clip": False, "source": False, "value": False, "image": False,
-                "border_radius": True, "glass_effect": True
-            },
-            "image": {
-                "width": True, "height": True, "radius": False,
-                "color": False, "bg_color": False, "text": False,
-                "font": False, "font_size": False, "font_style": False,
-                "align": False, "clip": False, "source": False, "value": False, "image": True
-            },
-            "gif": {
-                "width": True, "height": True, "radius": False,
-                "color": True, "bg_color": False, "text": False,
-                "font": False, "font_size": False, "font_style": False,
-                "align": False, "clip": False, "source": False, "value": False, "image": False,
-                "gif": True, "scale_mode": True
-            },
-            "line_chart": {
-                "width": True, "height": True, "radius": False,
-                "color": True, "bg_color": True, "text": True,
-                "font": False, "font_size": False, "font_style": False,
-                "value_text_group": True, "label_text_group": False,
-                "align": False, "clip": False, "source": True, "value": True, "image": False,
-                "show_background": True, "show_label": True, "show_gradient": True,
-                "rounded_corners": False, "gradient_fill": False,
-                "line_thickness": True, "smooth": True
-            },
-            "bar_gauge": {
-                "width": True, "height": True, "radius": False,
-                "color": True, "bg_color": True, "text": False,
-                "font": False, "font_size": False, "font_style": False,
-                "value_text_group": True, "label_text_group": True,
-                "align": False, "clip": False, "source": True, "value": True, "image": False,
-                "show_background": False, "show_label": False, "show_gradient": False,
-                "rounded_corners": True, "gradient_fill": True,
-                "auto_color_change": True, "animate_gauge": True,
-                "bar_text_mode": True, "bar_text_position": True,
-                "bar_border": True
-            },
-            "analog_clock": {
-                "width": False, "height": False, "radius": True,
-                "color": True, "bg_color": True, "text": False,
-                "font": False, "font_size": False, "font_style": False,
-                "value_text_group": True, "label_text_group": False,
-                "align": False, "clip": False, "source": False, "value": False, "image": False,
-                "show_seconds_hand": True, "show_clock_border": True,
-                "clock_face_style": True, "smooth_animation": True
-            }
-        }
+        el = self.current_element
+        el_source = getattr(el, 'source', 'static') if el else 'static'
 
-        visibility = field_visibility.get(element_type, {})
+        v = _TYPE_VISIBILITY.get(element_type, _DEFAULT_VISIBILITY)
+        bits = _TYPE_VIS_BITS.get(element_type, _DEFAULT_VIS_BITS)
 
-        # Track visibility for each section
-        section_visible = {section: False for section in self.section_headers}
-
-        # General section - always visible (name is always shown)
-        section_visible['general'] = True
-
-        # Transform section
-        width_visible = visibility.get("width", True)
-        height_visible = visibility.get("height", True)
-        radius_visible = visibility.get("radius", False)
+        # Fields whose visibility follows the element type directly
+        for bit, widgets in self._bit_to_widgets:
+            visible = bool(bits & bit)
+            for widget in widgets:
+                widget.setVisible(visible)
 
         # Size row shows if either width or height is visible
-        size_visible = width_visible or height_visible
+        size_visible = v.width or v.height
         self.size_label.setVisible(size_visible)
         self.size_widget.setVisible(size_visible)
 
-        self.radius_label.setVisible(radius_visible)
-        self.radius_spin.setVisible(radius_visible)
-
-        # Position (X/Y) is always visible in transform
-        section_visible['transform'] = True
-
-        # Colors section
-        color_visible = visibility.get("color", True)
-        bg_color_visible = visibility.get("bg_color", False)
-
-        # Gradient fill option is only for bar_gauge and circle_gauge
-        gradient_fill_visible = element_type in ["bar_gauge", "circle_gauge"]
-        use_gradient = gradient_fill_visible and self.gradient_fill_check.isChecked()
-
-        # Batch visibility updates to prevent flicker
-        self.setUpdatesEnabled(False)
-
         # Show color button only when not using gradient fill
-        self.color_label.setVisible(color_visible and not use_gradient)
-        self.color_btn.setVisible(color_visible and not use_gradient)
-        self.bg_color_label.setVisible(bg_color_visible)
-        self.bg_color_btn.setVisible(bg_color_visible)
-
-        # Gradient fill checkbox and preview
-        self.gradient_fill_label.setVisible(gradient_fill_visible)
-        self.gradient_fill_check.setVisible(gradient_fill_visible)
+        use_gradient = bool(bits & _VIS_BITS['gradient_fill']) and self.gradient_fill_check.isChecked()
+        self.color_label.setVisible(v.color and not use_gradient)
+        self.color_btn.setVisible(v.color and not use_gradient)
         self.gradient_preview_label.setVisible(use_gradient)
         self.gradient_preview.setVisible(use_gradient)
 
-        self.setUpdatesEnabled(True)
-
-        section_visible['colors'] = color_visible or bg_color_visible or gradient_fill_visible
-
-        # Appearance section
-        border_radius_visible = visibility.get("border_radius", False)
-        glass_visible = visibility.get("glass_effect", False)
-
-        self.border_radius_label.setVisible(border_radius_visible)
-        self.border_radius_spin.setVisible(border_radius_visible)
-        self.glass_effect_label.setVisible(glass_visible)
-        self.glass_effect_check.setVisible(glass_visible)
-        self.glass_blur_label.setVisible(glass_visible)
-        self.glass_blur_spin.setVisible(glass_visible)
-        self.glass_opacity_label.setVisible(glass_visible)
-        self.glass_opacity_spin.setVisible(glass_visible)
-
-        section_visible['appearance'] = border_radius_visible or glass_visible
-
-        # Text section
-        text_visible = visibility.get("text", True)
-        font_visible = visibility.get("font", True)
-        font_size_visible = visibility.get("font_size", True)
-        font_style_visible = visibility.get("font_style", True)
-        value_text_group_visible = visibility.get("value_text_group", False)
-        label_text_group_visible = visibility.get("label_text_group", False)
-        align_visible = visibility.get("align", False)
-        clip_visible = visibility.get("clip", False)
-        bar_text_mode_visible = visibility.get("bar_text_mode", False)
-        bar_text_position_visible = visibility.get("bar_text_position", False)
-
-        # Bar gauge text display/position options (at top of text section)
-        self.bar_text_mode_label.setVisible(bar_text_mode_visible)
-        self.bar_text_mode_combo.setVisible(bar_text_mode_visible)
-        self.bar_text_position_label.setVisible(bar_text_position_visible)
-        self.bar_text_position_combo.setVisible(bar_text_position_visible)
-
-        self.text_label.setVisible(text_visible)
-        self.text_edit.setVisible(text_visible)
-        self.value_text_group.setVisible(value_text_group_visible)
         # Only show as sub-pane (with border/title) when label group is also visible
         # For text/clock/line_chart, show controls directly without the group box styling
-        if value_text_group_visible and not label_text_group_visible:
+        value_text_group_visible = v.value_text_group
+        if value_text_group_visible and not v.label_text_group:
             self.value_text_group.setFlat(True)
             self.value_text_group.setTitle("")
             self.value_text_group.setStyleSheet("QGroupBox { border: none; margin: 0; padding: 0; }")
@@ -1825,151 +2176,46 @@ class PropertiesPanel(QWidget):
             self.value_text_group.setTitle("Value")
             self.value_text_group.setStyleSheet("")
             self.value_text_group.layout().setContentsMargins(8, 8, 8, 8)
-        self.label_text_group.setVisible(label_text_group_visible)
-
-        # Show all label options for both circle_gauge and bar_gauge
-        self.label_text_input_label.setVisible(label_text_group_visible)
-        self.label_text_edit.setVisible(label_text_group_visible)
-        self.label_font_family_label.setVisible(label_text_group_visible)
-        self.label_font_family_combo.setVisible(label_text_group_visible)
 
         # Show font controls when standalone OR inside value_text_group
-        show_standalone_font = font_visible and not value_text_group_visible
-        show_font_controls = show_standalone_font or value_text_group_visible
+        show_font_controls = v.font or value_text_group_visible
         self.font_family_label.setVisible(show_font_controls)
         self.font_family_combo.setVisible(show_font_controls)
         self.font_size_label.setVisible(show_font_controls)
         self.font_size_spin.setVisible(show_font_controls)
         self.font_style_label.setVisible(show_font_controls)
         self.font_style_widget.setVisible(show_font_controls)
-        self.align_label.setVisible(align_visible)
-        self.align_widget.setVisible(align_visible)
-        self.clip_label.setVisible(clip_visible)
-        self.clip_checkbox.setVisible(clip_visible)
-
-        section_visible['text'] = (text_visible or font_visible or font_size_visible or
-                                   font_style_visible or value_text_group_visible or
-                                   label_text_group_visible or align_visible or clip_visible or
-                                   bar_text_mode_visible or bar_text_position_visible)
-
-        # Data section
-        source_visible = visibility.get("source", False)
-        value_visible = visibility.get("value", False)
-        # Preview value only shown when source is "static"
-        is_static = self.get_selected_source() == "static" if self.current_element else True
-        show_preview_value = value_visible and is_static
 
-        self.source_label.setVisible(source_visible)
-        self.source_combo.setVisible(source_visible)
+        # Preview value only shown when source is "static"
+        is_static = self.get_selected_source() == "static" if el else True
+        show_preview_value = v.value and is_static
+        if show_preview_value:
+            bits |= _VIS_BITS['preview_value']
         self.value_label.setVisible(show_preview_value)
         self.value_spin.setVisible(show_preview_value)
 
-        section_visible['data'] = source_visible or show_preview_value
-
-        # Media section
-        image_visible = visibility.get("image", False)
-        gif_visible = visibility.get("gif", False)
-        scale_mode_visible = visibility.get("scale_mode", False)
-
-        self.image_label.setVisible(image_visible)
-        self.image_widget.setVisible(image_visible)
-        self.scale_proportionally_label.setVisible(image_visible)
-        self.scale_proportionally_check.setVisible(image_visible)
-        self.gif_label.setVisible(gif_visible)
-        self.gif_widget.setVisible(gif_visible)
-        self.scale_mode_label.setVisible(scale_mode_visible)
-        self.scale_mode_combo.setVisible(scale_mode_visible)
-
-        section_visible['media'] = image_visible or gif_visible or scale_mode_visible
-
-        # Options section - element-specific options
-        show_background_visible = visibility.get("show_background", False)
-        show_label_visible = visibility.get("show_label", False)
-        show_gradient_visible = visibility.get("show_gradient", False)
-        line_thickness_visible = visibility.get("line_thickness", False)
-        smooth_visible = visibility.get("smooth", False)
-        rounded_corners_visible = visibility.get("rounded_corners", False)
-        auto_color_change_visible = visibility.get("auto_color_change", False)
-        animate_gauge_visible = visibility.get("animate_gauge", False)
-        gauge_rounded_ends_visible = visibility.get("gauge_rounded_ends", False)
-        time_format_visible = visibility.get("time_format", False)
-        show_am_pm_visible = visibility.get("show_am_pm", False)
-        show_seconds_visible = visibility.get("show_seconds", False)
-        show_leading_zero_visible = visibility.get("show_leading_zero", False)
-        show_seconds_hand_visible = visibility.get("show_seconds_hand", False)
-        show_clock_border_visible = visibility.get("show_clock_border", False)
-        clock_face_style_visible = visibility.get("clock_face_style", False)
-        smooth_animation_visible = visibility.get("smooth_animation", False)
-
-        self.show_background_label.setVisible(show_background_visible)
-        self.show_background_check.setVisible(show_background_visible)
-        self.show_label_label.setVisible(show_label_visible)
-        self.show_label_check.setVisible(show_label_visible)
-        self.show_gradient_label.setVisible(show_gradient_visible)
-        self.show_gradient_check.setVisible(show_gradient_visible)
-        self.line_thickness_label.setVisible(line_thickness_visible)
-        self.line_thickness_spin.setVisible(line_thickness_visible)
-        self.smooth_label.setVisible(smooth_visible)
-        self.smooth_check.setVisible(smooth_visible)
-        self.rounded_corners_label.setVisible(rounded_corners_visible)
-        self.rounded_corners_check.setVisible(rounded_corners_visible)
-
-        # Bar border options - visible for bar gauge, sub-options depend on checkbox
-        bar_border_visible = visibility.get("bar_border", False)
-        bar_border_enabled = self.bar_border_check.isChecked() if bar_border_visible else False
-        self.bar_border_label.setVisible(bar_border_visible)
-        self.bar_border_check.setVisible(bar_border_visible)
-        self.bar_border_group.setVisible(bar_border_visible and bar_border_enabled)
+        # Bar border sub-options depend on the checkbox
+        self.bar_border_group.setVisible(v.bar_border and self.bar_border_check.isChecked())
 
         # Temperature hide unit option - visible only for temperature sources
-        temp_sources = ["cpu_temp", "gpu_temp"]
-        current_source = getattr(self.current_element, 'source', 'static') if self.current_element else 'static'
-        temp_hide_unit_visible = current_source in temp_sources
+        temp_hide_unit_visible = el_source in _TEMP_SOURCES
+        if temp_hide_unit_visible:
+            bits |= _VIS_BITS['temp_hide_unit']
         self.temp_hide_unit_label.setVisible(temp_hide_unit_visible)
         self.temp_hide_unit_check.setVisible(temp_hide_unit_visible)
 
-        self.auto_color_change_label.setVisible(auto_color_change_visible)
-        self.auto_color_change_check.setVisible(auto_color_change_visible)
-        self.animate_gauge_label.setVisible(animate_gauge_visible)
-        self.animate_gauge_check.setVisible(animate_gauge_visible)
-        self.gauge_rounded_ends_label.setVisible(gauge_rounded_ends_visible)
-        self.gauge_rounded_ends_check.setVisible(gauge_rounded_ends_visible)
-        self.time_format_label.setVisible(time_format_visible)
-        self.time_format_combo.setVisible(time_format_visible)
-        self.show_am_pm_label.setVisible(show_am_pm_visible)
-        self.show_am_pm_check.setVisible(show_am_pm_visible)
-        self.show_seconds_label.setVisible(show_seconds_visible)
-        self.show_seconds_check.setVisible(show_seconds_visible)
-        self.show_leading_zero_label.setVisible(show_leading_zero_visible)
-        self.show_leading_zero_check.setVisible(show_leading_zero_visible)
-        self.show_seconds_hand_label.setVisible(show_seconds_hand_visible)
-        self.show_seconds_hand_check.setVisible(show_seconds_hand_visible)
-        self.show_clock_border_label.setVisible(show_clock_border_visible)
-        self.show_clock_border_check.setVisible(show_clock_border_visible)
-        self.clock_face_style_label.setVisible(clock_face_style_visible)
-        self.clock_face_style_combo.setVisible(clock_face_style_visible)
-        self.smooth_animation_label.setVisible(smooth_animation_visible)
-        self.smooth_animation_check.setVisible(smooth_animation_visible)
-
-        section_visible['options'] = (show_background_visible or show_label_visible or
-                                      show_gradient_visible or line_thickness_visible or
-                                      smooth_visible or rounded_corners_visible or
-                                      temp_hide_unit_visible or auto_color_change_visible or
-                                      animate_gauge_visible or gauge_rounded_ends_visible or
-                                      time_format_visible or
-                                      show_am_pm_visible or show_seconds_visible or
-                                      show_leading_zero_visible or show_seconds_hand_visible or
-                                      show_clock_border_visible or clock_face_style_visible or
-                                      smooth_animation_visible)
-
         # Update section header visibility
         for section, header in self.section_headers.items():
-            header.setVisible(section_visible.get(section, False))
+            header.setVisible(section in _ALWAYS_VISIBLE_SECTIONS
+                              or bool(bits & _SECTION_MASKS.get(section, 0)))
 
     def set_element(self, element):
+        # Don't lose an edit still waiting on the coalescing timer
+        self.flush_pending_changes()
         self.current_element = None
         self.multi_selection_elements = []
         self.multi_selection_indices = []
+        self._multi_selection_key = None
 
         # Batch visibility updates to prevent flicker
         self.setUpdatesEnabled(False)
@@ -1987,430 +2233,147 @@ class PropertiesPanel(QWidget):
 
         self.setUpdatesEnabled(True)
 
-        self.update_visible_fields(element.type)
-
-        self.name_edit.blockSignals(True)
-        self.x_spin.blockSignals(True)
-        self.y_spin.blockSignals(True)
-        self.width_spin.blockSignals(True)
-        self.height_spin.blockSignals(True)
-        self.border_radius_spin.blockSignals(True)
-        self.glass_effect_check.blockSignals(True)
-        self.glass_blur_spin.blockSignals(True)
-        self.glass_opacity_spin.blockSignals(True)
-        self.radius_spin.blockSignals(True)
-        self.text_edit.blockSignals(True)
-        self.label_text_edit.blockSignals(True)
-        self.font_family_combo.blockSignals(True)
-        self.font_size_spin.blockSignals(True)
-        self.bold_checkbox.blockSignals(True)
-        self.italic_checkbox.blockSignals(True)
-        self.align_left_btn.blockSignals(True)
-        self.align_center_btn.blockSignals(True)
-        self.align_right_btn.blockSignals(True)
-        self.clip_checkbox.blockSignals(True)
-        self.source_combo.blockSignals(True)
-        self.value_spin.blockSignals(True)
-        self.image_path_edit.blockSignals(True)
-        self.scale_proportionally_check.blockSignals(True)
-        self.show_background_check.blockSignals(True)
-        self.show_label_check.blockSignals(True)
-        self.show_gradient_check.blockSignals(True)
-        self.line_thickness_spin.blockSignals(True)
-        self.smooth_check.blockSignals(True)
-        self.rounded_corners_check.blockSignals(True)
-        self.bar_border_check.blockSignals(True)
-        self.bar_border_width_spin.blockSignals(True)
-        self.bar_border_position_combo.blockSignals(True)
-        self.gradient_fill_check.blockSignals(True)
-        self.auto_color_change_check.blockSignals(True)
-        self.animate_gauge_check.blockSignals(True)
-        self.gauge_rounded_ends_check.blockSignals(True)
-        self.label_font_size_spin.blockSignals(True)
-        self.label_font_family_combo.blockSignals(True)
-        self.label_bold_checkbox.blockSignals(True)
-        self.label_italic_checkbox.blockSignals(True)
-        self.temp_hide_unit_check.blockSignals(True)
-        self.gif_path_edit.blockSignals(True)
-        self.scale_mode_combo.blockSignals(True)
-        self.bar_text_mode_combo.blockSignals(True)
-        self.bar_text_position_combo.blockSignals(True)
-        self.time_format_combo.blockSignals(True)
-        self.show_am_pm_check.blockSignals(True)
-        self.show_seconds_check.blockSignals(True)
-        self.show_leading_zero_check.blockSignals(True)
-        self.show_seconds_hand_check.blockSignals(True)
-        self.show_clock_border_check.blockSignals(True)
-        self.clock_face_style_combo.blockSignals(True)
-        self.smooth_animation_check.blockSignals(True)
-
-        self.name_edit.setText(element.name)
-        self.x_spin.setValue(element.x)
-        self.y_spin.setValue(element.y)
-        self.width_spin.setValue(element.width)
-        self.height_spin.setValue(element.height)
-        self.border_radius_spin.setValue(getattr(element, 'border_radius', 0))
-        self.glass_effect_check.setChecked(getattr(element, 'glass_effect', False))
-        self.glass_blur_spin.setValue(getattr(element, 'glass_blur', 10))
-        self.glass_opacity_spin.setValue(getattr(element, 'glass_opacity', 50))
-        self.radius_spin.setValue(element.radius)
-        self.text_edit.setText(element.text)
-        self.label_text_edit.setText(element.text)  # For circle gauge label
-        self.font_size_spin.setValue(element.font_size)
-        self.value_spin.setValue(element.value)
-        self.image_path_edit.setText(element.image_path)
-        self.clip_checkbox.setChecked(element.clip)
-        self.scale_proportionally_check.setChecked(element.scale_proportionally)
-        self.show_background_check.setChecked(element.show_background)
-        self.show_label_check.setChecked(element.show_label)
-        self.show_gradient_check.setChecked(element.show_gradient)
-        self.line_thickness_spin.setValue(getattr(element, 'line_thickness', 2))
-        self.smooth_check.setChecked(getattr(element, 'smooth', False))
-        self.rounded_corners_check.setChecked(element.rounded_corners)
-        # Load bar border settings
-        self.bar_border_check.setChecked(getattr(element, 'bar_border', False))
-        self.bar_border_width_spin.setValue(getattr(element, 'bar_border_width', 2))
-        bar_border_color = getattr(element, 'bar_border_color', '#ffffff')
-        self.bar_border_color_btn.setStyleSheet(f"background-color: {bar_border_color};")
-        # Load border position
-        border_position = getattr(element, 'bar_border_position', 'center')
-        pos_idx = self.bar_border_position_combo.findData(border_position)
-        if pos_idx >= 0:
-            self.bar_border_position_combo.setCurrentIndex(pos_idx)
-        # Show/hide group based on checkbox
-        self.bar_border_group.setVisible(getattr(element, 'bar_border', False))
-        self.gradient_fill_check.setChecked(element.gradient_fill)
-        # Load gradient stops
-        gradient_stops = getattr(element, 'gradient_stops', [(0.0, "#00ff96"), (1.0, "#ff4444")])
-        self.gradient_preview.set_gradient(gradient_stops)
-        self.auto_color_change_check.setChecked(getattr(element, 'auto_color_change', True))
-        self.animate_gauge_check.setChecked(getattr(element, 'animate_gauge', False))
-        self.gauge_rounded_ends_check.setChecked(getattr(element, 'gauge_rounded_ends', False))
-        self.label_font_size_spin.setValue(getattr(element, 'label_font_size', 16))
-        self.label_font_family_combo.setCurrentText(getattr(element, 'label_font_family', 'Arial'))
-        self.label_bold_checkbox.setChecked(getattr(element, 'label_font_bold', False))
-        self.label_italic_checkbox.setChecked(getattr(element, 'label_font_italic', False))
-        self.temp_hide_unit_check.setChecked(getattr(element, 'temp_hide_unit', False))
+        el_type = element.type
+        el_color = element.color
 
-        # GIF options
-        self.gif_path_edit.setText(getattr(element, 'gif_path', ''))
-        scale_mode = getattr(element, 'scale_mode', 'fit')
-        scale_idx = self.scale_mode_combo.findData(scale_mode)
-        if scale_idx >= 0:
-            self.scale_mode_combo.setCurrentIndex(scale_idx)
-
-        # Bar gauge text options
-        bar_text_mode = getattr(element, 'bar_text_mode', 'full')
-        bar_text_mode_idx = self.bar_text_mode_combo.findData(bar_text_mode)
-        if bar_text_mode_idx >= 0:
-            self.bar_text_mode_combo.setCurrentIndex(bar_text_mode_idx)
-
-        bar_text_position = getattr(element, 'bar_text_position', 'inside')
-        bar_text_position_idx = self.bar_text_position_combo.findData(bar_text_position)
-        if bar_text_position_idx >= 0:
-            self.bar_text_position_combo.setCurrentIndex(bar_text_position_idx)
+        # Read attributes straight from the instance dict; one snapshot per call
+        d = getattr(element, '__dict__', None) or {}
 
-        # Digital clock time format options
-        time_format = getattr(element, 'time_format', '24h')
-        time_format_idx = self.time_format_combo.findData(time_format)
-        if time_format_idx >= 0:
-            self.time_format_combo.setCurrentIndex(time_format_idx)
-        self.show_am_pm_check.setChecked(getattr(element, 'show_am_pm', True))
-        self.show_seconds_check.setChecked(getattr(element, 'show_seconds', True))
-        self.show_leading_zero_check.setChecked(getattr(element, 'show_leading_zero', True))
+        with _blocked(*self._managed_widgets):
+            for attr, widget, kind, default in self._field_bindings:
+                _FIELD_SETTERS[kind](widget, d.get(attr, default))
 
-        # Analog clock options
-        self.show_seconds_hand_check.setChecked(getattr(element, 'show_seconds_hand', True))
-        self.show_clock_border_check.setChecked(getattr(element, 'show_clock_border', True))
-        clock_face_style = getattr(element, 'clock_face_style', 'numbers')
-        clock_face_style_idx = self.clock_face_style_combo.findData(clock_face_style)
-        if clock_face_style_idx >= 0:
-            self.clock_face_style_combo.setCurrentIndex(clock_face_style_idx)
-        self.smooth_animation_check.setChecked(getattr(element, 'smooth_animation', True))
-
-        idx = self.font_family_combo.findText(element.font_family)
-        if idx >= 0:
-            self.font_family_combo.setCurrentIndex(idx)
-        else:
-            self.font_family_combo.setCurrentIndex(0)
-
-        self.bold_checkbox.setChecked(element.font_bold)
-        self.italic_checkbox.setChecked(element.font_italic)
-
-        self.align_left_btn.setChecked(element.text_align == "left")
-        self.align_center_btn.setChecked(element.text_align == "center")
-        self.align_right_btn.setChecked(element.text_align == "right")
-
-        self.color_btn.setStyleSheet(f"background-color: {element.color};")
-        self.bg_color_btn.setStyleSheet(f"background-color: {element.background_color};")
-
-        # Value and label text colors
-        value_text_color = getattr(element, 'text_color', element.color)
-        self.value_text_color_btn.setStyleSheet(f"background-color: {value_text_color};")
-        label_text_color = getattr(element, 'label_text_color', element.color)
-        self.label_text_color_btn.setStyleSheet(f"background-color: {label_text_color};")
-
-        self.set_source_by_id(element.source)
-
-        self.name_edit.blockSignals(False)
-        self.x_spin.blockSignals(False)
-        self.y_spin.blockSignals(False)
-        self.width_spin.blockSignals(False)
-        self.height_spin.blockSignals(False)
-        self.border_radius_spin.blockSignals(False)
-        self.glass_effect_check.blockSignals(False)
-        self.glass_blur_spin.blockSignals(False)
-        self.glass_opacity_spin.blockSignals(False)
-        self.radius_spin.blockSignals(False)
-        self.text_edit.blockSignals(False)
-        self.label_text_edit.blockSignals(False)
-        self.font_family_combo.blockSignals(False)
-        self.font_size_spin.blockSignals(False)
-        self.bold_checkbox.blockSignals(False)
-        self.italic_checkbox.blockSignals(False)
-        self.align_left_btn.blockSignals(False)
-        self.align_center_btn.blockSignals(False)
-        self.align_right_btn.blockSignals(False)
-        self.clip_checkbox.blockSignals(False)
-        self.source_combo.blockSignals(False)
-        self.value_spin.blockSignals(False)
-        self.image_path_edit.blockSignals(False)
-        self.scale_proportionally_check.blockSignals(False)
-        self.show_background_check.blockSignals(False)
-        self.show_label_check.blockSignals(False)
-        self.show_gradient_check.blockSignals(False)
-        self.line_thickness_spin.blockSignals(False)
-        self.smooth_check.blockSignals(False)
-        self.rounded_corners_check.blockSignals(False)
-        self.bar_border_check.blockSignals(False)
-        self.bar_border_width_spin.blockSignals(False)
-        self.bar_border_position_combo.blockSignals(False)
-        self.gradient_fill_check.blockSignals(False)
-        self.auto_color_change_check.blockSignals(False)
-        self.animate_gauge_check.blockSignals(False)
-        self.gauge_rounded_ends_check.blockSignals(False)
-        self.label_font_size_spin.blockSignals(False)
-        self.label_font_family_combo.blockSignals(False)
-        self.label_bold_checkbox.blockSignals(False)
-        self.label_italic_checkbox.blockSignals(False)
-        self.temp_hide_unit_check.blockSignals(False)
-        self.gif_path_edit.blockSignals(False)
-        self.scale_mode_combo.blockSignals(False)
-        self.bar_text_mode_combo.blockSignals(False)
-        self.bar_text_position_combo.blockSignals(False)
-        self.time_format_combo.blockSignals(False)
-        self.show_am_pm_check.blockSignals(False)
-        self.show_seconds_check.blockSignals(False)
-        self.show_leading_zero_check.blockSignals(False)
-        self.show_seconds_hand_check.blockSignals(False)
-        self.show_clock_border_check.blockSignals(False)
-        self.clock_face_style_combo.blockSignals(False)
-        self.smooth_animation_check.blockSignals(False)
+            _set_text(self.text_edit, element.text)
+            _set_text(self.label_text_edit, element.text)  # For circle gauge label
+
+            _set_combo_index(self.font_family_combo, self._font_index.get(element.font_family, 0))
+
+            _set_check(self.align_left_btn, element.text_align == "left")
+            _set_check(self.align_center_btn, element.text_align == "center")
+            _set_check(self.align_right_btn, element.text_align == "right")
+
+            # Show/hide border group based on checkbox
+            self.bar_border_group.setVisible(d.get('bar_border', False))
+            # Load gradient stops
+            gradient_stops = d.get('gradient_stops', _DEFAULT_GRADIENT)
+            self.gradient_preview.set_gradient(gradient_stops)
+
+            _set_button_color(self.color_btn, el_color)
+            _set_button_color(self.bg_color_btn, element.background_color)
+            bar_border_color = d.get('bar_border_color', '#ffffff')
+            _set_button_color(self.bar_border_color_btn, bar_border_color)
+
+            # Value and label text colors
+            value_text_color = d.get('text_color', el_color)
+            _set_button_color(self.value_text_color_btn, value_text_color)
+            label_text_color = d.get('label_text_color', el_color)
+            _set_button_color(self.label_text_color_btn, label_text_color)
+
+            self.set_source_by_id(element.source)
 
         self.current_element = element
         self._undo_state_saved = False
 
-        # Re-run visibility now that all values are set (needed for gradient fill, etc.)
-        self.update_visible_fields(element.type)
+        # Single visibility pass, after the values it reads (gradient fill,
+        # bar border, source) have been loaded into the widgets
+        self.update_visible_fields(el_type)
 
         # Enable/disable controls based on locked state
         self.set_controls_enabled(not element.locked)
 
     def set_controls_enabled(self, enabled):
         """Enable or disable all property controls."""
-        # Name is always editable to allow renaming locked elements
-        # self.name_edit.setEnabled(enabled)
-
-        # Position and size
-        self.x_spin.setEnabled(enabled)
-        self.y_spin.setEnabled(enabled)
-        self.width_spin.setEnabled(enabled)
-        self.height_spin.setEnabled(enabled)
-        self.border_radius_spin.setEnabled(enabled)
-        self.glass_effect_check.setEnabled(enabled)
-        self.glass_blur_spin.setEnabled(enabled)
-        self.glass_opacity_spin.setEnabled(enabled)
-        self.radius_spin.setEnabled(enabled)
-
-        # Colors
-        self.color_btn.setEnabled(enabled)
-        self.bg_color_btn.setEnabled(enabled)
-        self.value_text_color_btn.setEnabled(enabled)
-        self.label_text_color_btn.setEnabled(enabled)
-
-        # Text properties
-        self.text_edit.setEnabled(enabled)
-        self.label_text_edit.setEnabled(enabled)
-        self.font_family_combo.setEnabled(enabled)
-        self.font_size_spin.setEnabled(enabled)
-        self.bold_checkbox.setEnabled(enabled)
-        self.italic_checkbox.setEnabled(enabled)
-        self.align_left_btn.setEnabled(enabled)
-        self.align_center_btn.setEnabled(enabled)
-        self.align_right_btn.setEnabled(enabled)
-        self.clip_checkbox.setEnabled(enabled)
-
-        # Source and value
-        self.source_combo.setEnabled(enabled)
-        self.value_spin.setEnabled(enabled)
-
-        # Image properties
-        self.image_path_edit.setEnabled(enabled)
-        self.image_browse_btn.setEnabled(enabled)
-        self.scale_proportionally_check.setEnabled(enabled)
-
-        # Line chart options
-        self.show_background_check.setEnabled(enabled)
-        self.show_label_check.setEnabled(enabled)
-        self.show_gradient_check.setEnabled(enabled)
-        self.line_thickness_spin.setEnabled(enabled)
-        self.smooth_check.setEnabled(enabled)
-
-        # Bar gauge options
-        self.rounded_corners_check.setEnabled(enabled)
-        self.bar_border_check.setEnabled(enabled)
-        self.bar_border_width_spin.setEnabled(enabled)
-        self.bar_border_color_btn.setEnabled(enabled)
-        self.bar_border_position_combo.setEnabled(enabled)
-        self.gradient_fill_check.setEnabled(enabled)
-        self.bar_text_mode_combo.setEnabled(enabled)
-        self.bar_text_position_combo.setEnabled(enabled)
-        self.auto_color_change_check.setEnabled(enabled)
-        self.animate_gauge_check.setEnabled(enabled)
-        self.gauge_rounded_ends_check.setEnabled(enabled)
-
-        # GIF options
-        self.gif_path_edit.setEnabled(enabled)
-        self.gif_browse_btn.setEnabled(enabled)
-        self.scale_mode_combo.setEnabled(enabled)
-
-        # Digital clock time format options
-        self.time_format_combo.setEnabled(enabled)
-        self.show_am_pm_check.setEnabled(enabled)
-        self.show_seconds_check.setEnabled(enabled)
-        self.show_leading_zero_check.setEnabled(enabled)
-
-        # Analog clock options
-        self.show_seconds_hand_check.setEnabled(enabled)
-        self.show_clock_border_check.setEnabled(enabled)
-        self.clock_face_style_combo.setEnabled(enabled)
-        self.smooth_animation_check.setEnabled(enabled)
+        for widget in self._lockable_widgets:
+            widget.setEnabled(enabled)
 
     def on_property_changed(self):
-        if self.current_element is None:
+        """Schedule a write-back of the widget values to the current element."""
+        if self.current_element is not None:
+            self._flush_timer.start()
+
+    def flush_pending_changes(self):
+        """Apply any scheduled property write-back immediately."""
+        if self._flush_timer.isActive():
+            self._flush_timer.stop()
+            self._flush_properties()
+        if self._multi_timer.isActive():
+            self._multi_timer.stop()
+            self._apply_multi_changes()
+
+    def _maybe_snapshot(self):
+        """Emit property_will_change once per edit session so undo gets one snapshot."""
+        if not self._undo_state_saved:
+            self.property_will_change.emit()
+            self._undo_state_saved = True
+
+    def _flush_properties(self):
+        el = self.current_element
+        if el is None:
             return
 
         # Don't allow changes to locked elements
-        if self.current_element.locked:
+        if el.locked:
             return
 
-        # Save undo state before first change
-        if not self._undo_state_saved:
-            self.property_will_change.emit()
-            self._undo_state_saved = True
+        new_values = {}
+        for attr, widget, kind, default in self._field_bindings:
+            value = _FIELD_GETTERS[kind](widget)
+            if kind == 'combo_data' and not value:
+                value = default
+            new_values[attr] = value
 
-        self.current_element.name = self.name_edit.text()
-        self.current_element.x = self.x_spin.value()
-        self.current_element.y = self.y_spin.value()
-        self.current_element.width = self.width_spin.value()
-        self.current_element.height = self.height_spin.value()
-        self.current_element.border_radius = self.border_radius_spin.value()
-        self.current_element.glass_effect = self.glass_effect_check.isChecked()
-        self.current_element.glass_blur = self.glass_blur_spin.value()
-        self.current_element.glass_opacity = self.glass_opacity_spin.value()
-        self.current_element.radius = self.radius_spin.value()
         # For circle_gauge and bar_gauge, use label_text_edit; for others use text_edit
-        if self.current_element.type in ["circle_gauge", "bar_gauge"]:
-            self.current_element.text = self.label_text_edit.text()
+        if el.type in _LABEL_TEXT_TYPES:
+            new_values['text'] = self.label_text_edit.text()
         else:
-            self.current_element.text = self.text_edit.text()
-        self.current_element.font_family = self.font_family_combo.currentText()
-        self.current_element.font_size = self.font_size_spin.value()
-        self.current_element.font_bold = self.bold_checkbox.isChecked()
-        self.current_element.font_italic = self.italic_checkbox.isChecked()
-        self.current_element.clip = self.clip_checkbox.isChecked()
+            new_values['text'] = self.text_edit.text()
+        new_values['font_family'] = self.font_family_combo.currentText()
 
         if self.align_left_btn.isChecked():
-            self.current_element.text_align = "left"
+            new_values['text_align'] = "left"
         elif self.align_right_btn.isChecked():
-            self.current_element.text_align = "right"
+            new_values['text_align'] = "right"
         else:
-            self.current_element.text_align = "center"
+            new_values['text_align'] = "center"
 
         # Source is handled by on_source_changed, but sync here for safety
-        self.current_element.source = self.get_selected_source()
-        self.current_element.value = self.value_spin.value()
-        self.current_element.image_path = self.image_path_edit.text()
-        self.current_element.scale_proportionally = self.scale_proportionally_check.isChecked()
-
-        # Line chart options
-        self.current_element.show_background = self.show_background_check.isChecked()
-        self.current_element.show_label = self.show_label_check.isChecked()
-        self.current_element.show_gradient = self.show_gradient_check.isChecked()
-        self.current_element.line_thickness = self.line_thickness_spin.value()
-        self.current_element.smooth = self.smooth_check.isChecked()
-
-        # Bar gauge options
-        self.current_element.rounded_corners = self.rounded_corners_check.isChecked()
-        self.current_element.bar_border = self.bar_border_check.isChecked()
-        self.current_element.bar_border_width = self.bar_border_width_spin.value()
-        self.current_element.bar_border_position = self.bar_border_position_combo.currentData() or 'center'
-        self.current_element.gradient_fill = self.gradient_fill_check.isChecked()
-        self.current_element.bar_text_mode = self.bar_text_mode_combo.currentData() or 'full'
-        self.current_element.bar_text_position = self.bar_text_position_combo.currentData() or 'inside'
-
-        # Gauge options
-        self.current_element.auto_color_change = self.auto_color_change_check.isChecked()
-        self.current_element.animate_gauge = self.animate_gauge_check.isChecked()
-        self.current_element.gauge_rounded_ends = self.gauge_rounded_ends_check.isChecked()
-
-        # Circle gauge label font options
-        self.current_element.label_font_size = self.label_font_size_spin.value()
-        self.current_element.label_font_family = self.label_font_family_combo.currentText()
-        self.current_element.label_font_bold = self.label_bold_checkbox.isChecked()
-        self.current_element.label_font_italic = self.label_italic_checkbox.isChecked()
-
-        # Temperature display options
-        self.current_element.temp_hide_unit = self.temp_hide_unit_check.isChecked()
-
-        # GIF options
-        self.current_element.gif_path = self.gif_path_edit.text()
-        self.current_element.scale_mode = self.scale_mode_combo.currentData() or 'fit'
-
-        # Digital clock time format options
-        self.current_element.time_format = self.time_format_combo.currentData() or '24h'
-        self.current_element.show_am_pm = self.show_am_pm_check.isChecked()
-        self.current_element.show_seconds = self.show_seconds_check.isChecked()
-        self.current_element.show_leading_zero = self.show_leading_zero_check.isChecked()
-
-        # Analog clock options
-        self.current_element.show_seconds_hand = self.show_seconds_hand_check.isChecked()
-        self.current_element.show_clock_border = self.show_clock_border_check.isChecked()
-        self.current_element.clock_face_style = self.clock_face_style_combo.currentData() or 'numbers'
-        self.current_element.smooth_animation = self.smooth_animation_check.isChecked()
+        new_values['source'] = self.get_selected_source()
 
         # Handle proportional scaling for images
-        if self.current_element.type == "image" and self.current_element.scale_proportionally:
+        aspect_ratio = el.aspect_ratio
+        if el.type == "image" and new_values['scale_proportionally'] and aspect_ratio > 0:
             # Check which dimension changed and adjust the other
             if hasattr(self, '_last_width') and hasattr(self, '_last_height'):
-                if self._last_width != self.width_spin.value() and self.current_element.aspect_ratio > 0:
+                if self._last_width != new_values['width']:
                     # Width changed, adjust height
-                    new_height = int(self.width_spin.value() / self.current_element.aspect_ratio)
-                    self.height_spin.blockSignals(True)
-                    self.height_spin.setValue(new_height)
-                    self.current_element.height = new_height
-                    self.height_spin.blockSignals(False)
-                elif self._last_height != self.height_spin.value() and self.current_element.aspect_ratio > 0:
+                    new_height = int(new_values['width'] / aspect_ratio)
+                    with _blocked(self.height_spin):
+                        self.height_spin.setValue(new_height)
+                    new_values['height'] = new_height
+                elif self._last_height != new_values['height']:
                     # Height changed, adjust width
-                    new_width = int(self.height_spin.value() * self.current_element.aspect_ratio)
-                    self.width_spin.blockSignals(True)
-                    self.width_spin.setValue(new_width)
-                    self.current_element.width = new_width
-                    self.width_spin.blockSignals(False)
+                    new_width = int(new_values['height'] * aspect_ratio)
+                    with _blocked(self.width_spin):
+                        self.width_spin.setValue(new_width)
+                    new_values['width'] = new_width
 
         self._last_width = self.width_spin.value()
         self._last_height = self.height_spin.value()
 
+        # Only write back (and notify) what actually changed
+        changes = {
+            attr: value for attr, value in new_values.items()
+            if getattr(el, attr, _MISSING) != value
+        }
+        if not changes:
+            return
+
+        # Save undo state before first change
+        self._maybe_snapshot()
+
+        for attr, value in changes.items():
+            setattr(el, attr, value)
+
         self.property_changed.emit()
 
     def choose_color(self):
@@ -2425,10 +2388,11 @@ class PropertiesPanel(QWidget):
         )
 
         if dialog.exec() == QDialog.DialogCode.Accepted:
+            self._maybe_snapshot()
             color = dialog.get_color()
             self.current_element.color = color.name()
             self.current_element.color_opacity = dialog.get_opacity()
-            self.color_btn.setStyleSheet(f"background-color: {color.name()};")
+            _set_button_color(self.color_btn, color.name())
             self.property_changed.emit()
 
     def choose_bg_color(self):
@@ -2443,10 +2407,11 @@ class PropertiesPanel(QWidget):
         )
 
         if dialog.exec() == QDialog.DialogCode.Accepted:
+            self._maybe_snapshot()
             color = dialog.get_color()
             self.current_element.background_color = color.name()
             self.current_element.background_color_opacity = dialog.get_opacity()
-            self.bg_color_btn.setStyleSheet(f"background-color: {color.name()};")
+            _set_button_color(self.bg_color_btn, color.name())
             self.property_changed.emit()
 
     def choose_value_text_color(self):
@@ -2455,17 +2420,18 @@ class PropertiesPanel(QWidget):
         if self.current_element.locked:
             return
 
-        text_color = getattr(self.current_element, 'text_color', self.current_element.color)
+        text_color = getattr(self.current_element, 'text_color', None) or self.current_element.color
         opacity = getattr(self.current_element, 'text_color_opacity', 100)
         dialog = ColorPickerDialog(
             text_color, opacity, "Select Value Text Color", self
         )
 
         if dialog.exec() == QDialog.DialogCode.Accepted:
+            self._maybe_snapshot()
             color = dialog.get_color()
             self.current_element.text_color = color.name()
             self.current_element.text_color_opacity = dialog.get_opacity()
-            self.value_text_color_btn.setStyleSheet(f"background-color: {color.name()};")
+            _set_button_color(self.value_text_color_btn, color.name())
             self.property_changed.emit()
 
     def choose_label_text_color(self):
@@ -2474,16 +2440,17 @@ class PropertiesPanel(QWidget):
         if self.current_element.locked:
             return
 
-        label_text_color = getattr(self.current_element, 'label_text_color', self.current_element.color)
+        label_text_color = getattr(self.current_element, 'label_text_color', None) or self.current_element.color
         opacity = getattr(self.current_element, 'text_color_opacity', 100)
         dialog = ColorPickerDialog(
             label_text_color, opacity, "Select Label Text Color", self
         )
 
         if dialog.exec() == QDialog.DialogCode.Accepted:
+            self._maybe_snapshot()
             color = dialog.get_color()
             self.current_element.label_text_color = color.name()
-            self.label_text_color_btn.setStyleSheet(f"background-color: {color.name()};")
+            _set_button_color(self.label_text_color_btn, color.name())
             self.property_changed.emit()
 
     def on_gradient_fill_changed(self, state):
@@ -2492,12 +2459,10 @@ class PropertiesPanel(QWidget):
         if self.current_element.locked:
             return
 
+        self._maybe_snapshot()
         use_gradient = state == Qt.CheckState.Checked.value
         self.current_element.gradient_fill = use_gradient
 
-        # Batch visibility updates to prevent flicker
-        self.setUpdatesEnabled(False)
-
         # Show/hide color button vs gradient preview
         self.color_label.setVisible(not use_gradient)
         self.color_btn.setVisible(not use_gradient)
@@ -2506,11 +2471,10 @@ class PropertiesPanel(QWidget):
 
         # Update gradient preview when enabled
         if use_gradient:
-            gradient_stops = getattr(self.current_element, 'gradient_stops', [(0.0, "#00ff96"), (1.0, "#ff4444")])
+            gradient_stops = getattr(self.current_element, 'gradient_stops', None) or list(_DEFAULT_GRADIENT)
             self.current_element.gradient_stops = gradient_stops
             self.gradient_preview.set_gradient(gradient_stops)
 
-        self.setUpdatesEnabled(True)
         self.property_changed.emit()
 
     def choose_bar_border_color(self):
@@ -2526,10 +2490,11 @@ class PropertiesPanel(QWidget):
         )
 
         if dialog.exec() == QDialog.DialogCode.Accepted:
+            self._maybe_snapshot()
             color = dialog.get_color()
             self.current_element.bar_border_color = color.name()
             self.current_element.bar_border_opacity = dialog.get_opacity()
-            self.bar_border_color_btn.setStyleSheet(f"background-color: {color.name()};")
+            _set_button_color(self.bar_border_color_btn, color.name())
             self.property_changed.emit()
 
     def on_bar_border_changed(self, state):
@@ -2538,6 +2503,7 @@ class PropertiesPanel(QWidget):
         if self.current_element.locked:
             return
 
+        self._maybe_snapshot()
         show_border = state == Qt.CheckState.Checked.value
         self.current_element.bar_border = show_border
 
@@ -2552,14 +2518,12 @@ class PropertiesPanel(QWidget):
         if self.current_element.locked:
             return
 
-        current_stops = getattr(self.current_element, 'gradient_stops', [(0.0, "#00ff96"), (1.0, "#ff4444")])
+        current_stops = getattr(self.current_element, 'gradient_stops', _DEFAULT_GRADIENT)
         dialog = GradientEditorDialog(list(current_stops), "Edit Gradient", self)
 
         if dialog.exec() == QDialog.DialogCode.Accepted:
             # Save undo state before change
-            if not self._undo_state_saved:
-                self.property_will_change.emit()
-                self._undo_state_saved = True
+            self._maybe_snapshot()
 
             new_stops = dialog.get_stops()
             self.current_element.gradient_stops = new_stops
@@ -2567,113 +2531,109 @@ class PropertiesPanel(QWidget):
             self.property_changed.emit()
 
     def browse_gif(self):
+        if self.current_element is not None and self.current_element.locked:
+            return
+
         path, _ = QFileDialog.getOpenFileName(
             self, "Select GIF", "",
             "GIF Images (*.gif)"
         )
         if path:
+            # Snapshot for undo before the size is written to the element
+            self.flush_pending_changes()
+            if self.current_element:
+                self._maybe_snapshot()
             self.gif_path_edit.setText(path)
 
             # Get GIF dimensions and set element size to match
             if self.current_element:
                 try:
-                    from PIL import Image
-                    gif = Image.open(path)
-                    img_width, img_height = gif.size
-
                     # Set dimensions (capped at display size)
-                    max_width = min(img_width, DISPLAY_WIDTH)
-                    max_height = min(img_height, DISPLAY_HEIGHT)
-
-                    if img_width > max_width or img_height > max_height:
-                        scale = min(max_width / img_width, max_height / img_height)
-                        img_width = int(img_width * scale)
-                        img_height = int(img_height * scale)
+                    img_width, img_height, _ = _fit_within(*_read_image_size(path))
 
                     self.current_element.width = img_width
                     self.current_element.height = img_height
 
-                    self.width_spin.blockSignals(True)
-                    self.height_spin.blockSignals(True)
-                    self.width_spin.setValue(img_width)
-                    self.height_spin.setValue(img_height)
-                    self.width_spin.blockSignals(False)
-                    self.height_spin.blockSignals(False)
-                except Exception as e:
+                    _set_spins((self.width_spin, img_width), (self.height_spin, img_height))
+                except OSError as e:
+                    # Also covers PIL's UnidentifiedImageError
                     print(f"Error reading GIF dimensions: {e}")
 
     def browse_image(self):
+        if self.current_element is not None and self.current_element.locked:
+            return
+
         path, _ = QFileDialog.getOpenFileName(
             self, "Select Image", "",
             "Images (*.png *.jpg *.jpeg *.bmp *.gif)"
         )
         if path:
+            # Snapshot for undo before the size is written to the element
+            self.flush_pending_changes()
+            if self.current_element:
+                self._maybe_snapshot()
             self.image_path_edit.setText(path)
 
             # Get image dimensions and set element size to match
             if self.current_element:
-                pixmap = QPixmap(path)
-                if not pixmap.isNull():
-                    img_width = pixmap.width()
-                    img_height = pixmap.height()
-
-                    # Set aspect ratio
-                    if img_height > 0:
-                        self.current_element.aspect_ratio = img_width / img_height
-                    else:
-                        self.current_element.aspect_ratio = 1.0
+                el = self.current_element
+                # Cached per path and mtime, so this stays cheap without
+                # trusting a native size saved with the theme
+                try:
+                    img_width, img_height = _read_image_size(path)
+                except OSError:
+                    img_width = img_height = 0
+                if img_width and img_height:
+                    el.image_native_width = img_width
+                    el.image_native_height = img_height
 
                     # Set dimensions to match image (capped at display size)
-                    max_width = min(img_width, DISPLAY_WIDTH)
-                    max_height = min(img_height, DISPLAY_HEIGHT)
+                    img_width, img_height, el.aspect_ratio = _fit_within(img_width, img_height)
 
-                    # Scale down if too large while maintaining aspect ratio
-                    if img_width > max_width or img_height > max_height:
-                        scale = min(max_width / img_width, max_height / img_height)
-                        img_width = int(img_width * scale)
-                        img_height = int(img_height * scale)
-
-                    self.current_element.width = img_width
-                    self.current_element.height = img_height
+                    el.width = img_width
+                    el.height = img_height
 
                     # Update UI
-                    self.width_spin.blockSignals(True)
-                    self.height_spin.blockSignals(True)
-                    self.width_spin.setValue(img_width)
-                    self.height_spin.setValue(img_height)
+                    _set_spins((self.width_spin, img_width), (self.height_spin, img_height))
                     self._last_width = img_width
                     self._last_height = img_height
-                    self.width_spin.blockSignals(False)
-                    self.height_spin.blockSignals(False)
 
     def set_multi_selection(self, elements, indices):
         """Show alignment panel for multiple selected elements."""
+        self.flush_pending_changes()
         self.current_element = None
-        self.multi_selection_elements = elements
-        self.multi_selection_indices = indices
         self._multi_transform_updating = True  # Prevent feedback loops
 
-        self.no_selection_container.setVisible(False)
-        self.scroll_area.setVisible(False)
-        self.multi_scroll.setVisible(True)
-
-        # Check if this is a single group (all elements have same group name)
-        group_names = set(el.group for el in elements if el.group)
-        is_single_group = len(group_names) == 1 and all(el.group for el in elements)
-        group_name = list(group_names)[0] if is_single_group else ""
-
-        # Update general section
-        if is_single_group:
-            self.multi_name_value.setText(f"Group: {group_name}")
-            self.group_name_label.setVisible(True)
-            self.group_name_edit.setVisible(True)
-            self.group_name_edit.blockSignals(True)
-            self.group_name_edit.setText(group_name)
-            self.group_name_edit.blockSignals(False)
-        else:
-            self.multi_name_value.setText(f"{len(elements)} elements")
-            self.group_name_label.setVisible(False)
-            self.group_name_edit.setVisible(False)
+        # Re-selecting the same elements (e.g. during a marquee drag) only
+        # needs the bounds refreshed; the panel layout is already in place
+        selection_key = (tuple((id(el), el.group) for el in elements), tuple(indices))
+        if selection_key != self._multi_selection_key:
+            self._multi_selection_key = selection_key
+            self._undo_state_saved = False
+            self.multi_selection_elements = elements
+            self.multi_selection_indices = indices
+            self._alignment_units_cache = None
+
+            self.no_selection_container.setVisible(False)
+            self.scroll_area.setVisible(False)
+            self.multi_scroll.setVisible(True)
+
+            # Check if this is a single group (all elements have same group name)
+            group_names = set(el.group for el in elements if el.group)
+            is_single_group = len(group_names) == 1 and all(el.group for el in elements)
+            group_name = list(group_names)[0] if is_single_group else ""
+
+            # Update general section
+            if is_single_group:
+                self.multi_name_value.setText(f"Group: {group_name}")
+                self.group_name_label.setVisible(True)
+                self.group_name_edit.setVisible(True)
+                with _blocked(self.group_name_edit):
+                    self.group_name_edit.setText(group_name)
+            else:
+                self.multi_name_value.setText(f"{len(elements)} elements")
+                self.group_name_label.setVisible(False)
+                self.group_name_edit.setVisible(False)
 
         # Calculate combined bounding box
         bounds = self.get_multi_selection_bounds()
@@ -2681,20 +2641,10 @@ class PropertiesPanel(QWidget):
             x, y, w, h = bounds
             self._multi_bounds = bounds  # Store for delta calculation
 
-            self.multi_x_spin.blockSignals(True)
-            self.multi_y_spin.blockSignals(True)
-            self.multi_w_spin.blockSignals(True)
-            self.multi_h_spin.blockSignals(True)
-
-            self.multi_x_spin.setValue(int(x))
-            self.multi_y_spin.setValue(int(y))
-            self.multi_w_spin.setValue(int(w))
-            self.multi_h_spin.setValue(int(h))
-
-            self.multi_x_spin.blockSignals(False)
-            self.multi_y_spin.blockSignals(False)
-            self.multi_w_spin.blockSignals(False)
-            self.multi_h_spin.blockSignals(False)
+            _set_spins(
+                (self.multi_x_spin, int(x)), (self.multi_y_spin, int(y)),
+                (self.multi_w_spin, int(w)), (self.multi_h_spin, int(h)),
+            )
 
         self._multi_transform_updating = False
 
@@ -2703,19 +2653,7 @@ class PropertiesPanel(QWidget):
         if not self.multi_selection_elements:
             return None
 
-        min_x = float('inf')
-        min_y = float('inf')
-        max_x = float('-inf')
-        max_y = float('-inf')
-
-        for el in self.multi_selection_elements:
-            x, y, w, h = self.get_element_bounds(el)
-            min_x = min(min_x, x)
-            min_y = min(min_y, y)
-            max_x = max(max_x, x + w)
-            max_y = max(max_y, y + h)
-
-        return (min_x, min_y, max_x - min_x, max_y - min_y)
+        return _union_bounds(map(self.get_element_bounds, self.multi_selection_elements))
 
     def on_group_name_changed(self, text):
         """Handle group name change for selected group."""
@@ -2729,18 +2667,44 @@ class PropertiesPanel(QWidget):
         self.property_changed.emit()
 
     def on_multi_transform_changed(self):
-        """Handle position change for multi-selection."""
+        """Schedule a move of the multi-selection (throttled to one per frame)."""
+        if not self._multi_timer.isActive():
+            self._multi_timer.start()
+
+    def on_multi_size_changed(self):
+        """Schedule a resize of the multi-selection (throttled to one per frame)."""
+        if not self._multi_timer.isActive():
+            self._multi_timer.start()
+
+    def _end_multi_edit(self):
+        """Close a multi-selection scrub: apply what's pending, re-arm undo for the next one."""
+        self.flush_pending_changes()
+        self._undo_state_saved = False
+
+    def _apply_multi_changes(self):
+        """Apply the latest multi-selection spin box values to the elements.
+
+        Move and resize share one undo snapshot and one property_changed.
+        """
         if getattr(self, '_multi_transform_updating', False):
             return
         if not self.multi_selection_elements:
             return
-
-        # Calculate delta from previous bounds
-        old_bounds = getattr(self, '_multi_bounds', None)
-        if not old_bounds:
+        if not getattr(self, '_multi_bounds', None):
             return
 
-        old_x, old_y, old_w, old_h = old_bounds
+        # Lock state can change from the element list without the selection
+        # being re-sent, so filter once per batch rather than once per selection
+        active = [el for el in self.multi_selection_elements if not el.locked]
+        moved = self._apply_multi_transform(active)
+        resized = self._apply_multi_size(active)
+        if moved or resized:
+            self.property_changed.emit()
+
+    def _apply_multi_transform(self, active):
+        """Move the multi-selection to the position spin values. Returns True if moved."""
+        # Calculate delta from previous bounds
+        old_x, old_y, old_w, old_h = self._multi_bounds
         new_x = self.multi_x_spin.value()
         new_y = self.multi_y_spin.value()
 
@@ -2748,90 +2712,65 @@ class PropertiesPanel(QWidget):
         dy = new_y - old_y
 
         if dx == 0 and dy == 0:
-            return
+            return False
 
         # Save undo state
-        if not self._undo_state_saved:
-            self.property_will_change.emit()
-            self._undo_state_saved = True
+        self._maybe_snapshot()
 
-        # Move all elements by delta
-        for el in self.multi_selection_elements:
-            if not el.locked:
-                el.x += dx
-                el.y += dy
+        # Move all unlocked elements by delta
+        for el in active:
+            el.x += dx
+            el.y += dy
 
         # Update stored bounds
         self._multi_bounds = (new_x, new_y, old_w, old_h)
+        return True
 
-        self.property_changed.emit()
-
-    def on_multi_size_changed(self):
-        """Handle size change for multi-selection (scales elements proportionally)."""
-        if getattr(self, '_multi_transform_updating', False):
-            return
-        if not self.multi_selection_elements:
-            return
-
-        old_bounds = getattr(self, '_multi_bounds', None)
-        if not old_bounds:
-            return
-
-        old_x, old_y, old_w, old_h = old_bounds
+    def _apply_multi_size(self, active):
+        """Scale the multi-selection to the size spin values. Returns True if resized."""
+        old_x, old_y, old_w, old_h = self._multi_bounds
         new_w = self.multi_w_spin.value()
         new_h = self.multi_h_spin.value()
 
         if new_w == old_w and new_h == old_h:
-            return
+            return False
         if old_w == 0 or old_h == 0:
-            return
+            return False
 
         # Calculate scale factors
         scale_x = new_w / old_w
         scale_y = new_h / old_h
 
         # Save undo state
-        if not self._undo_state_saved:
-            self.property_will_change.emit()
-            self._undo_state_saved = True
+        self._maybe_snapshot()
 
         # Scale all elements relative to group origin
-        for el in self.multi_selection_elements:
-            if el.locked:
-                continue
-
-            bounds = self.get_element_bounds(el)
-            el_x, el_y, el_w, el_h = bounds
+        get_bounds = self.get_element_bounds
+        for el in active:
+            el_x, el_y, el_w, el_h = get_bounds(el)
 
-            # Calculate new position relative to group origin
-            rel_x = el_x - old_x
-            rel_y = el_y - old_y
-            new_el_x = old_x + rel_x * scale_x
-            new_el_y = old_y + rel_y * scale_y
-
-            # Scale size
+            # New position relative to group origin, and scaled size
+            new_el_x = old_x + (el_x - old_x) * scale_x
+            new_el_y = old_y + (el_y - old_y) * scale_y
             new_el_w = el_w * scale_x
             new_el_h = el_h * scale_y
 
             # Apply changes based on element type
-            if el.type in ["circle_gauge", "analog_clock"]:
-                el.radius = int(max(new_el_w, new_el_h) / 2)
-                el.x = int(new_el_x + el.radius)
-                el.y = int(new_el_y + el.radius)
+            if el.type in _RADIAL_TYPES:
+                radius = int(max(new_el_w, new_el_h) / 2)
+                el.radius, el.x, el.y = radius, int(new_el_x + radius), int(new_el_y + radius)
             else:
-                el.x = int(new_el_x)
-                el.y = int(new_el_y)
-                el.width = int(max(10, new_el_w))
-                el.height = int(max(10, new_el_h))
+                el.x, el.y, el.width, el.height = (
+                    int(new_el_x), int(new_el_y), int(max(10, new_el_w)), int(max(10, new_el_h))
+                )
 
         # Update stored bounds
         self._multi_bounds = (old_x, old_y, new_w, new_h)
-
-        self.property_changed.emit()
+        return True
 
     def get_element_bounds(self, element):
         """Get the bounding box for an element."""
-        if element.type in ["circle_gauge", "analog_clock"]:
+        if element.type in _RADIAL_TYPES:
             return (
                 element.x - element.radius,
                 element.y - element.radius,
@@ -2843,7 +2782,7 @@ class PropertiesPanel(QWidget):
 
     def set_element_position(self, element, x, y):
         """Set element position, accounting for circle_gauge and analog_clock center."""
-        if element.type in ["circle_gauge", "analog_clock"]:
+        if element.type in _RADIAL_TYPES:
             element.x = int(x + element.radius)
             element.y = int(y + element.radius)
         else:
@@ -2854,10 +2793,34 @@ class PropertiesPanel(QWidget):
         """
         Get alignment units - groups are treated as single units, ungrouped elements as individual units.
         Locked elements/groups are excluded from alignment.
-        Returns list of dicts: {'elements': [elements], 'bounds': (x, y, w, h)}
+        Returns a list of _Unit (elements, x, y, w, h and per-element bounds).
         """
+        # Unit membership only depends on group/lock state, so it is reused
+        # across align clicks; bounds are always read live since elements can
+        # be moved on the canvas while the selection stays the same
+        signature = tuple((el.group, el.locked) for el in self.multi_selection_elements)
+        cached = self._alignment_units_cache
+        if cached is None or cached[0] != signature:
+            cached = self._alignment_units_cache = (signature, self._compute_alignment_members())
+
+        get_bounds = self.get_element_bounds
         units = []
-        grouped = {}  # group_name -> [elements]
+        for elements in cached[1]:
+            # Per-element bounds are kept for move_unit, so each is read once
+            el_bounds = [get_bounds(el) for el in elements]
+            if len(el_bounds) == 1:
+                x, y, w, h = el_bounds[0]
+            else:
+                # Combined bounding box for the group
+                x, y, w, h = _union_bounds(el_bounds)
+            units.append(_Unit(elements, x, y, w, h, el_bounds))
+
+        return units
+
+    def _compute_alignment_members(self):
+        """Split the unlocked selection into alignment units (element lists)."""
+        members = []
+        grouped = defaultdict(list)  # group_name -> [elements]
 
         for el in self.multi_selection_elements:
             # Skip locked elements
@@ -2865,250 +2828,123 @@ class PropertiesPanel(QWidget):
                 continue
 
             if el.group:
-                if el.group not in grouped:
-                    grouped[el.group] = []
                 grouped[el.group].append(el)
             else:
                 # Ungrouped element is its own unit
-                bounds = self.get_element_bounds(el)
-                units.append({'elements': [el], 'bounds': bounds})
+                members.append([el])
 
         # Add grouped elements as single units
-        for group_name, elements in grouped.items():
-            # Calculate combined bounding box for the group
-            min_x = float('inf')
-            min_y = float('inf')
-            max_x = float('-inf')
-            max_y = float('-inf')
-
-            for el in elements:
-                x, y, w, h = self.get_element_bounds(el)
-                min_x = min(min_x, x)
-                min_y = min(min_y, y)
-                max_x = max(max_x, x + w)
-                max_y = max(max_y, y + h)
-
-            bounds = (min_x, min_y, max_x - min_x, max_y - min_y)
-            units.append({'elements': elements, 'bounds': bounds})
-
-        return units
+        members.extend(grouped.values())
+        return members
 
     def move_unit(self, unit, new_x, new_y):
         """Move an alignment unit to a new position (top-left of bounding box)."""
-        old_x, old_y, _, _ = unit['bounds']
-        dx = new_x - old_x
-        dy = new_y - old_y
+        dx = new_x - unit.x
+        dy = new_y - unit.y
 
-        for el in unit['elements']:
-            el_x, el_y, _, _ = self.get_element_bounds(el)
+        for el, (el_x, el_y, _, _) in zip(unit.elements, unit.el_bounds):
             self.set_element_position(el, el_x + dx, el_y + dy)
 
-    def align_left(self):
-        """Align all selected elements/groups to the left edge."""
-        if len(self.multi_selection_elements) < 2:
-            return
-
-        self.alignment_will_change.emit()
-        units = self.get_alignment_units()
-        if len(units) < 2:
-            self.alignment_changed.emit()
-            return
-
-        # Find minimum x across all units
-        min_x = min(unit['bounds'][0] for unit in units)
+    def _move_units_along(self, axis, units, positions):
+        """Move each unit to its new x (axis 0) or y (axis 1), keeping the other coordinate."""
+        if axis == 0:
+            for unit, pos in zip(units, positions):
+                self.move_unit(unit, pos, unit.y)
+        else:
+            for unit, pos in zip(units, positions):
+                self.move_unit(unit, unit.x, pos)
 
-        # Move each unit to align left
-        for unit in units:
-            x, y, w, h = unit['bounds']
-            self.move_unit(unit, min_x, y)
+    def _on_align_button(self, key):
+        """Dispatch an alignment/distribute button click by its action key."""
+        self.flush_pending_changes()
+        self._align_actions[key]()
 
-        self.alignment_changed.emit()
-        self.property_changed.emit()
+    def align_left(self):
+        """Align all selected elements/groups to the left edge."""
+        self._align(0, 'min')
 
     def align_h_center(self):
         """Align all selected elements/groups to horizontal center."""
-        if len(self.multi_selection_elements) < 2:
-            return
-
-        self.alignment_will_change.emit()
-        units = self.get_alignment_units()
-        if len(units) < 2:
-            self.alignment_changed.emit()
-            return
-
-        # Find the combined bounding box of all units
-        min_x = min(unit['bounds'][0] for unit in units)
-        max_x = max(unit['bounds'][0] + unit['bounds'][2] for unit in units)
-        center_x = (min_x + max_x) / 2
-
-        # Move each unit to center
-        for unit in units:
-            x, y, w, h = unit['bounds']
-            new_x = center_x - w / 2
-            self.move_unit(unit, new_x, y)
-
-        self.alignment_changed.emit()
-        self.property_changed.emit()
+        self._align(0, 'center')
 
     def align_right(self):
         """Align all selected elements/groups to the right edge."""
-        if len(self.multi_selection_elements) < 2:
-            return
-
-        self.alignment_will_change.emit()
-        units = self.get_alignment_units()
-        if len(units) < 2:
-            self.alignment_changed.emit()
-            return
-
-        # Find maximum right edge across all units
-        max_right = max(unit['bounds'][0] + unit['bounds'][2] for unit in units)
-
-        # Move each unit to align right
-        for unit in units:
-            x, y, w, h = unit['bounds']
-            self.move_unit(unit, max_right - w, y)
-
-        self.alignment_changed.emit()
-        self.property_changed.emit()
+        self._align(0, 'max')
 
     def align_top(self):
         """Align all selected elements/groups to the top edge."""
-        if len(self.multi_selection_elements) < 2:
-            return
-
-        self.alignment_will_change.emit()
-        units = self.get_alignment_units()
-        if len(units) < 2:
-            self.alignment_changed.emit()
-            return
-
-        # Find minimum y across all units
-        min_y = min(unit['bounds'][1] for unit in units)
-
-        # Move each unit to align top
-        for unit in units:
-            x, y, w, h = unit['bounds']
-            self.move_unit(unit, x, min_y)
-
-        self.alignment_changed.emit()
-        self.property_changed.emit()
+        self._align(1, 'min')
 
     def align_v_middle(self):
         """Align all selected elements/groups to vertical center."""
-        if len(self.multi_selection_elements) < 2:
-            return
-
-        self.alignment_will_change.emit()
-        units = self.get_alignment_units()
-        if len(units) < 2:
-            self.alignment_changed.emit()
-            return
-
-        # Find the combined bounding box of all units
-        min_y = min(unit['bounds'][1] for unit in units)
-        max_y = max(unit['bounds'][1] + unit['bounds'][3] for unit in units)
-        center_y = (min_y + max_y) / 2
-
-        # Move each unit to center
-        for unit in units:
-            x, y, w, h = unit['bounds']
-            new_y = center_y - h / 2
-            self.move_unit(unit, x, new_y)
-
-        self.alignment_changed.emit()
-        self.property_changed.emit()
+        self._align(1, 'center')
 
     def align_bottom(self):
         """Align all selected elements/groups to the bottom edge."""
+        self._align(1, 'max')
+
+    def _align(self, axis, mode):
+        """Line units up along x (axis 0) or y (axis 1) by their 'min' edge, 'center' or 'max' edge."""
         if len(self.multi_selection_elements) < 2:
             return
 
-        self.alignment_will_change.emit()
+        # Nothing to line up (e.g. all but one unit locked): no undo, no redraw
         units = self.get_alignment_units()
         if len(units) < 2:
-            self.alignment_changed.emit()
-            return
-
-        # Find maximum bottom edge across all units
-        max_bottom = max(unit['bounds'][1] + unit['bounds'][3] for unit in units)
-
-        # Move each unit to align bottom
-        for unit in units:
-            x, y, w, h = unit['bounds']
-            self.move_unit(unit, x, max_bottom - h)
-
-        self.alignment_changed.emit()
-        self.property_changed.emit()
-
-    def distribute_horizontal(self):
-        """Distribute elements/groups evenly horizontally."""
-        if len(self.multi_selection_elements) < 3:
             return
 
         self.alignment_will_change.emit()
-        units = self.get_alignment_units()
-        if len(units) < 3:
-            self.alignment_changed.emit()
-            return
-
-        # Sort units by x position
-        units.sort(key=lambda u: u['bounds'][0])
 
-        # Get total span
-        first_x = units[0]['bounds'][0]
-        last_unit = units[-1]
-        last_right = last_unit['bounds'][0] + last_unit['bounds'][2]
+        start_attr, size_attr = ('x', 'w') if axis == 0 else ('y', 'h')
+        starts = list(map(attrgetter(start_attr), units))
+        sizes = list(map(attrgetter(size_attr), units))
 
-        # Calculate total unit width
-        total_width = sum(u['bounds'][2] for u in units)
-
-        # Calculate gaps
-        available_space = last_right - first_x - total_width
-        gap = available_space / (len(units) - 1)
+        if mode == 'min':
+            target = min(starts)
+            new_positions = [target] * len(units)
+        elif mode == 'max':
+            target = max(map(add, starts, sizes))
+            new_positions = [target - size for size in sizes]
+        else:
+            # Center within the combined span of all units
+            center = (min(starts) + max(map(add, starts, sizes))) / 2
+            new_positions = [center - size / 2 for size in sizes]
 
-        # Position units
-        current_x = first_x
-        for unit in units:
-            x, y, w, h = unit['bounds']
-            self.move_unit(unit, current_x, y)
-            current_x += w + gap
+        self._move_units_along(axis, units, new_positions)
 
         self.alignment_changed.emit()
-        self.property_changed.emit()
+
+    def distribute_horizontal(self):
+        """Distribute elements/groups evenly horizontally."""
+        self._distribute(0)
 
     def distribute_vertical(self):
         """Distribute elements/groups evenly vertically."""
+        self._distribute(1)
+
+    def _distribute(self, axis):
+        """Space units evenly along x (axis 0) or y (axis 1), keeping the outer two in place."""
         if len(self.multi_selection_elements) < 3:
             return
 
-        self.alignment_will_change.emit()
+        # Nothing to line up (e.g. all but one unit locked): no undo, no redraw
         units = self.get_alignment_units()
         if len(units) < 3:
-            self.alignment_changed.emit()
             return
 
-        # Sort units by y position
-        units.sort(key=lambda u: u['bounds'][1])
-
-        # Get total span
-        first_y = units[0]['bounds'][1]
-        last_unit = units[-1]
-        last_bottom = last_unit['bounds'][1] + last_unit['bounds'][3]
+        self.alignment_will_change.emit()
 
-        # Calculate total unit height
-        total_height = sum(u['bounds'][3] for u in units)
+        # Sort units by position along the axis
+        start_attr, size_attr = ('x', 'w') if axis == 0 else ('y', 'h')
+        units.sort(key=attrgetter(start_attr))
+        starts = list(map(attrgetter(start_attr), units))
+        sizes = list(map(attrgetter(size_attr), units))
 
-        # Calculate gaps
-        available_space = last_bottom - first_y - total_height
-        gap = available_space / (len(units) - 1)
+        # Gap left over once the units are packed between the outer edges
+        gap = (starts[-1] + sizes[-1] - starts[0] - sum(sizes)) / (len(units) - 1)
 
-        # Position units
-        current_y = first_y
-        for unit in units:
-            x, y, w, h = unit['bounds']
-            self.move_unit(unit, x, current_y)
-            current_y += h + gap
+        # Each unit starts where the previous one ended, plus the gap
+        positions = accumulate((size + gap for size in sizes[:-1]), initial=starts[0])
+        self._move_units_along(axis, units, positions)
 
         self.alignment_changed.emit()
-        self.property_changed.emit()
@@ -4,19 +4,15 @@ Sensor monitoring using HWiNFO Shared Memory.
 Requires HWiNFO to be running with "Shared Memory Support" enabled.
 """
 
-import sys
 import threading
-import time
 
-from hwinfo_reader import (
-    get_hwinfo_reader,
-    is_hwinfo_available,
-    get_hwinfo_sensors,
-    HWiNFOReader
-)
+from hwinfo_reader import get_hwinfo_reader, get_hwinfo_sensors
 
 # Configuration
 _SENSOR_UPDATE_INTERVAL = 0.5
+# While HWiNFO is unavailable, retry after this delay, doubling up to the max
+_RECONNECT_INTERVAL = 1.0
+_RECONNECT_MAX_INTERVAL = 10.0
 
 # Track initialization state
 HAS_HWINFO = False
@@ -24,7 +20,8 @@ HWINFO_ERROR = None
 
 # Background sensor thread
 _sensor_thread = None
-_sensor_thread_running = False
+# Set to stop the polling thread; also wakes it from its inter-poll wait
+_sensor_stop = threading.Event()
 _sensor_data_lock = threading.Lock()
 _latest_sensor_data = {
     "cpu_temp": 0,
@@ -51,70 +48,77 @@ _SMOOTHED_SENSORS = {
 }
 
 
-def _apply_smoothing(raw_data):
-    """Apply exponential smoothing to sensor values that fluctuate rapidly."""
-    global _smoothed_values
-
-    smoothed = raw_data.copy()
-
+def _apply_smoothing(data):
+    """Apply exponential smoothing, in place, to sensor values that fluctuate rapidly."""
     for key in _SMOOTHED_SENSORS:
-        if key in raw_data:
-            raw_value = raw_data[key]
-            if key in _smoothed_values and _smoothed_values[key] > 0:
-                smoothed[key] = _smoothed_values[key] * (1 - _SMOOTHING_FACTOR) + raw_value * _SMOOTHING_FACTOR
-            else:
-                smoothed[key] = raw_value
-            _smoothed_values[key] = smoothed[key]
+        if key in data:
+            raw_value = data[key]
+            previous = _smoothed_values.get(key, 0)
+            if previous > 0:
+                data[key] = previous * (1 - _SMOOTHING_FACTOR) + raw_value * _SMOOTHING_FACTOR
+            _smoothed_values[key] = data[key]
 
-    return smoothed
+    return data
 
 
 def _sensor_polling_thread():
     """Background thread that continuously polls sensors from HWiNFO."""
-    global _latest_sensor_data, _sensor_thread_running, HAS_HWINFO
+    global HAS_HWINFO
 
-    while _sensor_thread_running:
+    reader = get_hwinfo_reader()
+    retry_delay = _RECONNECT_INTERVAL
+
+    while not _sensor_stop.is_set():
+        delay = _SENSOR_UPDATE_INTERVAL
         try:
-            if is_hwinfo_available():
+            # Probe availability once per poll; get_hwinfo_sensors() would probe again
+            if reader.is_available():
+                retry_delay = _RECONNECT_INTERVAL
                 if not HAS_HWINFO:
                     HAS_HWINFO = True
                     print("[Sensors] Connected to HWiNFO")
 
-                data = get_hwinfo_sensors()
+                data = reader.get_thermal_sensors()
                 if data and any(v > 0 for v in data.values()):
-                    smoothed_data = _apply_smoothing(data)
+                    # Fresh dict from the reader, so it can be smoothed in place;
+                    # the shared dict is updated rather than replaced
+                    _apply_smoothing(data)
                     with _sensor_data_lock:
-                        _latest_sensor_data = smoothed_data
+                        _latest_sensor_data.update(data)
             else:
                 if HAS_HWINFO:
                     HAS_HWINFO = False
                     print("[Sensors] Lost connection to HWiNFO")
+                # Back off instead of probing for the mapping every poll
+                delay = retry_delay
+                retry_delay = min(retry_delay * 2, _RECONNECT_MAX_INTERVAL)
 
         except Exception as e:
             print(f"[Sensors] Poll error: {e}")
 
-        time.sleep(_SENSOR_UPDATE_INTERVAL)
+        _sensor_stop.wait(delay)
 
 
 def init_sensors(app_dir=None):
     """Initialize the sensor system using HWiNFO shared memory."""
     global HAS_HWINFO, HWINFO_ERROR
-    global _sensor_thread, _sensor_thread_running, _latest_sensor_data
+    global _sensor_thread
 
     # Stop any existing thread first
-    if _sensor_thread_running:
+    if _sensor_thread is not None:
         stop_sensors()
 
     # Check if HWiNFO is available
-    if is_hwinfo_available():
+    reader = get_hwinfo_reader()
+    if reader.is_available():
         HAS_HWINFO = True
         print("[Sensors] HWiNFO shared memory detected")
 
         # Do initial read
-        initial_data = get_hwinfo_sensors()
+        initial_data = reader.get_thermal_sensors()
         if initial_data:
             with _sensor_data_lock:
-                _latest_sensor_data = initial_data.copy()
+                _latest_sensor_data.update(initial_data)
     else:
         HAS_HWINFO = False
         HWINFO_ERROR = "HWiNFO not running or shared memory not enabled"
@@ -122,7 +126,7 @@ def init_sensors(app_dir=None):
         print("[Sensors] Please start HWiNFO with 'Shared Memory Support' enabled")
 
     # Start background polling thread (will keep trying if HWiNFO starts later)
-    _sensor_thread_running = True
+    _sensor_stop.clear()
     _sensor_thread = threading.Thread(target=_sensor_polling_thread, daemon=True)
     _sensor_thread.start()
 
@@ -134,17 +138,21 @@ def init_sensors(app_dir=None):
     return HAS_HWINFO
 
 
-def get_cached_sensors():
-    """Get sensor data from background thread cache (non-blocking)."""
+def get_cached_sensors(out=None):
+    """Get sensor data from background thread cache (non-blocking).
+
+    Pass a dict as `out` to have it filled in place instead of getting a new copy.
+    """
     with _sensor_data_lock:
-        return _latest_sensor_data.copy()
+        if out is None:
+            return _latest_sensor_data.copy()
+        out.update(_latest_sensor_data)
+        return out
 
 
 def get_sensors_sync():
     """Get sensor data synchronously from HWiNFO."""
-    if is_hwinfo_available():
-        return get_hwinfo_sensors()
-    return None
+    return get_hwinfo_sensors()
 
 
 # Aliases for backwards compatibility
@@ -154,11 +162,11 @@ get_lhm_sensors_sync = get_sensors_sync
 
 def stop_sensors():
     """Stop the sensor background thread."""
-    global _sensor_thread_running, _sensor_thread, HAS_HWINFO
+    global _sensor_thread, HAS_HWINFO
 
     print("[Sensors] Stopping sensor monitoring...")
 
-    _sensor_thread_running = False
+    _sensor_stop.set()
     if _sensor_thread and _sensor_thread.is_alive():
         _sensor_thread.join(timeout=3.0)
     _sensor_thread = None
@@ -7,6 +7,13 @@ import os
 import sys
 import json
 
+# Faster JSON when available; falls back to the stdlib
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Windows-only imports
 IS_WINDOWS = sys.platform == "win32"
 if IS_WINDOWS:
@@ -17,6 +24,7 @@ from security import escape_registry_path
 
 APP_NAME = "ThermalEngine"
 SETTINGS_FILE = get_resource_path("settings.json")
+RUN_KEY_PATH = r"Software\Microsoft\Windows\CurrentVersion\Run"
 
 # Default settings
 DEFAULT_SETTINGS = {
@@ -31,16 +39,35 @@ DEFAULT_SETTINGS = {
 }
 
 _settings = None
+_last_written = None  # Bytes last written to SETTINGS_FILE
+_settings_mtime = None  # mtime of SETTINGS_FILE when _settings last matched it
+# Last known Run-key command for the app ("" when not registered), None until queried
+_autostart_command = None
 
 
 def load_settings():
-    """Load settings from file, creating defaults if needed."""
-    global _settings
+    """Load settings from file, falling back to defaults if it doesn't exist.
+
+    The file is only re-parsed when its mtime changed since it was last read
+    or written. A missing file is not created here; the first setting change
+    writes it, so a first launch doesn't block on a disk write.
+    """
+    global _settings, _last_written, _settings_mtime
+
+    try:
+        mtime = os.stat(SETTINGS_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
 
-    if os.path.exists(SETTINGS_FILE):
+    if mtime is not None:
+        if _settings is not None and mtime == _settings_mtime:
+            return _settings
         try:
-            with open(SETTINGS_FILE, 'r') as f:
-                _settings = json.load(f)
+            with open(SETTINGS_FILE, 'rb') as f:
+                raw = f.read()
+            _settings = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+            _last_written = raw
+            _settings_mtime = mtime
             # Ensure all default keys exist
             for key, value in DEFAULT_SETTINGS.items():
                 if key not in _settings:
@@ -48,22 +75,36 @@ def load_settings():
         except Exception as e:
             print(f"[Settings] Error loading settings: {e}")
             _settings = DEFAULT_SETTINGS.copy()
-    else:
+    elif _settings is None:
         _settings = DEFAULT_SETTINGS.copy()
-        save_settings()  # Create the file with defaults
 
     return _settings
 
 
 def save_settings():
-    """Save current settings to file."""
-    global _settings
+    """Save current settings to file.
+
+    Skips the write when nothing changed since the last save, and writes to a
+    temporary file first so an interrupted save can't truncate settings.json.
+    """
+    global _settings, _last_written, _settings_mtime
     if _settings is None:
         _settings = DEFAULT_SETTINGS.copy()
 
     try:
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(_settings, f, indent=2)
+        if HAS_ORJSON:
+            payload = orjson.dumps(_settings, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(_settings, indent=2).encode('utf-8')
+        if payload == _last_written:
+            return
+
+        tmp_path = SETTINGS_FILE + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, SETTINGS_FILE)
+        _last_written = payload
+        _settings_mtime = os.stat(SETTINGS_FILE).st_mtime_ns
     except Exception as e:
         print(f"[Settings] Error saving settings: {e}")
 
@@ -77,11 +118,22 @@ def get_setting(key, default=None):
 
 
 def set_setting(key, value):
-    """Set a setting value and save."""
+    """Set a setting value and save. Does nothing if the value is unchanged."""
+    set_settings({key: value})
+
+
+def set_settings(values):
+    """Set several setting values and save once, only if any of them changed."""
     global _settings
     if _settings is None:
         load_settings()
-    _settings[key] = value
+    changed = {
+        key: value for key, value in values.items()
+        if key not in _settings or _settings[key] != value
+    }
+    if not changed:
+        return
+    _settings.update(changed)
     save_settings()
 
 
@@ -100,61 +152,83 @@ def get_executable_path():
         return f'{escape_registry_path(python_exe)} {escape_registry_path(script_path)}'
 
 
+def _build_autostart_command():
+    """Build the command to register for autostart from the current settings."""
+    exe_path = get_executable_path()
+    # Add --minimized flag if launch_minimized is enabled
+    if get_setting("launch_minimized", True):
+        exe_path += " --minimized"
+    return exe_path
+
+
 def set_autostart(enabled):
     """Enable or disable autostart. Windows-only via registry."""
+    global _autostart_command
     if not IS_WINDOWS:
         print("[Settings] Autostart is only supported on Windows")
         return False
 
-    key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
-
     try:
-        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_SET_VALUE)
-
-        if enabled:
-            exe_path = get_executable_path()
-            # Add --minimized flag if launch_minimized is enabled
-            if get_setting("launch_minimized", True):
-                exe_path += " --minimized"
-            winreg.SetValueEx(key, APP_NAME, 0, winreg.REG_SZ, exe_path)
-        else:
-            try:
-                winreg.DeleteValue(key, APP_NAME)
-            except FileNotFoundError:
-                pass  # Already doesn't exist
-
-        winreg.CloseKey(key)
+        # The context manager closes the key even if the write fails
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, RUN_KEY_PATH, 0, winreg.KEY_SET_VALUE) as key:
+            if enabled:
+                exe_path = _build_autostart_command()
+                winreg.SetValueEx(key, APP_NAME, 0, winreg.REG_SZ, exe_path)
+            else:
+                exe_path = ""
+                try:
+                    winreg.DeleteValue(key, APP_NAME)
+                except FileNotFoundError:
+                    pass  # Already doesn't exist
+
+        _autostart_command = exe_path
         return True
     except Exception as e:
         print(f"[Settings] Error setting autostart: {e}")
+        _autostart_command = None
         return False
 
 
-def is_autostart_enabled():
-    """Check if autostart is currently enabled. Windows-only via registry."""
-    if not IS_WINDOWS:
-        return False
+def get_autostart_command():
+    """Get the app's autostart command from the registry ("" if not set).
 
-    key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
+    The registry is only queried the first time; after that the value
+    recorded by set_autostart() is returned until invalidate_autostart_cache().
+    """
+    global _autostart_command
+    if not IS_WINDOWS:
+        return ""
+    if _autostart_command is not None:
+        return _autostart_command
 
     try:
-        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_READ)
-        try:
-            winreg.QueryValueEx(key, APP_NAME)
-            winreg.CloseKey(key)
-            return True
-        except FileNotFoundError:
-            winreg.CloseKey(key)
-            return False
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, RUN_KEY_PATH, 0, winreg.KEY_READ) as key:
+            try:
+                _autostart_command = winreg.QueryValueEx(key, APP_NAME)[0]
+            except FileNotFoundError:
+                _autostart_command = ""
     except Exception:
-        return False
+        return ""
+    return _autostart_command
+
+
+def invalidate_autostart_cache():
+    """Force the next autostart check to re-read the registry."""
+    global _autostart_command
+    _autostart_command = None
 
 
 def apply_autostart_setting():
-    """Apply the current autostart setting to the registry. Windows-only."""
+    """Apply the current autostart setting to the registry. Windows-only.
+
+    Skips the registry write when the registered command already matches.
+    """
     if not IS_WINDOWS:
         return
     enabled = get_setting("launch_at_login", True)
+    desired = _build_autostart_command() if enabled else ""
+    if get_autostart_command() == desired:
+        return
     set_autostart(enabled)
 
 
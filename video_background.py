@@ -7,8 +7,12 @@ Pre-buffers all frames in memory for smooth playback.
 """
 
 import os
+import json
+import hashlib
 import time
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 
 try:
@@ -20,7 +24,23 @@ except ImportError:
     cv2 = None
     np = None
 
+# OpenCV 4.11+ can decode JPEGs straight to RGB, skipping a conversion pass
+IMREAD_COLOR_RGB = getattr(cv2, 'IMREAD_COLOR_RGB', None) if HAS_CV2 else None
+
+# NVDEC decoding needs an OpenCV build with the CUDA video codec module
+try:
+    HAS_CUDA_DECODE = (
+        HAS_CV2 and hasattr(cv2, 'cudacodec')
+        and cv2.cuda.getCudaEnabledDeviceCount() > 0
+    )
+except Exception:
+    HAS_CUDA_DECODE = False
+
 from constants import DISPLAY_WIDTH, DISPLAY_HEIGHT
+from app_path import get_resource_path
+
+# Buffered frames are cached here so reopening a video skips the decode
+FRAME_CACHE_DIR = get_resource_path("video_cache")
 
 
 class VideoBackground:
@@ -29,10 +49,31 @@ class VideoBackground:
     FIT_HEIGHT = "fit_height"
     FIT_WIDTH = "fit_width"
 
+    # How buffered frames are kept in memory
+    STORAGE_RGB = "rgb"    # Raw RGB arrays, no decode cost
+    STORAGE_JPEG = "jpeg"  # JPEG bytes, roughly a tenth of the memory
+    JPEG_QUALITY = 90
+
+    # Memory allowed for QPixmaps kept across playback loops
+    PIXMAP_CACHE_BUDGET = 64 * 1024 * 1024
+
+    # Minimum seconds between load progress updates
+    PROGRESS_INTERVAL = 0.05
+
+    # Number of buffered videos kept in FRAME_CACHE_DIR
+    FRAME_CACHE_MAX_ENTRIES = 8
+    # Part of every cache key; bump whenever the way frames are produced
+    # (_prepare_frame, _area_plan, _letterbox_transform) changes
+    FRAME_CACHE_VERSION = 2
+    # Seconds before a cache file without metadata counts as abandoned rather
+    # than still being written
+    FRAME_CACHE_STALE_AGE = 600
+
     def __init__(self):
         self.video_path = ""
         self.fit_mode = self.FIT_HEIGHT
         self.enabled = False
+        self.storage_mode = self.STORAGE_JPEG
 
         # Video metadata
         self._frame_count = 0
@@ -40,24 +81,49 @@ class VideoBackground:
         self._video_width = 0
         self._video_height = 0
 
-        # Frame buffer - stores pre-scaled numpy arrays (RGB)
-        # Limited to prevent excessive memory usage
+        # Frame buffer - stores pre-scaled frames as a list of JPEG bytes or
+        # one (N, H, W, 3) RGB array, per _buffer_storage. Limited to prevent
+        # excessive memory usage
         self._frame_buffer = []
+        self._buffer_storage = self.storage_mode
         self._buffer_ready = False
+        self._buffer_key = None  # _frame_cache_key of the buffered video
         self._loading = False
         self._load_progress = 0
         self._load_error = None
-        self._max_buffered_frames = 300  # ~10 seconds at 30fps, ~540MB max
+        self._max_buffered_frames = 300  # ~10 seconds at 30fps, ~550MB max as RGB
         self._frames_truncated = False
 
-        # Playback state
+        # Playback state - the index is advanced by a GUI-thread QTimer at the
+        # video's frame rate, so reading a frame never checks the clock
         self._current_frame_idx = 0
-        self._last_frame_time = 0
+        self._playback_timer = None
 
-        # Cached converted frames for current frame
+        # Cached converted frames for current frame, each (frames, idx, value)
+        # so a single reference swap publishes them to other threads
         self._cached_pil = None
         self._cached_pixmap = None
-        self._cached_frame_idx = -1
+
+        # Pixmaps by frame index for the current preview scale, filled until
+        # PIXMAP_CACHE_BUDGET is reached so later loops skip the upload
+        self._pixmap_cache = {}
+        self._pixmap_cache_scale = None
+        self._pixmap_cache_frames = None
+        self._pixmap_cache_bytes = 0
+
+        # Buffered frames pre-resized for the preview scale, built in the
+        # background whenever the scale changes. Kept as one RGB array in
+        # either storage mode, so JPEG frames aren't compressed a second time
+        # (about 140MB for 300 frames at the default 0.5 scale).
+        # Published as (source frames, scale, scaled frames)
+        self._scaled_buffer = None
+        self._scaling_scale = None
+        self._scale_thread = None
+        self._stop_scaling = False
+
+        # Last frame decoded from JPEG storage as (frames, idx, array), shared
+        # by the PIL and pixmap paths
+        self._decoded = None
 
         # Threading
         self._lock = threading.Lock()
@@ -85,15 +151,36 @@ class VideoBackground:
                 callback(0, True, "File not found")
             return False
 
+        try:
+            cache_key = self._frame_cache_key(path, self.storage_mode)
+        except OSError:
+            cache_key = None
+
+        # Nothing to do if this exact video is already buffered the same way
+        with self._lock:
+            already_loaded = (
+                cache_key is not None and self._buffer_ready
+                and cache_key == self._buffer_key
+            )
+        if already_loaded:
+            self.video_path = path
+            self.enabled = True
+            self._start_playback_timer()
+            if callback:
+                callback(1.0, True, None)
+            return True
+
         # Stop any existing load
         self._stop_loading = True
         if self._load_thread and self._load_thread.is_alive():
             self._load_thread.join(timeout=1.0)
+        self._stop_scaling_thread()
 
         # Reset state
         with self._lock:
             self._frame_buffer = []
             self._buffer_ready = False
+            self._buffer_key = None
             self._loading = True
             self._load_progress = 0
             self._load_error = None
@@ -101,23 +188,42 @@ class VideoBackground:
             self._current_frame_idx = 0
             self._cached_pil = None
             self._cached_pixmap = None
-            self._cached_frame_idx = -1
+            self._decoded = None
+            self._clear_pixmap_cache()
+            self._scaled_buffer = None
+            self._scaling_scale = None
 
         # Start loading in background thread
         self._load_thread = threading.Thread(
             target=self._load_video_thread,
-            args=(path, callback),
+            args=(path, cache_key, callback),
             daemon=True
         )
         self._load_thread.start()
+        self._start_playback_timer()
 
         self.video_path = path
         self.enabled = True
         return True
 
-    def _load_video_thread(self, path, callback):
+    def _load_video_thread(self, path, cache_key, callback):
         """Background thread to load and buffer video frames."""
         try:
+            storage = self.storage_mode
+
+            # Reuse frames buffered by an earlier run when nothing changed
+            cached = self._load_frame_cache(cache_key) if cache_key else None
+            if cached is not None:
+                frames, meta = cached
+                self._fps = meta["fps"]
+                self._video_width = meta["width"]
+                self._video_height = meta["height"]
+                self._frames_truncated = meta["truncated"]
+                self._publish_frames(frames, storage, cache_key)
+                if callback:
+                    callback(1.0, True, None)
+                return
+
             cap = cv2.VideoCapture(path)
             if not cap.isOpened():
                 with self._lock:
@@ -136,81 +242,392 @@ class VideoBackground:
             # Calculate target dimensions
             new_width, new_height, x_offset, y_offset = self._calculate_dimensions()
 
-            frames = []
+            # Scaling is planned once, from the first decoded frame: downscales
+            # use an INTER_AREA resize (warpAffine has no area averaging),
+            # everything else a single warpAffine pass
+            area_plan = None
+            transform = None
+            self._frames_truncated = False
+
+            # Decoding has to stay sequential, but warping and encoding release
+            # the GIL, so they run on a small pool. Results are collected in
+            # submission order, and the number of raw frames in flight is capped.
+            workers = min(4, os.cpu_count() or 1)
+            max_in_flight = workers * 2
+            pending = deque()
+
+            # RGB frames are written straight into one preallocated array,
+            # doubled if the container under-reports its length. JPEG frames
+            # vary in size and are kept as a list.
+            if storage == self.STORAGE_RGB:
+                # Some containers report 0 or even a negative frame count
+                capacity = max(0, min(self._frame_count, self._max_buffered_frames)) or 64
+                frames = np.empty((capacity, DISPLAY_HEIGHT, DISPLAY_WIDTH, 3), dtype=np.uint8)
+            else:
+                frames = []
             frame_idx = 0
+            last_progress_time = 0.0
+
+            # Decode on the GPU when available, falling back to VideoCapture
+            source = self._open_gpu_frames(path) if HAS_CUDA_DECODE else None
+            if source is None:
+                source = self._iter_cpu_frames(cap)
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for frame in source:
+                    if self._stop_loading:
+                        # Closing the generator drops the GPU reader, if any
+                        source.close()
+                        cap.release()
+                        return
+
+                    if area_plan is None and transform is None:
+                        if new_width < frame.shape[1]:
+                            area_plan = self._area_plan(new_width, new_height, x_offset, y_offset)
+                        else:
+                            transform = self._letterbox_transform(
+                                frame.shape[1], frame.shape[0],
+                                new_width, new_height, x_offset, y_offset
+                            )
+
+                    if storage == self.STORAGE_RGB and frame_idx == len(frames):
+                        # Let writes into the old array finish before replacing it
+                        while pending:
+                            pending.popleft().result()
+                        grown = np.empty((2 * len(frames),) + frames.shape[1:], dtype=np.uint8)
+                        grown[:frame_idx] = frames
+                        frames = grown
+
+                    dst = frames[frame_idx] if storage == self.STORAGE_RGB else None
+                    pending.append(pool.submit(self._prepare_frame, frame, transform, area_plan, storage, dst))
+                    if len(pending) >= max_in_flight:
+                        result = pending.popleft().result()
+                        if storage == self.STORAGE_JPEG:
+                            frames.append(result)
+                    frame_idx += 1
+
+                    # Limit frames to prevent excessive memory usage
+                    if frame_idx >= self._max_buffered_frames:
+                        self._frames_truncated = True
+                        print(f"[Video] Limiting to {self._max_buffered_frames} frames to save memory")
+                        break
+
+                    # Update progress, rate-limited so the lock and the
+                    # callback aren't hit for every frame
+                    now = time.monotonic()
+                    if now - last_progress_time < self.PROGRESS_INTERVAL:
+                        continue
+                    last_progress_time = now
+
+                    progress = frame_idx / max(1, min(self._frame_count, self._max_buffered_frames))
+                    with self._lock:
+                        self._load_progress = progress
+
+                    if callback:
+                        callback(progress, False, None)
+
+                for future in pending:
+                    result = future.result()
+                    if storage == self.STORAGE_JPEG:
+                        frames.append(result)
 
-            while True:
-                if self._stop_loading:
-                    cap.release()
-                    return
+            cap.release()
 
-                ret, frame = cap.read()
-                if not ret:
-                    break
+            if storage == self.STORAGE_RGB and frame_idx < len(frames):
+                # Release capacity the container promised but never delivered
+                frames = frames[:frame_idx].copy()
 
-                # Convert BGR to RGB
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            self._publish_frames(frames, storage, cache_key)
+            if callback:
+                callback(1.0, True, None)
 
-                # Resize frame to target size
-                frame_resized = cv2.resize(
-                    frame_rgb,
-                    (new_width, new_height),
-                    interpolation=cv2.INTER_LINEAR
-                )
+            if cache_key:
+                self._save_frame_cache(cache_key, frames, storage, {
+                    "fps": self._fps,
+                    "width": self._video_width,
+                    "height": self._video_height,
+                    "truncated": self._frames_truncated,
+                })
+
+        except Exception as e:
+            with self._lock:
+                self._loading = False
+                self._load_error = str(e)
+            if callback:
+                callback(0, True, str(e))
 
-                # Create output frame with black background
-                output = np.zeros((DISPLAY_HEIGHT, DISPLAY_WIDTH, 3), dtype=np.uint8)
+    def _publish_frames(self, frames, storage, key):
+        """Make a finished frame buffer, identified by `key`, current for playback."""
+        with self._lock:
+            self._frame_buffer = frames
+            self._buffer_key = key
+            self._buffer_storage = storage
+            self._frame_count = len(frames)
+            self._buffer_ready = True
+            self._loading = False
+            self._load_progress = 1.0
+
+    def _frame_cache_key(self, path, storage):
+        """Key identifying the buffer `path` would produce with the current settings."""
+        stat = os.stat(path)
+        identity = (
+            f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}|"
+            f"{DISPLAY_WIDTH}x{DISPLAY_HEIGHT}|{self.fit_mode}|{storage}|"
+            f"{self._max_buffered_frames}|{self.JPEG_QUALITY}|v{self.FRAME_CACHE_VERSION}"
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
 
-                # Calculate paste region (handle negative offsets for fit_width)
-                y_start = max(0, y_offset)
-                y_end = min(DISPLAY_HEIGHT, y_offset + new_height)
-                x_start = max(0, x_offset)
-                x_end = min(DISPLAY_WIDTH, x_offset + new_width)
+    def _load_frame_cache(self, key):
+        """
+        Load frames written by _save_frame_cache.
 
-                # Source region from resized frame
-                src_y_start = max(0, -y_offset)
-                src_y_end = src_y_start + (y_end - y_start)
-                src_x_start = max(0, -x_offset)
-                src_x_end = src_x_start + (x_end - x_start)
+        RGB frames are memory-mapped rather than read, so a cache hit costs
+        little more than opening the file.
 
-                output[y_start:y_end, x_start:x_end] = frame_resized[src_y_start:src_y_end, src_x_start:src_x_end]
+        Returns:
+            (frames, meta), or None if there is no usable cache entry
+        """
+        base = os.path.join(FRAME_CACHE_DIR, key)
+        try:
+            with open(base + ".json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            count = meta["frame_count"]
+            if meta["storage"] == self.STORAGE_JPEG:
+                offsets = meta["offsets"]
+                if len(offsets) != count + 1:
+                    return None
+                with open(base + ".bin", "rb") as f:
+                    data = f.read()
+                frames = [data[start:end] for start, end in zip(offsets, offsets[1:])]
+            else:
+                frames = np.memmap(
+                    base + ".bin", dtype=np.uint8, mode='r',
+                    shape=(count, DISPLAY_HEIGHT, DISPLAY_WIDTH, 3)
+                )
+            # Mark the entry as recently used so pruning keeps it
+            os.utime(base + ".json")
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
 
-                frames.append(output)
-                frame_idx += 1
+        if len(frames) == 0:
+            return None
+        print(f"[Video] Loaded {len(frames)} frames from cache")
+        return frames, meta
+
+    def _save_frame_cache(self, key, frames, storage, meta):
+        """Write a finished frame buffer to FRAME_CACHE_DIR for later runs."""
+        base = os.path.join(FRAME_CACHE_DIR, key)
+        # Unique temp names, as an abandoned loader may still be writing
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(FRAME_CACHE_DIR, exist_ok=True)
+
+            offsets = [0]
+            with open(base + ".bin" + suffix, "wb") as f:
+                for frame in frames:
+                    f.write(frame)
+                    offsets.append(f.tell())
+
+            meta = dict(meta, storage=storage, frame_count=len(frames))
+            if storage == self.STORAGE_JPEG:
+                meta["offsets"] = offsets
+            with open(base + ".json" + suffix, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+
+            # The metadata goes last; an entry without it is never read
+            os.replace(base + ".bin" + suffix, base + ".bin")
+            os.replace(base + ".json" + suffix, base + ".json")
+        except OSError as e:
+            print(f"[Video] Failed to cache frames: {e}")
+            for tmp in (base + ".bin" + suffix, base + ".json" + suffix):
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+            return
 
-                # Limit frames to prevent excessive memory usage
-                if frame_idx >= self._max_buffered_frames:
-                    self._frames_truncated = True
-                    print(f"[Video] Limiting to {self._max_buffered_frames} frames to save memory")
-                    break
+        self._prune_frame_cache()
 
-                # Update progress
-                progress = frame_idx / max(1, min(self._frame_count, self._max_buffered_frames))
-                with self._lock:
-                    self._load_progress = progress
+    def _prune_frame_cache(self):
+        """
+        Delete all but the FRAME_CACHE_MAX_ENTRIES most recently used cache
+        entries, plus data and temp files left without metadata.
 
-                if callback:
-                    callback(progress, False, None)
+        A .bin that can't be removed yet (still memory-mapped on Windows) or
+        a .tmp from a killed loader is picked up again on later prunes.
+        """
+        try:
+            files = list(os.scandir(FRAME_CACHE_DIR))
+            entries = [e for e in files if e.name.endswith(".json")]
+            entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        except OSError:
+            return
 
-            cap.release()
+        for entry in entries[self.FRAME_CACHE_MAX_ENTRIES:]:
+            base = entry.path[:-len(".json")]
+            # Metadata first, so a half-deleted entry is never read back
+            for path in (entry.path, base + ".bin"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+        kept = {e.name[:-len(".json")] for e in entries[:self.FRAME_CACHE_MAX_ENTRIES]}
+        cutoff = time.time() - self.FRAME_CACHE_STALE_AGE
+        for entry in files:
+            name = entry.name
+            if name.endswith(".json") or (name.endswith(".bin") and name[:-len(".bin")] in kept):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _iter_cpu_frames(cap):
+        """Yield decoded BGR frames from a cv2.VideoCapture."""
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                return
+            yield frame
 
-            # Store buffered frames
-            with self._lock:
-                self._frame_buffer = frames
-                self._frame_count = len(frames)
-                self._buffer_ready = True
-                self._loading = False
-                self._load_progress = 1.0
+    def _open_gpu_frames(self, path):
+        """
+        Start decoding `path` on the GPU (NVDEC).
 
-            if callback:
-                callback(1.0, True, None)
+        The first frame is decoded here, as cudacodec often only fails on it
+        for codecs or chroma formats NVDEC can't handle.
 
+        Returns:
+            Generator of decoded BGR frames, or None to fall back to the CPU
+        """
+        try:
+            reader = cv2.cudacodec.createVideoReader(path)
+            first = self._next_gpu_frame(reader)
         except Exception as e:
-            with self._lock:
-                self._loading = False
-                self._load_error = str(e)
-            if callback:
-                callback(0, True, str(e))
+            print(f"[Video] GPU decode unavailable, using CPU: {e}")
+            return None
+        if first is None:
+            return None
+        return self._iter_gpu_frames(reader, first)
+
+    @classmethod
+    def _iter_gpu_frames(cls, reader, first):
+        """Yield `first`, then the remaining decoded BGR frames from a cudacodec reader."""
+        frame = first
+        while frame is not None:
+            yield frame
+            frame = cls._next_gpu_frame(reader)
+
+    @staticmethod
+    def _next_gpu_frame(reader):
+        """Decode the next BGR frame from a cudacodec reader, or None at the end."""
+        ret, gpu_frame = reader.nextFrame()
+        if not ret:
+            return None
+        # cudacodec hands back BGRA by default
+        if gpu_frame.channels() == 4:
+            gpu_frame = cv2.cuda.cvtColor(gpu_frame, cv2.COLOR_BGRA2BGR)
+        return gpu_frame.download()
+
+    def _prepare_frame(self, frame, transform, area_plan, storage, dst=None):
+        """Scale, letterbox and convert one decoded BGR frame for the buffer.
+
+        Uses `transform` when given, otherwise an INTER_AREA resize laid out
+        by `area_plan`. RGB frames are written into `dst` when given. Runs on
+        a loader pool thread.
+        """
+        if transform is None:
+            canvas = self._area_letterbox(frame, area_plan, dst)
+        else:
+            # Resize and letterbox in one pass
+            canvas = cv2.warpAffine(
+                frame,
+                transform,
+                (DISPLAY_WIDTH, DISPLAY_HEIGHT),
+                dst=dst,
+                flags=cv2.INTER_LINEAR,
+                borderMode=cv2.BORDER_CONSTANT,
+                borderValue=(0, 0, 0)
+            )
+
+        if storage == self.STORAGE_JPEG:
+            ok, encoded = cv2.imencode('.jpg', canvas, [cv2.IMWRITE_JPEG_QUALITY, self.JPEG_QUALITY])
+            if not ok:
+                raise RuntimeError("Failed to encode video frame")
+            return encoded.tobytes()
+
+        return cv2.cvtColor(canvas, cv2.COLOR_BGR2RGB, dst=canvas)
+
+    @staticmethod
+    def _area_plan(new_width, new_height, x_offset, y_offset):
+        """
+        Work out where a new_width x new_height frame lands on the display
+        canvas at (x_offset, y_offset). Negative offsets crop the scaled frame,
+        as the affine path does.
+
+        Returns:
+            (size, paste, crop, strips): the resize target size, the canvas
+            region the frame is pasted into, the region of the scaled frame
+            to keep (None when all of it fits), and the canvas regions left
+            black
+        """
+        src_x, src_y = max(0, -x_offset), max(0, -y_offset)
+        dst_x, dst_y = max(0, x_offset), max(0, y_offset)
+        width = min(new_width - src_x, DISPLAY_WIDTH - dst_x)
+        height = min(new_height - src_y, DISPLAY_HEIGHT - dst_y)
+
+        rows = slice(dst_y, dst_y + height)
+        paste = (rows, slice(dst_x, dst_x + width))
+        crop = None
+        if (src_x, src_y, width, height) != (0, 0, new_width, new_height):
+            crop = (slice(src_y, src_y + height), slice(src_x, src_x + width))
+
+        strips = [
+            region for region, extent in (
+                ((slice(0, dst_y),), dst_y),
+                ((slice(dst_y + height, DISPLAY_HEIGHT),), DISPLAY_HEIGHT - dst_y - height),
+                ((rows, slice(0, dst_x)), dst_x),
+                ((rows, slice(dst_x + width, DISPLAY_WIDTH)), DISPLAY_WIDTH - dst_x - width),
+            ) if extent > 0
+        ]
+        return (new_width, new_height), paste, crop, strips
+
+    @staticmethod
+    def _area_letterbox(frame, area_plan, dst=None):
+        """
+        Downscale `frame` with INTER_AREA onto a display-sized canvas laid out
+        by `area_plan` (see _area_plan). Only the letterbox strips are zeroed.
+        """
+        size, paste, crop, strips = area_plan
+        canvas = dst if dst is not None else np.empty((DISPLAY_HEIGHT, DISPLAY_WIDTH, 3), dtype=np.uint8)
+        for region in strips:
+            canvas[region] = 0
+
+        if crop is None:
+            # Resize straight into the canvas view, no intermediate copy
+            cv2.resize(frame, size, dst=canvas[paste], interpolation=cv2.INTER_AREA)
+        else:
+            canvas[paste] = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)[crop]
+        return canvas
+
+    @staticmethod
+    def _letterbox_transform(src_width, src_height, new_width, new_height, x_offset, y_offset):
+        """
+        Affine matrix that scales a src_width x src_height frame to
+        new_width x new_height and moves it to (x_offset, y_offset).
+
+        Pixel centers are aligned the same way cv2.resize aligns them, so the
+        result matches a resize followed by a paste.
+        """
+        sx = new_width / src_width
+        sy = new_height / src_height
+        return np.array([
+            [sx, 0, x_offset + 0.5 * sx - 0.5],
+            [0, sy, y_offset + 0.5 * sy - 0.5],
+        ], dtype=np.float32)
 
     def _calculate_dimensions(self):
         """Calculate the scaled dimensions based on fit mode."""
@@ -241,15 +658,23 @@ class VideoBackground:
         self._stop_loading = True
         if self._load_thread and self._load_thread.is_alive():
             self._load_thread.join(timeout=1.0)
+        self._stop_scaling_thread()
 
         with self._lock:
             self._frame_buffer = []
             self._buffer_ready = False
+            self._buffer_key = None
             self._loading = False
             self._current_frame_idx = 0
             self._cached_pil = None
             self._cached_pixmap = None
-            self._cached_frame_idx = -1
+            self._decoded = None
+            self._clear_pixmap_cache()
+            self._scaled_buffer = None
+            self._scaling_scale = None
+
+        if self._playback_timer is not None:
+            self._playback_timer.stop()
 
         self.video_path = ""
         self.enabled = False
@@ -264,102 +689,234 @@ class VideoBackground:
             if self.video_path and self._buffer_ready:
                 self.load_video(self.video_path)
 
-    def reset_timing(self):
-        """Reset playback timing after system wake or other timing disruption."""
-        with self._lock:
-            self._last_frame_time = time.time()
-            # Don't reset frame index - continue from where we were
-            # Invalidate caches
-            self._cached_pil = None
-            self._cached_pixmap = None
-            self._cached_frame_idx = -1
+    def set_storage_mode(self, mode):
+        """Set how buffered frames are stored and reload if needed."""
+        if mode in [self.STORAGE_RGB, self.STORAGE_JPEG] and mode != self.storage_mode:
+            self.storage_mode = mode
 
-    def _advance_frame(self):
-        """Advance to next frame based on elapsed time."""
-        if not self._buffer_ready or self._frame_count == 0:
-            return
+            # Reload video with new storage mode if we have a video loaded
+            if self.video_path and self._buffer_ready:
+                self.load_video(self.video_path)
 
-        current_time = time.time()
-        frame_duration = 1.0 / self._fps
+    def _frame_interval_ms(self):
+        """Playback timer interval for the current video's frame rate."""
+        return max(1, round(1000 / self._fps))
 
-        if current_time - self._last_frame_time >= frame_duration:
+    def _start_playback_timer(self):
+        """Start advancing frames at the video's frame rate. Call from the GUI thread."""
+        from PySide6.QtCore import QTimer, Qt
+
+        if self._playback_timer is None:
+            self._playback_timer = QTimer()
+            self._playback_timer.setTimerType(Qt.TimerType.PreciseTimer)
+            self._playback_timer.timeout.connect(self._advance_frame)
+        self._playback_timer.setInterval(self._frame_interval_ms())
+        self._playback_timer.start()
+
+    def _advance_frame(self):
+        """Advance to the next frame. Runs on the playback timer."""
+        with self._lock:
+            if not self._buffer_ready or self._frame_count == 0:
+                return
             self._current_frame_idx = (self._current_frame_idx + 1) % self._frame_count
-            self._last_frame_time = current_time
 
-    def get_frame_pil(self):
-        """Get the current frame as a PIL Image."""
-        if not self.enabled:
-            return None
+        # The frame rate is only known once the new video has opened
+        interval = self._frame_interval_ms()
+        if self._playback_timer.interval() != interval:
+            self._playback_timer.setInterval(interval)
+
+    def _get_frame_array(self, frames, storage, idx):
+        """Get frame `idx` of `frames` as an RGB array, decoding it if stored as JPEG."""
+        frame = frames[idx]
+        if storage != self.STORAGE_JPEG:
+            return frame
+
+        decoded = self._decoded
+        if decoded is not None and decoded[0] is frames and decoded[1] == idx:
+            return decoded[2]
+
+        rgb = self._decode_jpeg(frame)
+        self._decoded = (frames, idx, rgb)
+        return rgb
+
+    @staticmethod
+    def _decode_jpeg(frame):
+        """Decode a JPEG-stored frame to an RGB array."""
+        data = np.frombuffer(frame, dtype=np.uint8)
+        if IMREAD_COLOR_RGB is not None:
+            return cv2.imdecode(data, IMREAD_COLOR_RGB)
+        # Swap channels in place rather than allocating a second frame
+        rgb = cv2.imdecode(data, cv2.IMREAD_COLOR)
+        return cv2.cvtColor(rgb, cv2.COLOR_BGR2RGB, dst=rgb)
+
+    def _current_frame(self):
+        """
+        Snapshot what the current frame needs.
+
+        Only this step takes the lock; decoding and conversion happen on the
+        snapshot afterwards, so the loader thread never waits on them.
 
+        Returns:
+            (frames, storage, idx), or None if no frames are buffered
+        """
         with self._lock:
-            if not self._buffer_ready or not self._frame_buffer:
+            if not self._buffer_ready or len(self._frame_buffer) == 0:
                 return None
+            return self._frame_buffer, self._buffer_storage, self._current_frame_idx
 
-            self._advance_frame()
-
-            # Return cached if same frame
-            if self._cached_frame_idx == self._current_frame_idx and self._cached_pil is not None:
-                return self._cached_pil
+    def get_frame_pil(self):
+        """Get the current frame as a PIL Image."""
+        if not self.enabled:
+            return None
 
-            # Convert numpy array to PIL
-            frame = self._frame_buffer[self._current_frame_idx]
-            pil_image = Image.fromarray(frame)
+        current = self._current_frame()
+        if current is None:
+            return None
+        frames, storage, idx = current
 
-            self._cached_pil = pil_image
-            self._cached_frame_idx = self._current_frame_idx
-            self._cached_pixmap = None  # Invalidate pixmap cache
+        # Return cached if same frame
+        cached = self._cached_pil
+        if cached is not None and cached[0] is frames and cached[1] == idx:
+            return cached[2]
 
-            return pil_image
+        # Convert numpy array to PIL
+        pil_image = Image.fromarray(self._get_frame_array(frames, storage, idx))
+        self._cached_pil = (frames, idx, pil_image)
+        return pil_image
 
     def get_frame_qpixmap(self, scale=1.0):
         """Get the current frame as a QPixmap for Qt rendering."""
-        from PySide6.QtGui import QPixmap, QImage
-
         if not self.enabled:
             return None
 
-        with self._lock:
-            if not self._buffer_ready or not self._frame_buffer:
-                # Show loading indicator
-                if self._loading:
-                    return self._create_loading_pixmap(scale)
-                return None
+        current = self._current_frame()
+        if current is None:
+            # Show loading indicator
+            if self._loading:
+                return self._create_loading_pixmap(scale)
+            return None
+        frames, storage, idx = current
 
-            self._advance_frame()
+        # The pixmap caches are only touched from the GUI thread
+        if scale != self._pixmap_cache_scale or frames is not self._pixmap_cache_frames:
+            self._clear_pixmap_cache()
+            self._pixmap_cache_scale = scale
+            self._pixmap_cache_frames = frames
+            self._cached_pixmap = None
 
-            # Return cached if same frame and same scale
-            if (self._cached_frame_idx == self._current_frame_idx and
-                self._cached_pixmap is not None):
-                return self._cached_pixmap
+        pixmap = self._pixmap_cache.get(idx)
+        if pixmap is not None:
+            return pixmap
 
-            # Get frame data
-            frame = self._frame_buffer[self._current_frame_idx]
+        # Return cached if same frame and same scale
+        cached = self._cached_pixmap
+        if cached is not None and cached[0] is frames and cached[1] == idx:
+            return cached[2]
 
-            # Scale if needed
-            if scale != 1.0:
-                scaled_width = int(DISPLAY_WIDTH * scale)
-                scaled_height = int(DISPLAY_HEIGHT * scale)
-                frame = cv2.resize(frame, (scaled_width, scaled_height), interpolation=cv2.INTER_LINEAR)
+        if scale == 1.0:
+            pixmap = self._frame_to_pixmap(frames[idx])
+        else:
+            if self._scaling_scale != scale:
+                self._start_scaling(frames, storage, scale)
+
+            scaled = self._scaled_buffer
+            if scaled is not None and scaled[0] is frames and scaled[1] == scale:
+                pixmap = self._frame_to_pixmap(scaled[2][idx])
+            else:
+                # Pre-scaled frames aren't ready yet; resize this one now
+                frame = cv2.resize(
+                    self._get_frame_array(frames, storage, idx),
+                    (int(DISPLAY_WIDTH * scale), int(DISPLAY_HEIGHT * scale)),
+                    interpolation=cv2.INTER_LINEAR
+                )
+                pixmap = self._frame_to_pixmap(frame)
 
-            height, width, channels = frame.shape
-            bytes_per_line = channels * width
+        # Playback cycles through every frame, so an evicting cache smaller
+        # than the loop would never hit; keep the first frames that fit instead
+        size = pixmap.width() * pixmap.height() * 4
+        if self._pixmap_cache_bytes + size <= self.PIXMAP_CACHE_BUDGET:
+            self._pixmap_cache[idx] = pixmap
+            self._pixmap_cache_bytes += size
 
-            # Convert to QImage then QPixmap
-            qimage = QImage(
-                frame.data,
-                width,
-                height,
-                bytes_per_line,
-                QImage.Format.Format_RGB888
-            )
-            pixmap = QPixmap.fromImage(qimage)
+        self._cached_pixmap = (frames, idx, pixmap)
+        return pixmap
 
-            self._cached_pixmap = pixmap
-            self._cached_frame_idx = self._current_frame_idx
-            self._cached_pil = None  # Invalidate PIL cache
+    def _frame_to_pixmap(self, frame):
+        """Convert a buffered frame (JPEG bytes or RGB array) to a QPixmap."""
+        from PySide6.QtGui import QPixmap, QImage
 
+        if isinstance(frame, bytes):
+            # Let Qt decode the JPEG straight into the pixmap, skipping the
+            # intermediate RGB array and QImage
+            pixmap = QPixmap()
+            pixmap.loadFromData(frame, "JPG")
             return pixmap
 
+        height, width, channels = frame.shape
+        bytes_per_line = channels * width
+
+        # Convert to QImage then QPixmap (the QImage wraps the array
+        # without copying; fromImage makes the one copy)
+        qimage = QImage(
+            frame.data,
+            width,
+            height,
+            bytes_per_line,
+            QImage.Format.Format_RGB888
+        )
+        return QPixmap.fromImage(qimage)
+
+    def _start_scaling(self, frames, storage, scale):
+        """Start pre-resizing `frames` for `scale`, replacing any scaling in progress."""
+        self._stop_scaling_thread()
+
+        with self._lock:
+            if self._frame_buffer is not frames:
+                return
+            self._scaling_scale = scale
+            self._scaled_buffer = None
+            self._stop_scaling = False
+
+        self._scale_thread = threading.Thread(
+            target=self._scale_frames_thread,
+            args=(frames, storage, scale),
+            daemon=True
+        )
+        self._scale_thread.start()
+
+    def _stop_scaling_thread(self):
+        """Stop the pre-scaling thread, if one is running."""
+        self._stop_scaling = True
+        if self._scale_thread and self._scale_thread.is_alive():
+            self._scale_thread.join(timeout=1.0)
+
+    def _scale_frames_thread(self, source, storage, scale):
+        """Background thread that resizes `source` frames to RGB for the preview scale."""
+        size = (int(DISPLAY_WIDTH * scale), int(DISPLAY_HEIGHT * scale))
+        interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+        scaled = np.empty((len(source), size[1], size[0], 3), dtype=np.uint8)
+        try:
+            for idx, frame in enumerate(source):
+                # Give up if stopped, or the video or scale changed meanwhile
+                if (self._stop_scaling or self._frame_buffer is not source
+                        or self._scaling_scale != scale):
+                    return
+                if storage == self.STORAGE_JPEG:
+                    frame = self._decode_jpeg(frame)
+                cv2.resize(frame, size, dst=scaled[idx], interpolation=interpolation)
+        except Exception as e:
+            print(f"[Video] Failed to pre-scale frames: {e}")
+            return
+
+        with self._lock:
+            if self._frame_buffer is source and self._scaling_scale == scale:
+                self._scaled_buffer = (source, scale, scaled)
+
+    def _clear_pixmap_cache(self):
+        """Drop all cached pixmaps."""
+        self._pixmap_cache = {}
+        self._pixmap_cache_bytes = 0
+
     def _create_loading_pixmap(self, scale):
         """Create a loading indicator pixmap."""
         from PySide6.QtGui import QPixmap, QPainter, QColor, QFont
@@ -418,8 +975,10 @@ class VideoBackground:
     @property
     def memory_usage_mb(self):
         """Estimate memory usage in MB."""
-        if not self._frame_buffer:
+        if len(self._frame_buffer) == 0:
             return 0
+        if self._buffer_storage == self.STORAGE_JPEG:
+            return sum(len(frame) for frame in self._frame_buffer) / (1024 * 1024)
         # Each frame is DISPLAY_WIDTH x DISPLAY_HEIGHT x 3 bytes
         frame_size = DISPLAY_WIDTH * DISPLAY_HEIGHT * 3
         return (len(self._frame_buffer) * frame_size) / (1024 * 1024)
@@ -429,12 +988,17 @@ class VideoBackground:
         return {
             "video_path": self.video_path,
             "fit_mode": self.fit_mode,
+            "storage_mode": self.storage_mode,
             "enabled": self.enabled
         }
 
     def from_dict(self, data):
         """Load video background settings from dict."""
         self.fit_mode = data.get("fit_mode", self.FIT_HEIGHT)
+        storage_mode = data.get("storage_mode", self.STORAGE_JPEG)
+        if storage_mode not in [self.STORAGE_RGB, self.STORAGE_JPEG]:
+            storage_mode = self.STORAGE_JPEG
+        self.storage_mode = storage_mode
         path = data.get("video_path", "")
         if path and data.get("enabled", False):
             self.load_video(path)